@@ -26,7 +26,6 @@ setup(name='stk',
           'seaborn',
           'numpy',
           'setuptools',
-          'pywindowx',
           'numpydoc',
        ],
       python_requires='>=3.6')
@@ -3,3 +3,6 @@ from .energy import *
 from .optimization import *
 from .ea import *
 from .compound import *
+from .result_stores import *
+from .calculator_cache import *
+from .subprocess_engine import *
@@ -38,6 +38,212 @@ of the class.
 
 """
 
+import logging
+import hashlib
+import marshal
+import pickle
+import numpy as np
+
+from .calculator_cache import CalculatorCache
+
+logger = logging.getLogger(__name__)
+
+# Returned by _get_cached_value() if a molecule is not cached.
+_MISSING = object()
+
+
+class _UnkeyableParameterError(Exception):
+    ...
+
+
+def _get_digest(data):
+    """
+    Return a hexadecimal, 128-bit digest of `data`.
+
+    Parameters
+    ----------
+    data : :class:`bytes`
+        The data to digest.
+
+    Returns
+    -------
+    :class:`str`
+        The digest.
+
+    """
+
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _get_coordinates_key(position_matrix, decimals=None):
+    """
+    Return a key for a position matrix.
+
+    Parameters
+    ----------
+    position_matrix : :class:`numpy.ndarray`
+        A position matrix.
+
+    decimals : :class:`int`, optional
+        The number of decimals the coordinates are rounded to before
+        they are digested. If ``None``, they are not rounded.
+
+    Returns
+    -------
+    :class:`str`
+        A digest of the coordinates in `position_matrix`.
+
+    """
+
+    position_matrix = np.ascontiguousarray(
+        position_matrix,
+        dtype=np.float64
+    )
+    if decimals is not None:
+        # Adding 0 turns -0 into 0, so they have the same bytes.
+        position_matrix = np.round(position_matrix, decimals) + 0.
+    return _get_digest(position_matrix.tobytes())
+
+
+def _get_parameter_repr(value):
+    """
+    Return a :class:`str` which is the same for equal parameters.
+
+    Unlike :func:`repr`, the returned :class:`str` is the same in
+    different processes.
+
+    Parameters
+    ----------
+    value : :class:`object`
+        The value of a calculator parameter.
+
+    Returns
+    -------
+    :class:`str`
+        The :class:`str` representing `value`.
+
+    Raises
+    ------
+    :class:`_UnkeyableParameterError`
+        If `value` cannot be represented in the same way across
+        processes.
+
+    """
+
+    if isinstance(value, Calculator):
+        return _get_calculator_repr(value)
+
+    if hasattr(value, 'get_identity_digest'):
+        coordinates = _get_coordinates_key(value.get_position_matrix())
+        return (
+            f'{value.__class__.__name__}('
+            f'{value.get_identity_digest()}, {coordinates})'
+        )
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_get_parameter_repr(item) for item in value]
+        if isinstance(value, (set, frozenset)):
+            items.sort()
+        return f'{value.__class__.__name__}([{", ".join(items)}])'
+
+    if isinstance(value, dict):
+        items = sorted(
+            f'{_get_parameter_repr(k)}: {_get_parameter_repr(v)}'
+            for k, v in value.items()
+        )
+        return f'{{{", ".join(items)}}}'
+
+    if isinstance(value, np.ndarray):
+        return f'ndarray({_get_digest(value.tobytes())})'
+
+    code = getattr(value, '__code__', None)
+    if code is not None:
+        closure = tuple(
+            cell.cell_contents for cell in value.__closure__ or ()
+        )
+        return (
+            f'{value.__module__}.{value.__qualname__}('
+            f'{_get_digest(marshal.dumps(code))}, '
+            f'{_get_parameter_repr(value.__defaults__)}, '
+            f'{_get_parameter_repr(closure)})'
+        )
+
+    value_repr = repr(value)
+    if ' at 0x' in value_repr:
+        raise _UnkeyableParameterError(value_repr)
+    return value_repr
+
+
+def _get_calculator_repr(calculator):
+    """
+    Return a :class:`str` which is the same for equal calculators.
+
+    Parameters
+    ----------
+    calculator : :class:`.Calculator`
+        The calculator.
+
+    Returns
+    -------
+    :class:`str`
+        The class and parameters of `calculator`.
+
+    Raises
+    ------
+    :class:`_UnkeyableParameterError`
+        If a parameter of `calculator` cannot be represented in the
+        same way across processes.
+
+    """
+
+    # Public attributes hold the results of the calculator, such as
+    # XTBEnergy.total_energies, so only private ones are parameters.
+    ignored = calculator._unkeyed_attributes
+    parameters = ', '.join(
+        f'{name}={_get_parameter_repr(value)}'
+        for name, value in sorted(vars(calculator).items())
+        if name.startswith('_') and name not in ignored
+    )
+    cls = calculator.__class__
+    return f'{cls.__module__}.{cls.__qualname__}({parameters})'
+
+
+def _get_result_store_key(calculator, mol):
+    """
+    Return the key of the result of `calculator` on `mol`.
+
+    Parameters
+    ----------
+    calculator : :class:`.MoleculeCalculator`
+        The calculator.
+
+    mol : :class:`.Molecule`
+        The molecule.
+
+    Returns
+    -------
+    :class:`tuple` of :class:`str`
+        The key, or ``None`` if `calculator` has a parameter
+        which cannot be represented in the same way across
+        processes.
+
+    """
+
+    try:
+        calculator_repr = _get_calculator_repr(calculator)
+    except _UnkeyableParameterError as error:
+        logger.debug(
+            f'{calculator.__class__.__name__} does not use its '
+            f'result store, because of the parameter {error}.'
+        )
+        return None
+
+    return (
+        _get_digest(calculator_repr.encode()),
+        mol.get_identity_digest(),
+        _get_coordinates_key(mol.get_position_matrix()),
+    )
+
 
 class Calculator:
     """
@@ -45,6 +251,16 @@ class Calculator:
 
     """
 
+    # The private attributes which do not affect the results of the
+    # calculator, and so are not part of the key used for its result
+    # store. Subclasses with more such attributes extend this.
+    _unkeyed_attributes = frozenset({
+        '_cache',
+        '_use_cache',
+        '_result_store',
+        '_geometry_decimals',
+    })
+
 
 class MoleculeCalculator(Calculator):
     """
@@ -56,6 +272,11 @@ class MoleculeCalculator(Calculator):
         """
         Apply `fn` to `mol` and cache the result.
 
+        If the calculator has a result store, the result is also
+        taken from, or saved to, the store. If `fn` changes the
+        position matrix of `mol`, the new position matrix is saved
+        too, and set on `mol` when the result is taken from the store.
+
         Parameters
         ----------
         fn : :class:`callable`
@@ -73,15 +294,95 @@ class MoleculeCalculator(Calculator):
 
         """
 
-        if self.is_caching() and self.is_in_cache(mol):
-            return self.get_cached_value(mol)
+        return self._cache_results(
+            fn=lambda mols: [fn(mol) for mol in mols],
+            mols=[mol],
+        )[0]
 
-        value = fn(mol)
+    def _cache_results(self, fn, mols):
+        """
+        Apply `fn` to `mols` and cache the results.
 
-        if self.is_caching():
-            self.add_to_cache(mol, value)
+        Works like :meth:`_cache_result`, except that `fn` is applied
+        to all molecules which do not have a cached or stored result
+        in a single call.
 
-        return value
+        Parameters
+        ----------
+        fn : :class:`callable`
+            Takes a :class:`list` of :class:`.Molecule` as a
+            parameter and returns a :class:`list` holding the result
+            of each molecule, in order.
+
+        mols : :class:`iterable` of :class:`.Molecule`
+            The molecules onto which `fn` is applied.
+
+        Returns
+        -------
+        :class:`list`
+            The result of each molecule in `mols`, in order.
+
+        """
+
+        mols = list(mols)
+        result_store = self.get_result_store()
+
+        # Maps the id of each molecule to its result.
+        values = {}
+        # Maps the id of each molecule without a result to the
+        # molecule and its result store key.
+        pending = {}
+        for mol in mols:
+            if id(mol) in values or id(mol) in pending:
+                continue
+
+            if self.is_caching():
+                value = self._get_cached_value(mol, _MISSING)
+                if value is not _MISSING:
+                    values[id(mol)] = value
+                    continue
+
+            key = None
+            if result_store is not None:
+                key = _get_result_store_key(self, mol)
+
+            if key is not None:
+                result = result_store.get(key)
+                if result is not None:
+                    value, position_matrix = result
+                    if position_matrix is not None:
+                        mol.set_position_matrix(position_matrix)
+                    if self.is_caching():
+                        self.add_to_cache(mol, value)
+                    values[id(mol)] = value
+                    continue
+
+            pending[id(mol)] = (mol, key)
+
+        if pending:
+            calculated = fn([mol for mol, _ in pending.values()])
+        else:
+            calculated = []
+
+        for (mol, key), value in zip(pending.values(), calculated):
+            if key is not None:
+                position_matrix = mol.get_position_matrix()
+                # Only save the position matrix if fn changed it.
+                if _get_coordinates_key(position_matrix) == key[2]:
+                    position_matrix = None
+                try:
+                    result_store.put(key, (value, position_matrix))
+                except (pickle.PicklingError, AttributeError, TypeError):
+                    logger.warning(
+                        f'The result of {self.__class__.__name__} '
+                        'could not be saved in its result store.'
+                    )
+
+            if self.is_caching():
+                self.add_to_cache(mol, value)
+            values[id(mol)] = value
+
+        return [values[id(mol)] for mol in mols]
 
     def set_cache_use(self, use_cache):
         """
@@ -201,6 +502,156 @@ class MoleculeCalculator(Calculator):
 
         raise NotImplementedError()
 
+    def _get_cached_value(self, mol, default):
+        """
+        Return the value stored in the cache for `mol`.
+
+        Parameters
+        ----------
+        mol : :class:`.Molecule`
+            The molecule whose cached value is to be returned.
+
+        default : :class:`object`
+            Returned if `mol` is not cached.
+
+        Returns
+        -------
+        :class:`object`
+            The cached value, or `default`.
+
+        """
+
+        if self.is_in_cache(mol):
+            return self.get_cached_value(mol)
+        return default
+
+    def set_cache_policy(self, max_size=None, weak=False):
+        """
+        Set how many results the cache holds.
+
+        By default, the calculator has no cache, and this does
+        nothing.
+
+        Parameters
+        ----------
+        max_size : :class:`int`, optional
+            The maximum number of results held by the cache. If
+            ``None``, the number is not limited.
+
+        weak : :class:`bool`, optional
+            If ``True``, the cache holds weak references to
+            molecules, so that it does not keep them alive.
+
+        Returns
+        -------
+        :class:`.MoleculeCalculator`
+            The calculator.
+
+        """
+
+        return self
+
+    def get_cache(self):
+        """
+        Return the cache of the calculator.
+
+        Returns
+        -------
+        :class:`.CalculatorCache`
+            The cache.
+
+        Raises
+        ------
+        :class:`NotImplementedError`
+            This is a virtual method and needs to be implemented in a
+            subclass.
+
+        """
+
+        raise NotImplementedError()
+
+    def set_geometry_caching(self, decimals=6):
+        """
+        Set the cache to be keyed by the geometry of molecules.
+
+        By default, the calculator has no cache, and this does
+        nothing.
+
+        Parameters
+        ----------
+        decimals : :class:`int`, optional
+            The number of decimals the coordinates are rounded to
+            before they are used in the key. If ``None``, the
+            cache is keyed by the molecule objects.
+
+        Returns
+        -------
+        :class:`.MoleculeCalculator`
+            The calculator.
+
+        """
+
+        return self
+
+    def set_result_store(self, result_store):
+        """
+        Set the result store of the calculator.
+
+        Parameters
+        ----------
+        result_store : :class:`.ResultStore`
+            The result store. If ``None``, the calculator does not use
+            a result store.
+
+        Returns
+        -------
+        :class:`.MoleculeCalculator`
+            The calculator.
+
+        Raises
+        ------
+        :class:`NotImplementedError`
+            This is a virtual method and needs to be implemented in a
+            subclass.
+
+        """
+
+        raise NotImplementedError()
+
+    def get_result_store(self):
+        """
+        Return the result store of the calculator.
+
+        By default, the calculator does not use a result store.
+
+        Returns
+        -------
+        :class:`.ResultStore`
+            The result store, or ``None`` if the calculator does not
+            use one.
+
+        """
+
+        return None
+
+    def get_num_cores(self):
+        """
+        Return the number of cores used by a single calculation.
+
+        :class:`.Population` uses this to decide how many
+        calculations it can run at the same time without using more
+        cores than are available. By default, a calculation uses a
+        single core.
+
+        Returns
+        -------
+        :class:`int`
+            The number of cores.
+
+        """
+
+        return 1
+
 
 class _MoleculeCalculator(MoleculeCalculator):
     """
@@ -208,6 +659,12 @@ class _MoleculeCalculator(MoleculeCalculator):
 
     """
 
+    # Set by set_result_store() and set_geometry_caching(). Class
+    # attributes, so that calculators which do not call __init__()
+    # have them too.
+    _result_store = None
+    _geometry_decimals = None
+
     def __init__(self, use_cache=False):
         """
         Initialize the :class:`.Calculator`.
@@ -220,7 +677,7 @@ class _MoleculeCalculator(MoleculeCalculator):
 
         """
 
-        self._cache = {}
+        self._cache = CalculatorCache()
         self._use_cache = use_cache
 
     def set_cache_use(self, use_cache):
@@ -274,7 +731,7 @@ class _MoleculeCalculator(MoleculeCalculator):
 
         """
 
-        self._cache[mol] = value
+        self._cache[self._get_cache_key(mol)] = value
         return self
 
     def is_in_cache(self, mol):
@@ -293,7 +750,9 @@ class _MoleculeCalculator(MoleculeCalculator):
 
         """
 
-        return mol in self._cache
+        is_in_cache = self._get_cache_key(mol) in self._cache
+        self._cache._record_lookup(is_in_cache)
+        return is_in_cache
 
     def get_cached_value(self, mol):
         """
@@ -311,7 +770,200 @@ class _MoleculeCalculator(MoleculeCalculator):
 
         """
 
-        return self._cache[mol]
+        return self._cache[self._get_cache_key(mol)]
+
+    def _get_cached_value(self, mol, default):
+        """
+        Return the value stored in the cache for `mol`.
+
+        Unlike calling :meth:`is_in_cache` and then
+        :meth:`get_cached_value`, the value is found in a single
+        lookup, so it cannot be evicted by another thread in between.
+
+        Parameters
+        ----------
+        mol : :class:`.Molecule`
+            The molecule whose cached value is to be returned.
+
+        default : :class:`object`
+            Returned if `mol` is not cached.
+
+        Returns
+        -------
+        :class:`object`
+            The cached value, or `default`.
+
+        """
+
+        return self._cache.get(self._get_cache_key(mol), default)
+
+    def set_cache_policy(self, max_size=None, weak=False):
+        """
+        Set how many results the cache holds.
+
+        Results already in the cache are moved to the new cache, in
+        order of their last use, and are evicted if they exceed its
+        limit.
+
+        Parameters
+        ----------
+        max_size : :class:`int`, optional
+            The maximum number of results held by the cache. If
+            ``None``, the number is not limited.
+
+        weak : :class:`bool`, optional
+            If ``True``, the cache holds weak references to
+            molecules, so that it does not keep them alive.
+
+        Returns
+        -------
+        :class:`.MoleculeCalculator`
+            The calculator.
+
+        """
+
+        cache = CalculatorCache(max_size=max_size, weak=weak)
+        for key, value in self._cache._get_items():
+            cache[key] = value
+        self._cache = cache
+        return self
+
+    def get_cache(self):
+        """
+        Return the cache of the calculator.
+
+        Returns
+        -------
+        :class:`.CalculatorCache`
+            The cache.
+
+        """
+
+        return self._cache
+
+    def set_geometry_caching(self, decimals=6):
+        """
+        Set the cache to be keyed by the geometry of molecules.
+
+        By default, the cache is keyed by the molecule objects, so
+        a copy of a molecule is calculated again, and a molecule
+        whose coordinates changed still gets its old result. Keyed
+        by geometry, a molecule gets a cached result if it has the
+        same identity key and the same coordinates, to within
+        `decimals`, as a molecule whose result was cached. As a
+        result, changing the coordinates of a molecule means
+        its result is calculated again.
+
+        Parameters
+        ----------
+        decimals : :class:`int`, optional
+            The number of decimals the coordinates are rounded to
+            before they are used in the key. If ``None``, the
+            cache is keyed by the molecule objects.
+
+        Returns
+        -------
+        :class:`.MoleculeCalculator`
+            The calculator.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            import stk
+
+            energy_calculator = stk.MMFFEnergy(use_cache=True)
+            energy_calculator.set_geometry_caching()
+
+            bb = stk.BuildingBlock('NCCN')
+            energy_calculator.get_energy(bb)
+            # Uses the cached value, because the clone has the
+            # same coordinates.
+            energy_calculator.get_energy(bb.clone())
+
+            # Calculates the energy again, because the coordinates
+            # changed.
+            stk.MMFF().optimize(bb)
+            energy_calculator.get_energy(bb)
+
+        """
+
+        self._cache.clear()
+        self._geometry_decimals = decimals
+        return self
+
+    def _get_cache_key(self, mol):
+        """
+        Return the key of `mol` in the cache.
+
+        Parameters
+        ----------
+        mol : :class:`.Molecule`
+            The molecule.
+
+        Returns
+        -------
+        :class:`object`
+            The key.
+
+        """
+
+        if self._geometry_decimals is None:
+            return mol
+        return (
+            mol.get_identity_digest(),
+            _get_coordinates_key(
+                position_matrix=mol.get_position_matrix(),
+                decimals=self._geometry_decimals
+            ),
+        )
+
+    def set_result_store(self, result_store):
+        """
+        Set the result store of the calculator.
+
+        Parameters
+        ----------
+        result_store : :class:`.ResultStore`
+            The result store. If ``None``, the calculator does not use
+            a result store.
+
+        Returns
+        -------
+        :class:`.MoleculeCalculator`
+            The calculator.
+
+        """
+
+        self._result_store = result_store
+        return self
+
+    def get_result_store(self):
+        """
+        Return the result store of the calculator.
+
+        Returns
+        -------
+        :class:`.ResultStore`
+            The result store, or ``None`` if the calculator does not
+            use one.
+
+        """
+
+        return self._result_store
+
+    def get_num_cores(self):
+        """
+        Return the number of cores used by a single calculation.
+
+        Returns
+        -------
+        :class:`int`
+            The number of cores.
+
+        """
+
+        return 1
 
 
 class EAOperation(Calculator):
@@ -358,6 +1010,10 @@ class _EAOperation(EAOperation):
         """
         Set use of the molecular cache on or off.
 
+        The size of the molecular cache, and its statistics, are
+        controlled by the cache of the molecule class, see
+        :meth:`.Molecule.set_cache_policy`.
+
         Parameters
         ----------
         use_cache : :class:`bool`
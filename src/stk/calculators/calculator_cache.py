@@ -0,0 +1,295 @@
+"""
+Calculator Cache
+================
+
+"""
+
+import weakref
+import threading
+from collections import OrderedDict
+
+
+class CalculatorCache:
+    """
+    Holds the cached results of a :class:`.MoleculeCalculator`.
+
+    By default, the cache is unbounded and keeps every molecule it
+    holds a result for alive. A cache can also be bounded by the
+    number of results it holds, in which case the least recently used
+    results are evicted first. In weak mode, the cache only holds
+    weak references to molecules, and the result of a molecule is
+    removed once the molecule is no longer used elsewhere.
+
+    A cache can be used by multiple threads at the same time.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import stk
+
+        energy_calculator = stk.MMFFEnergy(use_cache=True)
+        energy_calculator.set_cache_policy(max_size=1000, weak=True)
+
+        bb = stk.BuildingBlock('NCCN')
+        energy_calculator.get_energy(bb)
+        energy_calculator.get_energy(bb)
+
+        cache = energy_calculator.get_cache()
+        print(
+            cache.get_num_hits(),
+            cache.get_num_misses(),
+            cache.get_num_evictions(),
+        )
+
+    """
+
+    def __init__(self, max_size=None, weak=False):
+        """
+        Initialize a :class:`CalculatorCache`.
+
+        Parameters
+        ----------
+        max_size : :class:`int`, optional
+            The maximum number of results held by the cache. If
+            ``None``, the number is not limited.
+
+        weak : :class:`bool`, optional
+            If ``True``, molecules used as keys are held with weak
+            references.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `max_size` is negative.
+
+        """
+
+        if max_size is not None and max_size < 0:
+            raise ValueError('max_size must not be negative.')
+
+        self._max_size = max_size
+        self._weak = weak
+        # Holds the results, ordered from least to most recently used.
+        self._values = OrderedDict()
+        self._num_hits = 0
+        self._num_misses = 0
+        self._num_evictions = 0
+        self._lock = threading.RLock()
+
+    def _get_key(self, key, callback=None):
+        """
+        Return the key used in :attr:`_values`.
+
+        Parameters
+        ----------
+        key : :class:`object`
+            The key given by the user of the cache.
+
+        callback : :class:`callable`, optional
+            Called when a weakly referenced key is garbage collected.
+
+        Returns
+        -------
+        :class:`object`
+            The key used in :attr:`_values`.
+
+        """
+
+        if not self._weak:
+            return key
+        try:
+            return weakref.ref(key, callback)
+        except TypeError:
+            # Keys such as tuples cannot be weakly referenced, but
+            # they do not keep molecules alive either.
+            return key
+
+    def _remove(self, key):
+        with self._lock:
+            self._values.pop(key, None)
+
+    def get(self, key, default=None):
+        """
+        Return a cached result.
+
+        The lookup is counted as a hit or a miss in the same step, so
+        the result cannot be evicted by another thread in between.
+
+        Parameters
+        ----------
+        key : :class:`object`
+            The key of the result.
+
+        default : :class:`object`, optional
+            Returned if `key` is not in the cache.
+
+        Returns
+        -------
+        :class:`object`
+            The result, or `default`.
+
+        """
+
+        key = self._get_key(key)
+        with self._lock:
+            if key not in self._values:
+                self._num_misses += 1
+                return default
+            self._num_hits += 1
+            self._values.move_to_end(key)
+            return self._values[key]
+
+    def _record_lookup(self, hit):
+        """
+        Count a lookup of the cache.
+
+        Parameters
+        ----------
+        hit : :class:`bool`
+            ``True`` if the result was found in the cache.
+
+        Returns
+        -------
+        :class:`CalculatorCache`
+            The cache.
+
+        """
+
+        with self._lock:
+            if hit:
+                self._num_hits += 1
+            else:
+                self._num_misses += 1
+        return self
+
+    def get_num_hits(self):
+        """
+        Return the number of lookups which found a result.
+
+        Returns
+        -------
+        :class:`int`
+            The number of hits.
+
+        """
+
+        return self._num_hits
+
+    def get_num_misses(self):
+        """
+        Return the number of lookups which did not find a result.
+
+        Returns
+        -------
+        :class:`int`
+            The number of misses.
+
+        """
+
+        return self._num_misses
+
+    def get_num_evictions(self):
+        """
+        Return the number of results evicted from the cache.
+
+        Results removed because their molecule was garbage collected
+        are not counted.
+
+        Returns
+        -------
+        :class:`int`
+            The number of evictions.
+
+        """
+
+        return self._num_evictions
+
+    def clear(self):
+        """
+        Remove all results from the cache.
+
+        Returns
+        -------
+        :class:`CalculatorCache`
+            The cache.
+
+        """
+
+        with self._lock:
+            self._values.clear()
+        return self
+
+    def _get_items(self):
+        """
+        Yield the cached results, from least to most recently used.
+
+        Yields
+        ------
+        :class:`tuple`
+            The key and the result.
+
+        """
+
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            if isinstance(key, weakref.ref):
+                key = key()
+                if key is None:
+                    continue
+            yield key, value
+
+    def __getstate__(self):
+        state = dict(vars(self))
+        # Weak references and locks cannot be pickled.
+        state['_values'] = list(self._get_items())
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        values = state.pop('_values')
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+        self._values = OrderedDict()
+        for key, value in values:
+            self[key] = value
+
+    def __getitem__(self, key):
+        key = self._get_key(key)
+        with self._lock:
+            self._values.move_to_end(key)
+            return self._values[key]
+
+    def __setitem__(self, key, value):
+        key = self._get_key(key, self._remove)
+        with self._lock:
+            # Replace the key as well, so that the stored weak
+            # reference has the callback.
+            self._values.pop(key, None)
+            self._values[key] = value
+            while (
+                self._max_size is not None
+                and len(self._values) > self._max_size
+            ):
+                self._values.popitem(last=False)
+                self._num_evictions += 1
+
+    def __contains__(self, key):
+        return self._get_key(key) in self._values
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return (key for key, value in self._get_items())
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return (
+            f'{self.__class__.__name__}('
+            f'max_size={self._max_size!r}, '
+            f'weak={self._weak!r})'
+        )
@@ -72,6 +72,7 @@ from .ea import (
     Selector,
 )
 from .base_calculators import _MoleculeCalculator, MoleculeCalculator
+from .calculator_cache import CalculatorCache
 
 
 logger = logging.getLogger(__name__)
@@ -153,7 +154,7 @@ class If(
         self._true_calculator = true_calculator
         self._false_calculator = false_calculator
         self._use_cache = use_cache
-        self._cache = {}
+        self._cache = CalculatorCache()
 
     def _cross(self, *mols):
         if self._condition(*mols):
@@ -193,6 +194,20 @@ class If(
             return self._true_calculator.mutate(mol)
         return self._false_calculator.mutate(mol)
 
+    def get_num_cores(self):
+        """
+        Return the number of cores used by a single calculation.
+
+        Returns
+        -------
+        :class:`int`
+            The largest number of cores used by any of the held
+            calculators.
+
+        """
+
+        return _get_num_cores(self._true_calculator, self._false_calculator)
+
     def _optimize(self, mol):
         if self._condition(mol):
             return self._true_calculator.optimize(mol)
@@ -311,7 +326,21 @@ class TryCatch(
         self._catch_calculator = catch_calculator
         self._catch_type = catch_type
         self._use_cache = use_cache
-        self._cache = {}
+        self._cache = CalculatorCache()
+
+    def get_num_cores(self):
+        """
+        Return the number of cores used by a single calculation.
+
+        Returns
+        -------
+        :class:`int`
+            The largest number of cores used by any of the held
+            calculators.
+
+        """
+
+        return _get_num_cores(self._try_calculator, self._catch_calculator)
 
     def _optimize(self, mol):
         try:
@@ -458,7 +487,21 @@ class Sequence(
         self._calculators = calculators
         self._use_cache = use_cache
         self._num_batches = num_batches
-        self._cache = {}
+        self._cache = CalculatorCache()
+
+    def get_num_cores(self):
+        """
+        Return the number of cores used by a single calculation.
+
+        Returns
+        -------
+        :class:`int`
+            The largest number of cores used by any of the held
+            calculators.
+
+        """
+
+        return _get_num_cores(*self._calculators)
 
     def _optimize(self, mol):
         for calculator in self._calculators:
@@ -572,7 +615,21 @@ class Random(
         self._probabilities = probabilities
         self._generator = np.random.RandomState(random_seed)
         self._use_cache = use_cache
-        self._cache = {}
+        self._cache = CalculatorCache()
+
+    def get_num_cores(self):
+        """
+        Return the number of cores used by a single calculation.
+
+        Returns
+        -------
+        :class:`int`
+            The largest number of cores used by any of the held
+            calculators.
+
+        """
+
+        return _get_num_cores(*self._calculators)
 
     def _optimize(self, mol):
         return self._get_calculator().optimize(mol)
@@ -713,12 +770,26 @@ class RaisingCalculator(
         self._fail_chance = fail_chance
         self._generator = np.random.RandomState(random_seed)
         self._use_cache = use_cache
-        self._cache = {}
+        self._cache = CalculatorCache()
 
     def _try_raising(self):
         if self._generator.rand() < self._fail_chance:
             raise RaisingCalculatorError()
 
+    def get_num_cores(self):
+        """
+        Return the number of cores used by a single calculation.
+
+        Returns
+        -------
+        :class:`int`
+            The largest number of cores used by any of the held
+            calculators.
+
+        """
+
+        return _get_num_cores(self._calculator)
+
     def _optimize(self, mol):
         self._try_raising()
         return self._calculator.optimize(mol)
@@ -777,3 +848,30 @@ class RaisingCalculator(
     def _mutate(self, mol):
         self._try_raising()
         return self._calculator.mutate(mol)
+
+
+def _get_num_cores(*calculators):
+    """
+    Return the largest number of cores used by `calculators`.
+
+    Parameters
+    ----------
+    *calculators : :class:`tuple` of :class:`.Calculator`
+        The calculators. Calculators which are not
+        :class:`.MoleculeCalculator` instances are ignored.
+
+    Returns
+    -------
+    :class:`int`
+        The largest number of cores used by a single calculation.
+
+    """
+
+    return max(
+        (
+            calculator.get_num_cores()
+            for calculator in calculators
+            if isinstance(calculator, MoleculeCalculator)
+        ),
+        default=1,
+    )
@@ -40,6 +40,45 @@ from ...utilities import dedupe
 logger = logging.getLogger(__name__)
 
 
+def _get_parent(mols, building_blocks, topology_graph):
+    """
+    Get the parent whose structure an offspring should reuse.
+
+    Parameters
+    ----------
+    mols : :class:`tuple` of :class:`.ConstructedMolecule`
+        The molecules being crossed.
+
+    building_blocks : :class:`list` of :class:`.Molecule`
+        The building blocks of the offspring.
+
+    topology_graph : :class:`.TopologyGraph`
+        The topology graph of the offspring.
+
+    Returns
+    -------
+    :class:`.ConstructedMolecule`
+        The molecule in `mols` with the same topology graph as the
+        offspring, which shares the most building blocks with it.
+        ``None`` if no molecule has the same topology graph.
+
+    """
+
+    keys = {bb.get_identity_digest() for bb in building_blocks}
+    parents = [
+        mol for mol in mols
+        if mol.topology_graph._get_repr() == topology_graph._get_repr()
+    ]
+    return max(
+        parents,
+        key=lambda mol: sum(
+            1 for bb in mol.building_block_vertices
+            if bb.get_identity_digest() in keys
+        ),
+        default=None
+    )
+
+
 class Crosser(EAOperation):
     """
     Abstract base class for crossers.
@@ -157,6 +196,8 @@ class GeneticRecombination(_EAOperation, Crosser):
     picks a random building block for every gene. The picked
     building blocks are used to construct the offspring. The
     topology graph of the offspring is one of the parent's.
+    If `reuse_parent` is ``True``, building blocks shared with a
+    parent keep their positions in that parent.
     For obvious reasons, this approach works with any number of
     parents.
 
@@ -219,7 +260,9 @@ class GeneticRecombination(_EAOperation, Crosser):
         key,
         random_yield_order=True,
         random_seed=None,
-        use_cache=False
+        use_cache=False,
+        lazy=False,
+        reuse_parent=False
     ):
         """
         Initialize a :class:`GeneticRecombination` instance.
@@ -238,10 +281,23 @@ class GeneticRecombination(_EAOperation, Crosser):
         use_cache : :class:`bool`, optional
             Toggles use of the molecular cache.
 
+        lazy : :class:`bool`, optional
+            If ``True``, the structures of the offspring are only
+            constructed once they are first accessed, see
+            :class:`.ConstructedMolecule`.
+
+        reuse_parent : :class:`bool`, optional
+            If ``True``, the most similar parent is used as the
+            `parent` of the offspring, so that the building blocks
+            it keeps are not placed again, see
+            :meth:`.TopologyGraph.construct`.
+
         """
 
         self._key = key
         self._generator = np.random.RandomState(random_seed)
+        self._lazy = lazy
+        self._reuse_parent = reuse_parent
         super().__init__(use_cache=use_cache)
 
     def _cross(self, *mols):
@@ -268,24 +324,27 @@ class GeneticRecombination(_EAOperation, Crosser):
         for mol in mols:
             for allele in mol.building_block_vertices:
                 gene = genes[self._key(allele)]
-                if allele.get_identity_key() not in gene:
-                    gene[allele.get_identity_key()] = allele
+                if allele.get_identity_digest() not in gene:
+                    gene[allele.get_identity_digest()] = allele
 
         genes = {
             gene: self._generator.permutation(list(alleles.values()))
             for gene, alleles in genes.items()
         }
-        tops = dedupe((mol.topology_graph for mol in mols), key=repr)
+        tops = dedupe(
+            (mol.topology_graph for mol in mols),
+            key=lambda top: top._get_repr()
+        )
         product = list(it.product(*genes.values(), tops))
         self._generator.shuffle(product)
 
         parents = {
             (
                 *tuple(sorted(
-                    bb.get_identity_key()
+                    bb.get_identity_digest()
                     for bb in mol.building_block_vertices
                 )),
-                repr(mol.topology_graph)
+                mol.topology_graph._get_repr()
             )
             for mol in mols
         }
@@ -293,9 +352,9 @@ class GeneticRecombination(_EAOperation, Crosser):
             # Do not yield the parents.
             mol = (
                 *tuple(sorted(
-                    bb.get_identity_key() for bb in building_blocks
+                    bb.get_identity_digest() for bb in building_blocks
                 )),
-                repr(top)
+                top._get_repr()
             )
             if mol in parents:
                 continue
@@ -303,7 +362,12 @@ class GeneticRecombination(_EAOperation, Crosser):
             yield cls(
                 building_blocks=building_blocks,
                 topology_graph=top,
-                use_cache=self._use_cache
+                use_cache=self._use_cache,
+                lazy=self._lazy,
+                parent=(
+                    _get_parent(mols, building_blocks, top)
+                    if self._reuse_parent else None
+                )
             )
 
 
@@ -315,6 +379,8 @@ class Jumble(_EAOperation, Crosser):
     and building blocks are drawn from the pot to generate the
     offspring. The offspring inherit the topology  graph of one of the
     parents.
+    If `reuse_parent` is ``True``, building blocks shared with a
+    parent keep their positions in that parent.
 
     Examples
     --------
@@ -368,7 +434,9 @@ class Jumble(_EAOperation, Crosser):
         duplicate_building_blocks=False,
         random_yield_order=True,
         random_seed=None,
-        use_cache=False
+        use_cache=False,
+        lazy=False,
+        reuse_parent=False
     ):
         """
         Initialize a :class:`Jumble` instance.
@@ -388,12 +456,25 @@ class Jumble(_EAOperation, Crosser):
         use_cache : :class:`bool`, optional
             Toggles use of the molecular cache.
 
+        lazy : :class:`bool`, optional
+            If ``True``, the structures of the offspring are only
+            constructed once they are first accessed, see
+            :class:`.ConstructedMolecule`.
+
+        reuse_parent : :class:`bool`, optional
+            If ``True``, the most similar parent is used as the
+            `parent` of the offspring, so that the building blocks
+            it keeps are not placed again, see
+            :meth:`.TopologyGraph.construct`.
+
         """
 
         n = num_offspring_building_blocks
         self._num_offspring_building_blocks = n
         self._duplicate_building_blocks = duplicate_building_blocks
         self._generator = np.random.RandomState(random_seed)
+        self._lazy = lazy
+        self._reuse_parent = reuse_parent
         super().__init__(use_cache=use_cache)
 
     def _cross(self, *mols):
@@ -415,7 +496,7 @@ class Jumble(_EAOperation, Crosser):
         cls = mols[0].__class__
         building_blocks = dedupe(
             (bb for mol in mols for bb in mol.building_block_vertices),
-            key=lambda bb: bb.get_identity_key()
+            key=lambda bb: bb.get_identity_digest()
         )
 
         if self._duplicate_building_blocks:
@@ -428,7 +509,7 @@ class Jumble(_EAOperation, Crosser):
         )
         topologies = dedupe(
             (mol.topology_graph for mol in mols),
-            key=repr
+            key=lambda top: top._get_repr()
         )
         product = list(it.product(building_block_groups, topologies))
         self._generator.shuffle(product)
@@ -436,10 +517,10 @@ class Jumble(_EAOperation, Crosser):
         parents = {
             (
                 *tuple(sorted(
-                    bb.get_identity_key()
+                    bb.get_identity_digest()
                     for bb in mol.building_block_vertices
                 )),
-                repr(mol.topology_graph)
+                mol.topology_graph._get_repr()
             )
             for mol in mols
         }
@@ -447,8 +528,8 @@ class Jumble(_EAOperation, Crosser):
         for bbs, top in product:
             # Do not yield the parents.
             mol = (
-                *tuple(sorted(bb.get_identity_key() for bb in bbs)),
-                repr(top)
+                *tuple(sorted(bb.get_identity_digest() for bb in bbs)),
+                top._get_repr()
             )
             if mol in parents:
                 continue
@@ -456,5 +537,10 @@ class Jumble(_EAOperation, Crosser):
             yield cls(
                 building_blocks=bbs,
                 topology_graph=top,
-                use_cache=self._use_cache
+                use_cache=self._use_cache,
+                lazy=self._lazy,
+                parent=(
+                    _get_parent(mols, bbs, top)
+                    if self._reuse_parent else None
+                )
             )
@@ -111,7 +111,7 @@ class FitnessFunction(_MoleculeCalculator, FitnessCalculator):
 
     """
 
-    def __init__(self, fitness_fn, use_cache=False):
+    def __init__(self, fitness_fn, use_cache=False, num_cores=1):
         """
         Initialize a :class:`.FitnessFunction` instance.
 
@@ -127,11 +127,29 @@ class FitnessFunction(_MoleculeCalculator, FitnessCalculator):
             the same molecule twice, instead the previously returned
             value will be returned.
 
+        num_cores : :class:`int`, optional
+            The number of cores used by `fitness_fn`, for example
+            because it runs a multithreaded program.
+
         """
 
         self._fitness_fn = fitness_fn
+        self._num_cores = num_cores
         super().__init__(use_cache=use_cache)
 
+    def get_num_cores(self):
+        """
+        Return the number of cores used by a single calculation.
+
+        Returns
+        -------
+        :class:`int`
+            The number of cores.
+
+        """
+
+        return self._num_cores
+
     def _get_fitness(self, mol):
         return self._fitness_fn(mol)
 
@@ -241,7 +259,7 @@ class PropertyVector(_MoleculeCalculator, FitnessCalculator):
 
     """
 
-    def __init__(self, *property_fns, use_cache=False):
+    def __init__(self, *property_fns, use_cache=False, num_cores=1):
         """
         Initialize a :class:`CageFitness` instance.
 
@@ -259,11 +277,30 @@ class PropertyVector(_MoleculeCalculator, FitnessCalculator):
             in the cache are not re-calculated but the value already
             stored is used.
 
+        num_cores : :class:`int`, optional
+            The largest number of cores used by any of the
+            `property_fns`, for example because one of them runs a
+            multithreaded program.
+
         """
 
         self._property_fns = property_fns
+        self._num_cores = num_cores
         super().__init__(use_cache=use_cache)
 
+    def get_num_cores(self):
+        """
+        Return the number of cores used by a single calculation.
+
+        Returns
+        -------
+        :class:`int`
+            The number of cores.
+
+        """
+
+        return self._num_cores
+
     def _get_fitness(self, mol):
         """
         Get the fitness of `mol`.
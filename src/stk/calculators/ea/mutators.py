@@ -106,6 +106,9 @@ class RandomBuildingBlock(_EAOperation, Mutator):
 
     This mutator takes a :class:`.ConstructedMolecule` and substitutes
     the building blocks with one chosen at random from a given set.
+    If `reuse_parent` is ``True``, only the substituted building
+    blocks are placed during construction of the mutant, the
+    remaining atoms keep their positions in the mutated molecule.
 
     Examples
     --------
@@ -151,7 +154,9 @@ class RandomBuildingBlock(_EAOperation, Mutator):
         key,
         duplicate_building_blocks=False,
         random_seed=None,
-        use_cache=False
+        use_cache=False,
+        lazy=False,
+        reuse_parent=False
     ):
         """
         Initialize a :class:`RandomBuildingBlock` instance.
@@ -179,12 +184,25 @@ class RandomBuildingBlock(_EAOperation, Mutator):
         use_cache : :class:`bool`, optional
             Toggles use of the molecular cache.
 
+        lazy : :class:`bool`, optional
+            If ``True``, the structures of the mutants are only
+            constructed once they are first accessed, see
+            :class:`.ConstructedMolecule`.
+
+        reuse_parent : :class:`bool`, optional
+            If ``True``, the mutated molecule is used as the
+            `parent` of the mutant, so that the building blocks it
+            keeps are not placed again, see
+            :meth:`.TopologyGraph.construct`.
+
         """
 
         self._building_blocks = building_blocks
         self._key = key
         self._duplicate_building_blocks = duplicate_building_blocks
         self._generator = np.random.RandomState(random_seed)
+        self._lazy = lazy
+        self._reuse_parent = reuse_parent
         super().__init__(use_cache=use_cache)
 
     def _mutate(self, mol):
@@ -237,7 +255,9 @@ class RandomBuildingBlock(_EAOperation, Mutator):
         return mol.__class__(
             building_blocks=new_bbs,
             topology_graph=mol.topology_graph,
-            use_cache=self._use_cache
+            use_cache=self._use_cache,
+            lazy=self._lazy,
+            parent=mol if self._reuse_parent else None
         )
 
 
@@ -247,6 +267,9 @@ class SimilarBuildingBlock(_EAOperation, Mutator):
 
     This mutator takes a :class:`.ConstructedMolecule` and substitutes
     the building blocks with the most similar one from a given set.
+    If `reuse_parent` is ``True``, only the substituted building
+    blocks are placed during construction of the mutant, the
+    remaining atoms keep their positions in the mutated molecule.
 
     Examples
     --------
@@ -292,7 +315,9 @@ class SimilarBuildingBlock(_EAOperation, Mutator):
         key,
         duplicate_building_blocks,
         random_seed=None,
-        use_cache=False
+        use_cache=False,
+        lazy=False,
+        reuse_parent=False
     ):
         """
         Initialize a :class:`RandomBuildingBlock` instance.
@@ -320,6 +345,17 @@ class SimilarBuildingBlock(_EAOperation, Mutator):
         use_cache : :class:`bool`, optional
             Toggles use of the molecular cache.
 
+        lazy : :class:`bool`, optional
+            If ``True``, the structures of the mutants are only
+            constructed once they are first accessed, see
+            :class:`.ConstructedMolecule`.
+
+        reuse_parent : :class:`bool`, optional
+            If ``True``, the mutated molecule is used as the
+            `parent` of the mutant, so that the building blocks it
+            keeps are not placed again, see
+            :meth:`.TopologyGraph.construct`.
+
         """
 
         self._building_blocks = building_blocks
@@ -327,6 +363,8 @@ class SimilarBuildingBlock(_EAOperation, Mutator):
         self._duplicate_building_blocks = duplicate_building_blocks
         self._similar_bbs = {}
         self._generator = np.random.RandomState(random_seed)
+        self._lazy = lazy
+        self._reuse_parent = reuse_parent
         super().__init__(use_cache=use_cache)
 
     def _mutate(self, mol):
@@ -400,7 +438,9 @@ class SimilarBuildingBlock(_EAOperation, Mutator):
         return mol.__class__(
             building_blocks=new_bbs,
             topology_graph=mol.topology_graph,
-            use_cache=self._use_cache
+            use_cache=self._use_cache,
+            lazy=self._lazy,
+            parent=mol if self._reuse_parent else None
         )
 
 
@@ -447,7 +487,8 @@ class RandomTopologyGraph(_EAOperation, Mutator):
         self,
         topology_graphs,
         random_seed=None,
-        use_cache=False
+        use_cache=False,
+        lazy=False
     ):
         """
         Initialize a :class:`RandomTopology` instance.
@@ -464,10 +505,16 @@ class RandomTopologyGraph(_EAOperation, Mutator):
         use_cache : :class:`bool`, optional
             Toggles use of the molecular cache.
 
+        lazy : :class:`bool`, optional
+            If ``True``, the structures of the mutants are only
+            constructed once they are first accessed, see
+            :class:`.ConstructedMolecule`.
+
         """
 
         self._topology_graphs = topology_graphs
         self._generator = np.random.RandomState(random_seed)
+        self._lazy = lazy
         super().__init__(use_cache=use_cache)
 
     def _mutate(self, mol):
@@ -494,5 +541,6 @@ class RandomTopologyGraph(_EAOperation, Mutator):
         return mol.__class__(
             building_blocks=list(mol.building_block_vertices.keys()),
             topology_graph=topology_graph,
-            use_cache=self._use_cache
+            use_cache=self._use_cache,
+            lazy=self._lazy
         )
@@ -8,6 +8,7 @@ Energy Calculators
 #. :class:`.MOPACEnergy`
 #. :class:`.FormationEnergy`
 #. :class:`.XTBEnergy`
+#. :class:`.XTBProperties`
 #. :class:`.XTBFreeEnergy`
 #. :class:`.If`
 #. :class:`.TryCatch`
@@ -67,11 +68,11 @@ implements its virtual methods.
 
 import rdkit.Chem.AllChem as rdkit
 import logging
-import subprocess as sp
 import uuid
 import os
 from os.path import join
 import shutil
+import shlex
 from ...utilities import (
     is_valid_xtb_solvent,
     XTBInvalidSolventError,
@@ -79,6 +80,7 @@ from ...utilities import (
 )
 
 from ..base_calculators import MoleculeCalculator, _MoleculeCalculator
+from ..subprocess_engine import get_subprocess_engine
 
 
 logger = logging.getLogger(__name__)
@@ -117,6 +119,29 @@ class EnergyCalculator(MoleculeCalculator):
 
         return self._cache_result(self._get_energy, mol)
 
+    def get_energies(self, mols):
+        """
+        Calculate the energy of each molecule in `mols`.
+
+        By default, the energies are calculated one at a time, but
+        energy calculators which can run many molecules in one
+        calculation, such as :class:`.MacroModelEnergy`, calculate
+        them together.
+
+        Parameters
+        ----------
+        mols : :class:`iterable` of :class:`.Molecule`
+            The molecules whose energies are to be calculated.
+
+        Returns
+        -------
+        :class:`list` of :class:`float`
+            The energy of each molecule, in order.
+
+        """
+
+        return [self.get_energy(mol) for mol in mols]
+
     def _get_energy(self, mol):
         """
         Calculate the energy of `mol`.
@@ -341,6 +366,295 @@ class UFFEnergy(_MoleculeCalculator, EnergyCalculator):
         return ff.CalcEnergy()
 
 
+class XTBProperties(_MoleculeCalculator, MoleculeCalculator):
+    """
+    Uses GFN-xTB [1]_ to calculate the properties of molecules.
+
+    A single xTB run is made for each molecule and all properties
+    found in its output are returned together, as an
+    :class:`.XTBExtractor`. By default, the properties are cached,
+    so that a calculator can be shared by an :class:`.XTBEnergy` and
+    any number of fitness functions, and each molecule is still only
+    given to xTB once.
+
+    The cache is keyed by the geometry of molecules, see
+    :meth:`set_geometry_caching`. This means that the properties of a
+    molecule are calculated again if its coordinates change, for
+    example because it was optimized.
+
+    Notes
+    -----
+    When running :meth:`get_properties`, this calculator does not
+    change the present working directory. xTB is run with its working
+    directory set to the output directory and all files are accessed
+    by their absolute paths. This means that :meth:`get_properties`
+    can be run in multiple threads at the same time, as long as each
+    thread uses a different output directory, which is the case if
+    `output_dir` is ``None``.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import stk
+
+        xtb = stk.XTBProperties(
+            xtb_path='/opt/gfnxtb/xtb',
+            unlimited_memory=True
+        )
+
+        # Both the energy calculator and the fitness function use
+        # the same xTB run.
+        energy_calculator = stk.XTBEnergy.init_from_properties_calculator(
+            properties_calculator=xtb
+        )
+
+        def fitness_fn(mol):
+            properties = xtb.get_properties(mol)
+            return [
+                properties.homo_lumo_gap,
+                properties.full_dipole_moment[3],
+            ]
+
+        fitness_calculator = stk.PropertyVector(fitness_fn)
+
+        bb = stk.BuildingBlock('NCCN')
+        energy = energy_calculator.get_energy(bb)
+        fitness_value = fitness_calculator.get_fitness(bb)
+
+    References
+    ----------
+    .. [1] https://xtb-docs.readthedocs.io/en/latest/setup.html
+
+    """
+
+    def __init__(
+        self,
+        xtb_path,
+        gfn_version=2,
+        output_dir=None,
+        num_cores=1,
+        calculate_free_energy=False,
+        electronic_temperature=300,
+        solvent=None,
+        solvent_grid='normal',
+        charge=0,
+        num_unpaired_electrons=0,
+        unlimited_memory=False,
+        use_cache=True
+    ):
+        """
+        Initializes a :class:`XTBProperties` instance.
+
+        Parameters
+        ----------
+        xtb_path : :class:`str`
+            The path to the xTB executable.
+
+        gfn_version : :class:`int`, optional
+            Parameterization of GFN to use in xTB.
+            For details see
+            https://xtb-docs.readthedocs.io/en/latest/basics.html.
+
+        output_dir : :class:`str`, optional
+            The name of the directory into which files generated during
+            the calculation are written, if ``None`` then
+            :func:`uuid.uuid4` is used.
+
+        num_cores : :class:`int`, optional
+            The number of cores xTB should use.
+
+        calculate_free_energy : :class:`bool`, optional
+            Whether to calculate the total free energy and vibrational
+            frequencies. Setting this to ``True`` can drastically
+            increase calculation time and memory requirements.
+
+        electronic_temperature : :class:`int`, optional
+            Electronic temperature in Kelvin.
+
+        solvent : :class:`str`, optional
+            Solvent to use in GBSA implicit solvation method.
+            For details see
+            https://xtb-docs.readthedocs.io/en/latest/gbsa.html.
+
+        solvent_grid : :class:`str`, optional
+            Grid level to use in SASA calculations for GBSA implicit
+            solvent.
+            Can be one of ``'normal'``, ``'tight'``, ``'verytight'``
+            or ``'extreme'``.
+            For details see
+            https://xtb-docs.readthedocs.io/en/latest/gbsa.html.
+
+        charge : :class:`int`, optional
+            Formal molecular charge.
+
+        num_unpaired_electrons : :class:`int`, optional
+            Number of unpaired electrons.
+
+        unlimited_memory : :class: `bool`, optional
+            If ``True`` xTB will be run without constraints
+            on the stack size. If memory issues are encountered, this
+            should be ``True``, however this may raise issues on
+            clusters.
+
+        use_cache : :class:`bool`, optional
+            If ``True`` :meth:`get_properties` will not run twice on
+            the same molecule.
+
+        """
+
+        if solvent is not None:
+            solvent = solvent.lower()
+            if gfn_version == 0:
+                raise XTBInvalidSolventError(
+                    f'No solvent valid for version',
+                    f' {gfn_version!r}.'
+                )
+            if not is_valid_xtb_solvent(gfn_version, solvent):
+                raise XTBInvalidSolventError(
+                    f'Solvent {solvent!r} is invalid for ',
+                    f'version {gfn_version!r}.'
+                )
+
+        self._xtb_path = xtb_path
+        self._gfn_version = str(gfn_version)
+        self._output_dir = output_dir
+        self._num_cores = str(num_cores)
+        self._calculate_free_energy = calculate_free_energy
+        self._electronic_temperature = str(electronic_temperature)
+        self._solvent = solvent
+        self._solvent_grid = solvent_grid
+        self._charge = str(charge)
+        self._num_unpaired_electrons = str(num_unpaired_electrons)
+        self._unlimited_memory = unlimited_memory
+        super().__init__(use_cache=use_cache)
+        self.set_geometry_caching()
+
+    def get_properties(self, mol):
+        """
+        Calculate the properties of `mol`.
+
+        Parameters
+        ----------
+        mol : :class:`.Molecule`
+            The :class:`.Molecule` whose properties are to be
+            calculated.
+
+        Returns
+        -------
+        :class:`.XTBExtractor`
+            The properties of `mol`, as attributes. The total free
+            energy and vibrational frequencies are only present if
+            `calculate_free_energy` is ``True``.
+
+        """
+
+        return self._cache_result(self._get_properties, mol)
+
+    def get_num_cores(self):
+        """
+        Return the number of cores used by a single calculation.
+
+        Returns
+        -------
+        :class:`int`
+            The number of cores xTB uses.
+
+        """
+
+        return int(self._num_cores)
+
+    def _run_xtb(self, output_dir, xyz, out_file):
+        """
+        Runs GFN-xTB.
+
+        Parameters
+        ----------
+        output_dir : :class:`str`
+            The path to the directory in which xTB is run.
+
+        xyz : :class:`str`
+            The name of the input structure ``.xyz`` file.
+
+        out_file : :class:`str`
+            The name of output file with xTB results.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        # Modify the memory limit.
+        if self._unlimited_memory:
+            memory = 'ulimit -s unlimited ;'
+        else:
+            memory = ''
+
+        if self._solvent is not None:
+            solvent = f'--gbsa {self._solvent} {self._solvent_grid}'
+        else:
+            solvent = ''
+
+        if self._calculate_free_energy:
+            calc_type = '--hess'
+        else:
+            calc_type = ''
+
+        cmd = (
+            f'{memory} {self._xtb_path} '
+            f'{shlex.quote(xyz)} --gfn {self._gfn_version} '
+            f'{calc_type} --parallel {self._num_cores} '
+            f'--etemp {self._electronic_temperature} '
+            f'{solvent} --chrg {self._charge} '
+            f'--uhf {self._num_unpaired_electrons}'
+        )
+
+        # Note that this will hold the calling thread until completion
+        # of the calculation.
+        get_subprocess_engine().run(
+            args=cmd,
+            cwd=output_dir,
+            output_path=out_file,
+            # Shell is required to run complex arguments.
+            shell=True
+        )
+
+    def _get_properties(self, mol):
+        """
+        Calculate the properties of `mol`.
+
+        Parameters
+        ----------
+        mol : :class:`.Molecule`
+            The :class:`.Molecule` whose properties are to be
+            calculated.
+
+        Returns
+        -------
+        :class:`.XTBExtractor`
+            The properties of `mol`.
+
+        """
+
+        if self._output_dir is None:
+            output_dir = str(uuid.uuid4().int)
+        else:
+            output_dir = self._output_dir
+        output_dir = os.path.abspath(output_dir)
+
+        if os.path.exists(output_dir):
+            shutil.rmtree(output_dir)
+
+        os.mkdir(output_dir)
+        xyz = join(output_dir, 'input_structure.xyz')
+        out_file = join(output_dir, 'energy.output')
+        mol.write(xyz)
+        self._run_xtb(output_dir=output_dir, xyz=xyz, out_file=out_file)
+
+        return XTBExtractor(output_file=out_file)
+
+
 class XTBEnergy(_MoleculeCalculator, EnergyCalculator):
     """
     Uses GFN-xTB [1]_ to calculate energy and other properties.
@@ -349,20 +663,21 @@ class XTBEnergy(_MoleculeCalculator, EnergyCalculator):
     :class:`.Molecule` passed to :meth:`get_energy`, which
     will be saved in the attributes of :class:`.XTBEnergy`.
 
+    xTB is run by an :class:`.XTBProperties` calculator. If the
+    other properties are needed elsewhere, for example by fitness
+    functions, the same :class:`.XTBProperties` calculator can be
+    shared, so that xTB is only run once for each molecule, see
+    :meth:`init_from_properties_calculator`.
+
     Notes
     -----
-    When running :meth:`get_energy`, this calculator changes the
-    present working directory with :func:`os.chdir`. The original
-    working directory will be restored even if an error is raised, so
-    unless multi-threading is being used this implementation detail
-    should not matter.
-
-    If multi-threading is being used an error could occur if two
-    different threads need to know about the current working directory
-    as :class:`.XTBEnergy` can change it from under them.
-
-    Note that this does not have any impact on multi-processing,
-    which should always be safe.
+    When running :meth:`get_energy`, this calculator does not change
+    the present working directory. xTB is run with its working
+    directory set to the output directory and all files are accessed
+    by their absolute paths. This means that :meth:`get_energy` can
+    be run in multiple threads at the same time, as long as each
+    thread uses a different output directory, which is the case if
+    `output_dir` is ``None``.
 
     Attributes
     ----------
@@ -565,30 +880,73 @@ class XTBEnergy(_MoleculeCalculator, EnergyCalculator):
             molecule.
 
         """
-        if solvent is not None:
-            solvent = solvent.lower()
-            if gfn_version == 0:
-                raise XTBInvalidSolventError(
-                    f'No solvent valid for version',
-                    f' {gfn_version!r}.'
-                )
-            if not is_valid_xtb_solvent(gfn_version, solvent):
-                raise XTBInvalidSolventError(
-                    f'Solvent {solvent!r} is invalid for ',
-                    f'version {gfn_version!r}.'
-                )
+        self._properties_calculator = XTBProperties(
+            xtb_path=xtb_path,
+            gfn_version=gfn_version,
+            output_dir=output_dir,
+            num_cores=num_cores,
+            calculate_free_energy=calculate_free_energy,
+            electronic_temperature=electronic_temperature,
+            solvent=solvent,
+            solvent_grid=solvent_grid,
+            charge=charge,
+            num_unpaired_electrons=num_unpaired_electrons,
+            unlimited_memory=unlimited_memory,
+            use_cache=False
+        )
+        self._init_properties(use_cache)
 
-        self._xtb_path = xtb_path
-        self._gfn_version = str(gfn_version)
-        self._output_dir = output_dir
-        self._num_cores = str(num_cores)
-        self._calculate_free_energy = calculate_free_energy
-        self._electronic_temperature = str(electronic_temperature)
-        self._solvent = solvent
-        self._solvent_grid = solvent_grid
-        self._charge = str(charge)
-        self._num_unpaired_electrons = str(num_unpaired_electrons)
-        self._unlimited_memory = unlimited_memory
+    @classmethod
+    def init_from_properties_calculator(
+        cls,
+        properties_calculator,
+        use_cache=False
+    ):
+        """
+        Initialize from an :class:`.XTBProperties` instance.
+
+        The energy of a molecule is then taken from the properties
+        calculated by `properties_calculator`. If
+        `properties_calculator` caches its results, a molecule whose
+        properties were already calculated, for example by a fitness
+        function, is not given to xTB again.
+
+        Parameters
+        ----------
+        properties_calculator : :class:`.XTBProperties`
+            The calculator used to run xTB.
+
+        use_cache : :class:`bool`, optional
+            If ``True`` :meth:`energy` will not run twice on the same
+            molecule.
+
+        Returns
+        -------
+        :class:`XTBEnergy`
+            The energy calculator.
+
+        """
+
+        energy_calculator = cls.__new__(cls)
+        energy_calculator._properties_calculator = properties_calculator
+        energy_calculator._init_properties(use_cache)
+        return energy_calculator
+
+    def _init_properties(self, use_cache):
+        """
+        Initialize the attributes holding the properties.
+
+        Parameters
+        ----------
+        use_cache : :class:`bool`
+            If ``True`` :meth:`energy` will not run twice on the same
+            molecule.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
 
         self.total_energies = {}
         self.homo_lumo_gaps = {}
@@ -603,53 +961,30 @@ class XTBEnergy(_MoleculeCalculator, EnergyCalculator):
         self.frequencies = {}
         super().__init__(use_cache=use_cache)
 
-    def _get_properties(self, mol, output_file):
+    def get_num_cores(self):
         """
-        Extracts properties from a GFN-xTB energy calculation.
-
-        Parameters
-        ----------
-        mol : :class:`.Molecule`
-            The :class:`.Molecule` whose energy was calculated.
-
-        output_file : :class: `str`
-            Name of the output file with xTB results.
+        Return the number of cores used by a single calculation.
 
         Returns
         -------
-        None : :class:`NoneType`
+        :class:`int`
+            The number of cores xTB uses.
 
         """
-        # Get properties from output_file.
-        xtbext = XTBExtractor(output_file=output_file)
 
-        self.total_energies[mol] = xtbext.total_energy
-        self.homo_lumo_gaps[mol] = xtbext.homo_lumo_gap
-        self.fermi_levels[mol] = xtbext.fermi_level
-        self.homo_lumo_orbitals[mol] = xtbext.homo_lumo_occ
-        self.qonly_dipole_moments[mol] = xtbext.qonly_dipole_moment
-        self.full_dipole_moments[mol] = xtbext.full_dipole_moment
-        self.qonly_quadrupole_moments[mol] = \
-            xtbext.qonly_quadrupole_moment
-        self.qdip_quadrupole_moments[mol] = \
-            xtbext.qdip_quadrupole_moment
-        self.full_quadrupole_moments[mol] = \
-            xtbext.full_quadrupole_moment
-        if self._calculate_free_energy:
-            self.total_free_energies[mol] = xtbext.total_free_energy
-            self.frequencies[mol] = xtbext.frequencies
+        return self._properties_calculator.get_num_cores()
 
-    def _run_xtb(self, xyz, out_file):
+    def _set_properties(self, mol, properties):
         """
-        Runs GFN-xTB.
+        Save the properties of `mol` in the attributes.
 
         Parameters
         ----------
-        xyz : :class:`str`
-            The name of the input structure ``.xyz`` file.
+        mol : :class:`.Molecule`
+            The :class:`.Molecule` whose energy was calculated.
 
-        out_file : :class:`str`
-            The name of output file with xTB results.
+        properties : :class:`.XTBExtractor`
+            The properties of `mol`.
 
         Returns
         -------
@@ -657,42 +992,22 @@ class XTBEnergy(_MoleculeCalculator, EnergyCalculator):
 
         """
 
-        # Modify the memory limit.
-        if self._unlimited_memory:
-            memory = 'ulimit -s unlimited ;'
-        else:
-            memory = ''
-
-        if self._solvent is not None:
-            solvent = f'--gbsa {self._solvent} {self._solvent_grid}'
-        else:
-            solvent = ''
-
-        if self._calculate_free_energy:
-            calc_type = '--hess'
-        else:
-            calc_type = ''
-
-        cmd = (
-            f'{memory} {self._xtb_path} '
-            f'{xyz} --gfn {self._gfn_version} '
-            f'{calc_type} --parallel {self._num_cores} '
-            f'--etemp {self._electronic_temperature} '
-            f'{solvent} --chrg {self._charge} '
-            f'--uhf {self._num_unpaired_electrons}'
-        )
-
-        with open(out_file, 'w') as f:
-            # Note that sp.call will hold the program until completion
-            # of the calculation.
-            sp.call(
-                cmd,
-                stdin=sp.PIPE,
-                stdout=f,
-                stderr=sp.PIPE,
-                # Shell is required to run complex arguments.
-                shell=True
-            )
+        self.total_energies[mol] = properties.total_energy
+        self.homo_lumo_gaps[mol] = properties.homo_lumo_gap
+        self.fermi_levels[mol] = properties.fermi_level
+        self.homo_lumo_orbitals[mol] = properties.homo_lumo_occ
+        self.qonly_dipole_moments[mol] = properties.qonly_dipole_moment
+        self.full_dipole_moments[mol] = properties.full_dipole_moment
+        self.qonly_quadrupole_moments[mol] = \
+            properties.qonly_quadrupole_moment
+        self.qdip_quadrupole_moments[mol] = \
+            properties.qdip_quadrupole_moment
+        self.full_quadrupole_moments[mol] = \
+            properties.full_quadrupole_moment
+        # Only found if xTB calculated the free energy.
+        if hasattr(properties, 'total_free_energy'):
+            self.total_free_energies[mol] = properties.total_free_energy
+            self.frequencies[mol] = properties.frequencies
 
     def _get_energy(self, mol):
         """
@@ -710,29 +1025,6 @@ class XTBEnergy(_MoleculeCalculator, EnergyCalculator):
 
         """
 
-        if self._output_dir is None:
-            output_dir = str(uuid.uuid4().int)
-        else:
-            output_dir = self._output_dir
-        output_dir = os.path.abspath(output_dir)
-
-        if os.path.exists(output_dir):
-            shutil.rmtree(output_dir)
-
-        os.mkdir(output_dir)
-        init_dir = os.getcwd()
-        xyz = join(output_dir, 'input_structure.xyz')
-        out_file = join(output_dir, 'energy.output')
-        mol.write(xyz)
-
-        try:
-            os.chdir(output_dir)
-            self._run_xtb(xyz=xyz, out_file=out_file)
-        finally:
-            os.chdir(init_dir)
-
-        self._get_properties(
-            mol=mol,
-            output_file=out_file
-        )
-        return self.total_energies[mol]
+        properties = self._properties_calculator.get_properties(mol)
+        self._set_properties(mol, properties)
+        return properties.total_energy
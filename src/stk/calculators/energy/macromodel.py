@@ -1,16 +1,42 @@
 from uuid import uuid4
 import os
-import subprocess as sp
 
-from ...utilities import move_generated_macromodel_files
 from .energy_calculators import EnergyCalculator, EnergyError
 from ..base_calculators import _MoleculeCalculator
+from ..optimization.macromodel import _write_batch, _read_batch
+from ..subprocess_engine import get_subprocess_engine
 
 
 class MacroModelEnergy(_MoleculeCalculator, EnergyCalculator):
     """
     Calculates the energy using MacroModel.
 
+    Notes
+    -----
+    MacroModel is run with its working directory set to the output
+    directory, into which all files are written by their absolute
+    paths. The present working directory is never used, which means
+    that :meth:`get_energy` can be run in multiple threads at the same
+    time.
+
+    :meth:`get_energies` calculates the energies of many molecules
+    with a single bmin run, so that the startup of bmin and the check
+    out of its license are done once for all of them.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import stk
+
+        macromodel = stk.MacroModelEnergy(
+            macromodel_path='/opt/schrodinger2017-2'
+        )
+        energies = macromodel.get_energies([
+            stk.BuildingBlock('NCCN'),
+            stk.BuildingBlock('NCCCN'),
+        ])
+
     """
 
     def __init__(
@@ -50,32 +76,43 @@ class MacroModelEnergy(_MoleculeCalculator, EnergyCalculator):
         self._force_field = force_field
         super().__init__(use_cache=use_cache)
 
-    def get_energy(self, mol):
+    def get_energies(self, mols):
         """
-        Calculate the energy of `mol`.
+        Calculate the energies of `mols` with a single bmin run.
 
         Parameters
         ----------
-        mol : :class:`.Molecule`
-            The :class:`.Molecule` whose energy is to be calculated.
+        mols : :class:`iterable` of :class:`.Molecule`
+            The molecules whose energies are to be calculated.
 
         Returns
         -------
-        :class:`float`
-            The energy.
+        :class:`list` of :class:`float`
+            The energy of each molecule, in order.
 
         Raises
         ------
         :class:`EnergyError`
-            This exception is raised if no energy value is found in the
-            MacroModel calculation's ``.log`` file. Likely due to a
-            forcefield error.
+            If the energy of a molecule is not found in the output of
+            bmin. Likely due to a forcefield error.
 
         """
 
-        # To prevent conflicts when running this function in parallel,
-        # a temporary copy of the molecular structure file is made and
-        # used for macromodel calculations.
+        return self._cache_results(self._get_energies, mols)
+
+    def _get_run_path(self):
+        """
+        Return the path of a new run.
+
+        The output directory of the run is created if it does not
+        exist.
+
+        Returns
+        -------
+        :class:`str`
+            The absolute path of the run, without an extension.
+
+        """
 
         # Unique file name is generated by inserting a random int into
         # the file path.
@@ -84,19 +121,41 @@ class MacroModelEnergy(_MoleculeCalculator, EnergyCalculator):
             output_dir = basename
         else:
             output_dir = self._output_dir
+        output_dir = os.path.abspath(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+        return os.path.join(output_dir, basename)
 
-        tmp_file = f'{basename}.mol'
-        mol.write(tmp_file)
+    def _run_bmin(self, input_path, run_path):
+        """
+        Calculate the energies of the structures in `input_path`.
+
+        Parameters
+        ----------
+        input_path : :class:`str`
+            The path to a ``.mol`` or ``.sdf`` file holding the
+            structures.
+
+        run_path : :class:`str`
+            The absolute path of the run, without an extension.
 
+        Returns
+        -------
+        :class:`bool`
+            ``False`` if bmin could not check out a license.
+
+        """
+
+        output_dir, basename = os.path.split(run_path)
         convrt_app = os.path.join(
             self._macromodel_path, 'utilities', 'structconvert'
         )
         convrt_cmd = [
-            convrt_app, tmp_file, f'{basename}.mae'
+            convrt_app, input_path, f'{run_path}.mae'
         ]
-        sp.call(convrt_cmd, stdout=sp.PIPE, stderr=sp.PIPE)
+        get_subprocess_engine().run(convrt_cmd)
 
-        # Create an input file and run it.
+        # Create an input file and run it. The files named in the
+        # input script are relative to the working directory of bmin.
         input_script = (
          "{0}.mae\n"
          "{0}-out.maegz\n"
@@ -116,7 +175,7 @@ class MacroModelEnergy(_MoleculeCalculator, EnergyCalculator):
          "0.0000     0.0000     0.0000\n\n"
         ).format(basename, self._force_field)
 
-        with open(f'{basename}.com', 'w') as f:
+        with open(f'{run_path}.com', 'w') as f:
             f.write(input_script)
 
         cmd = [
@@ -125,19 +184,89 @@ class MacroModelEnergy(_MoleculeCalculator, EnergyCalculator):
             "-WAIT",
             "-LOCAL"
         ]
-        sp.call(cmd)
+        get_subprocess_engine().run(cmd, cwd=output_dir)
 
-        # Check if the license was found. If not run the function
-        # again.
-        with open(f'{basename}.log', 'r') as f:
+        with open(f'{run_path}.log', 'r') as f:
             log_content = f.read()
 
-        if ('FATAL -96: Could not check out a license for mmlibs' in
-           log_content):
-            return self.get_energy(mol)
+        return (
+            'FATAL -96: Could not check out a license for mmlibs'
+            not in log_content
+        )
+
+    def _get_energies(self, mols):
+        """
+        Calculate the energies of `mols` with a single bmin run.
+
+        Parameters
+        ----------
+        mols : :class:`list` of :class:`.Molecule`
+            The molecules whose energies are to be calculated.
+
+        Returns
+        -------
+        :class:`list` of :class:`float`
+            The energy of each molecule, in order.
+
+        """
+
+        run_path = self._get_run_path()
+        sdf_path = f'{run_path}.sdf'
+        _write_batch(mols, sdf_path)
+
+        # Check if the license was found. If not run the calculation
+        # again.
+        while not self._run_bmin(sdf_path, run_path):
+            pass
+
+        structures = _read_batch(run_path)
+        energies = []
+        for i, mol in enumerate(mols):
+            energy, _ = structures.get(i, (None, None))
+            if energy is None:
+                raise EnergyError(
+                    f'MacroModel energy calculation failed for {mol}.'
+                )
+            energies.append(energy)
+        return energies
+
+    def _get_energy(self, mol):
+        """
+        Calculate the energy of `mol`.
+
+        Parameters
+        ----------
+        mol : :class:`.Molecule`
+            The :class:`.Molecule` whose energy is to be calculated.
+
+        Returns
+        -------
+        :class:`float`
+            The energy.
+
+        Raises
+        ------
+        :class:`EnergyError`
+            This exception is raised if no energy value is found in the
+            MacroModel calculation's ``.log`` file. Likely due to a
+            forcefield error.
+
+        """
+
+        # To prevent conflicts when running this function in parallel,
+        # a temporary copy of the molecular structure file is made and
+        # used for macromodel calculations.
+        run_path = self._get_run_path()
+        tmp_file = f'{run_path}.mol'
+        mol.write(tmp_file)
+
+        # Check if the license was found. If not run the calculation
+        # again.
+        while not self._run_bmin(tmp_file, run_path):
+            pass
 
         # Read the .log file and return the energy.
-        with open(f'{basename}.log', 'r') as f:
+        with open(f'{run_path}.log', 'r') as f:
             for line in f:
                 if "                   Total Energy =" in line:
                     eng = float(line.split()[-2].replace("=", ""))
@@ -146,6 +275,3 @@ class MacroModelEnergy(_MoleculeCalculator, EnergyCalculator):
             return eng
         except UnboundLocalError:
             raise EnergyError('MacroModel energy calculation failed.')
-
-        finally:
-            move_generated_macromodel_files(basename, output_dir)
@@ -4,18 +4,20 @@ Defines MacroModel optimizers.
 """
 
 import os
-import subprocess as sp
 import time
 import rdkit.Chem.AllChem as rdkit
-import psutil
 import re
 from uuid import uuid4
 import logging
 import gzip
 
-from ...utilities import MAEExtractor, move_generated_macromodel_files
+from ...utilities import MAEExtractor
 from .optimizers import Optimizer
 from ..base_calculators import _MoleculeCalculator
+from ..subprocess_engine import (
+    get_subprocess_engine,
+    SubprocessTimeoutError,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +50,14 @@ class _MacroModel(_MoleculeCalculator, Optimizer):
     """
     Base class for MacroModel optimzers.
 
+    Notes
+    -----
+    MacroModel is run with its working directory set to the output
+    directory, into which all files are written by their absolute
+    paths. The present working directory is never used, which means
+    that :meth:`optimize` can be run in multiple threads at the same
+    time.
+
     """
 
     def __init__(
@@ -105,18 +115,74 @@ class _MacroModel(_MoleculeCalculator, Optimizer):
         self._minimum_gradient = minimum_gradient
         super().__init__(use_cache=use_cache)
 
+    def _get_run_name(self):
+        """
+        Return the path of a new run.
+
+        The output directory of the run is created if it does not
+        exist.
+
+        Returns
+        -------
+        :class:`str`
+            The absolute path of the run, without an extension.
+
+        """
+
+        basename = str(uuid4().int)
+        if self._output_dir is None:
+            output_dir = basename
+        else:
+            output_dir = self._output_dir
+        output_dir = os.path.abspath(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+        return os.path.join(output_dir, basename)
+
+    def _write_com(self, run_name, com_block):
+        """
+        Write the ``.com`` file of a run.
+
+        Parameters
+        ----------
+        run_name : :class:`str`
+            The absolute path of the run, without an extension.
+
+        com_block : :class:`str`
+            The body of the ``.com`` file.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        # The files named in the .com file are relative to the
+        # directory in which bmin is run.
+        job_name = os.path.basename(run_name)
+        with open(f'{run_name}.com', 'w') as com:
+            # The first line holds the .mae file containing the
+            # molecules to be optimized.
+            com.write(f'{job_name}.mae\n')
+            # The second line holds the name of the output file of the
+            # optimization.
+            com.write(f'{job_name}-out.maegz\n')
+            # Next is the body of the .com file.
+            com.write(com_block)
+
     def _run_bmin(self, mol, run_name):
         """
         Run an optimization using bmin.
 
         Parameters
         ----------
-        mol : :class:`.Molecule`
-            The molecule being optimized.
+        mol : :class:`.Molecule` or :class:`str`
+            The molecule being optimized, or a description of the
+            molecules being optimized together.
 
         run_name : :class:`str`
-            The name of the run. The files generated by this run
-            will have this name.
+            The absolute path of the run, without an extension. The
+            files generated by this run will have this path and bmin
+            is run in its directory.
 
         Returns
         -------
@@ -141,7 +207,7 @@ class _MacroModel(_MoleculeCalculator, Optimizer):
         logger.info(f'Running bmin on "{mol}".')
 
         # To run MacroModel a command is issued to the console via
-        # ``subprocess.Popen``. The command is the full path of the
+        # the subprocess engine. The command is the full path of the
         # ``bmin`` program. ``bmin`` is located in the Schrodinger
         # installation folder.
         log_file = f'{run_name}.log'
@@ -149,25 +215,24 @@ class _MacroModel(_MoleculeCalculator, Optimizer):
         # The first member of the list is the command, the following
         # ones are any additional arguments.
 
-        opt_cmd = [opt_app, run_name, '-WAIT', '-LOCAL']
+        run_dir, job_name = os.path.split(run_name)
+        opt_cmd = [opt_app, job_name, '-WAIT', '-LOCAL']
 
         incomplete = True
         while incomplete:
-            process = psutil.Popen(
-                opt_cmd,
-                stdout=sp.PIPE,
-                stderr=sp.STDOUT,
-                universal_newlines=True
-            )
             try:
-                output, _ = process.communicate(timeout=self._timeout)
+                output = get_subprocess_engine().run(
+                    args=opt_cmd,
+                    cwd=run_dir,
+                    timeout=self._timeout
+                )
 
-            except sp.TimeoutExpired:
+            except SubprocessTimeoutError:
                 logger.warning(
                     'Minimization took too long and was terminated '
                     f'by force on "{mol}".'
                 )
-                self._kill_bmin(mol)
+                self._kill_bmin(mol, run_name)
                 output = ''
 
             logger.debug(
@@ -254,15 +319,10 @@ class _MacroModel(_MoleculeCalculator, Optimizer):
 
         incomplete = True
         while incomplete:
-            out = sp.run(
-                cmd,
-                stdout=sp.PIPE,
-                stderr=sp.STDOUT,
-                universal_newlines=True
-            )
+            out = get_subprocess_engine().run(cmd)
 
             # Keep re-running the function until license is found.
-            if self._license_found(run_name, out.stdout):
+            if self._license_found(run_name, out):
                 incomplete = False
 
         # This loop causes the function to wait until the job has been
@@ -274,12 +334,7 @@ class _MacroModel(_MoleculeCalculator, Optimizer):
         output = name
         start = time.time()
         while name in output:
-            output = sp.run(
-                cmd,
-                stdout=sp.PIPE,
-                stderr=sp.STDOUT,
-                universal_newlines=True
-            ).stdout
+            output = get_subprocess_engine().run(cmd)
             if time.time() - start > 600:
                 break
 
@@ -371,12 +426,7 @@ class _MacroModel(_MoleculeCalculator, Optimizer):
 
             # Execute the file conversion.
             try:
-                convrt_return = sp.run(
-                    convrt_cmd,
-                    stdout=sp.PIPE,
-                    stderr=sp.STDOUT,
-                    universal_newlines=True
-                )
+                convrt_output = get_subprocess_engine().run(convrt_cmd)
 
             # If conversion fails because a wrong Schrodinger path was
             # given, raise.
@@ -385,31 +435,29 @@ class _MacroModel(_MoleculeCalculator, Optimizer):
                     'Wrong Schrodinger path supplied to structconvert.'
                 )
 
-            if 'File does not exist' in convrt_return.stdout:
+            if 'File does not exist' in convrt_output:
                 raise MacroModelConversionError(
                     f'structconvert input file, {input_path}, '
                     f'missing. Console output was '
-                    f'{convrt_return.stdout}'
+                    f'{convrt_output}'
                 )
 
             # Keep re-running the function until license is found.
             run_name, _ = os.path.splitext(input_path)
-            if self._license_found(run_name, convrt_return.stdout):
+            if self._license_found(run_name, convrt_output):
                 incomplete = False
 
         # If force field failed, raise.
-        if 'number 1' in convrt_return.stdout:
-            raise MacroModelForceFieldError(convrt_return.stdout)
+        if 'number 1' in convrt_output:
+            raise MacroModelForceFieldError(convrt_output)
 
         self._wait_for_file(output_path)
         if not os.path.exists(output_path):
             raise MacroModelConversionError(
                 f'Conversion output file {output_path} was not found.'
-                f' Console output was {convrt_return.stdout}.'
+                f' Console output was {convrt_output}.'
             )
 
-        return convrt_return
-
     def _wait_for_file(self, path, timeout=10):
         """
         Wait until a given file exists or `timeout` expires.
@@ -643,6 +691,23 @@ class MacroModelForceField(_MacroModel):
         """
 
         logger.debug(f'Creating .com file for "{mol}".')
+        self._write_com(run_name, self._get_com_block(mol))
+
+    def _get_com_block(self, mol):
+        """
+        Return the body of the ``.com`` file of `mol`.
+
+        Parameters
+        ----------
+        mol : :class:`.Molecule`
+            The molecule which is to be optimized.
+
+        Returns
+        -------
+        :class:`str`
+            The body of the ``.com`` file.
+
+        """
 
         # This is the body of the ``.com`` file. The line that begins
         # and ends with exclamation lines is replaced with the various
@@ -675,18 +740,100 @@ class MacroModelForceField(_MacroModel):
             # and angles into com_block.
             com_block = self._fix_params(mol, com_block)
 
-        # Writes the .com file.
-        with open(f'{run_name}.com', 'w') as com:
-            # The first line holds the .mae file containing the
-            # molecule to be optimized.
-            com.write(f'{run_name}.mae\n')
-            # The second line holds the name of the output file of the
-            # optimization.
-            com.write(f'{run_name}-out.maegz\n')
-            # Next is the body of the .com file.
-            com.write(com_block)
+        return com_block
 
-    def optimize(self, mol):
+    def optimize_batch(self, mols):
+        """
+        Optimize the molecules in `mols` together.
+
+        The molecules are written into a single multi-structure
+        ``.mae`` file, which is optimized by a single bmin run. This
+        means that the startup of bmin and the check out of its
+        license are done once for many molecules. If `restricted` is
+        ``True``, only molecules with the same fixed parameters can
+        be optimized together, so a run is made for each group of
+        such molecules.
+
+        Parameters
+        ----------
+        mols : :class:`iterable` of :class:`.Molecule`
+            The molecules to be optimized.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        Raises
+        ------
+        :class:`MacroModelOptimizationError`
+            If bmin did not return a structure for every molecule.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            import stk
+
+            macromodel = stk.MacroModelForceField(
+                macromodel_path='/opt/schrodinger2017-2'
+            )
+            macromodel.optimize_batch([
+                stk.BuildingBlock('NCCN'),
+                stk.BuildingBlock('NCCCN'),
+                stk.BuildingBlock('NCCCCN'),
+            ])
+
+            # Batches can also be used when optimizing a population.
+            pop = stk.Population(...)
+            pop.optimize(macromodel, batch_size=50)
+
+        """
+
+        self._cache_results(self._optimize_batch, mols)
+
+    def _optimize_batch(self, mols):
+        """
+        Optimize the molecules in `mols` together.
+
+        Parameters
+        ----------
+        mols : :class:`list` of :class:`.Molecule`
+            The molecules to be optimized.
+
+        Returns
+        -------
+        :class:`list` of :class:`NoneType`
+            ``None`` for each molecule.
+
+        """
+
+        # Molecules can only share a run if they have the same
+        # .com file.
+        batches = {}
+        for mol in mols:
+            batches.setdefault(self._get_com_block(mol), []).append(mol)
+
+        for com_block, batch in batches.items():
+            run_name = self._get_run_name()
+            _write_batch(batch, f'{run_name}.sdf')
+            # MacroModel requires a ``.mae`` file as input.
+            self._run_structconvert(f'{run_name}.sdf', f'{run_name}.mae')
+            self._write_com(run_name, com_block)
+            self._run_bmin(f'a batch of {len(batch)} molecules', run_name)
+
+            structures = _read_batch(run_name)
+            if len(structures) != len(batch):
+                raise MacroModelOptimizationError(
+                    f'bmin returned {len(structures)} of {len(batch)} '
+                    f'structures. See {run_name}.log.'
+                )
+            for i, mol in enumerate(batch):
+                _, path = structures[i]
+                mol.update_from_file(path)
+
+        return [None for mol in mols]
+
+    def _optimize(self, mol):
         """
         Optimize a molecule.
 
@@ -701,12 +848,7 @@ class MacroModelForceField(_MacroModel):
 
         """
 
-        run_name = str(uuid4().int)
-        if self._output_dir is None:
-            output_dir = run_name
-        else:
-            output_dir = self._output_dir
-
+        run_name = self._get_run_name()
         mol_path = f'{run_name}.mol'
         mae_path = f'{run_name}.mae'
         # First write a .mol file of the molecule.
@@ -720,7 +862,6 @@ class MacroModelForceField(_MacroModel):
         # Get the ``.maegz`` optimization output to a ``.mae``.
         self._convert_maegz_to_mae(run_name)
         mol.update_from_file(mae_path)
-        move_generated_macromodel_files(run_name, output_dir)
 
     def _fix_distances(self, mol, fix_block):
         """
@@ -849,6 +990,12 @@ class MacroModelMD(_MacroModel):
     """
     Runs a molecular dynamics conformer search using MacroModel.
 
+    Notes
+    -----
+    A bmin run can only hold the conformer search of a single
+    molecule, so :meth:`optimize_batch` optimizes the molecules one
+    after another.
+
     """
 
     def __init__(
@@ -1172,17 +1319,9 @@ class MacroModelMD(_MacroModel):
         ])
 
         com_block = self._fix_params(mol, com_block)
+        self._write_com(run_name, com_block)
 
-        # Generate the com file containing the info for the run
-        with open(f'{run_name}.com', 'w') as com:
-            # name of the macromodel file
-            com.write(f'{run_name}.mae\n')
-            # name of the output file
-            com.write(f'{run_name}-out.maegz\n')
-            # details of the macromodel run
-            com.write(com_block)
-
-    def optimize(self, mol):
+    def _optimize(self, mol):
         """
         Optimize a molecule.
 
@@ -1197,11 +1336,7 @@ class MacroModelMD(_MacroModel):
 
         """
 
-        run_name = str(uuid4().int)
-        if self._output_dir is None:
-            output_dir = run_name
-        else:
-            output_dir = self._output_dir
+        run_name = self._get_run_name()
 
         mol_path = f'{run_name}.mol'
 
@@ -1217,8 +1352,6 @@ class MacroModelMD(_MacroModel):
         conformer_mae = MAEExtractor(run_name).path
         mol.update_from_file(conformer_mae)
 
-        move_generated_macromodel_files(run_name, output_dir)
-
     def _fix_distances(self, mol, fix_block):
         """
         Add lines fixing bond distances to ``.com`` body.
@@ -1327,3 +1460,57 @@ class MacroModelMD(_MacroModel):
                 fix_block += '\n'
 
         return fix_block
+
+
+def _write_batch(mols, path):
+    """
+    Write `mols` into a multi-structure ``.sdf`` file.
+
+    The title of each structure is the index of its molecule in
+    `mols`, which MacroModel keeps in its output.
+
+    Parameters
+    ----------
+    mols : :class:`list` of :class:`.Molecule`
+        The molecules to write.
+
+    path : :class:`str`
+        The path of the ``.sdf`` file.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    with open(path, 'w') as f:
+        for i, mol in enumerate(mols):
+            # The mol block starts with an empty title line.
+            f.write(f'{i}{mol._to_mdl_mol_block()}')
+
+
+def _read_batch(run_name):
+    """
+    Read the output of a batched bmin run.
+
+    Parameters
+    ----------
+    run_name : :class:`str`
+        The absolute path of the run, without an extension.
+
+    Returns
+    -------
+    :class:`dict`
+        Maps the index of each molecule written by
+        :func:`_write_batch`, whose structure is in the output, to its
+        potential energy, or ``None`` if not found, and the path of a
+        ``.mae`` file holding its structure.
+
+    """
+
+    extractor = MAEExtractor(run_name, n=0)
+    structures = {}
+    for title, energy, path in extractor.extract_structures():
+        if title is not None and title.isdigit():
+            structures[int(title)] = (energy, path)
+    return structures
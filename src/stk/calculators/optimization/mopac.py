@@ -4,75 +4,34 @@ Defines MOPAC optimizers.
 """
 
 import os
-import subprocess as sp
-import psutil
+import shutil
 import logging
-from uuid import uuid4
+import uuid
+import numpy as np
 
 from .optimizers import Optimizer
+from ..base_calculators import _MoleculeCalculator
+from ..subprocess_engine import (
+    get_subprocess_engine,
+    SubprocessTimeoutError,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class MOPAC(Optimizer):
+class MOPAC(_MoleculeCalculator, Optimizer):
     """
     Uses MOPAC to optimize molcules.
 
-    Attributes
-    ----------
-    mopac_path : :class:`str`
-        The full path to the MOPAC suite on the user's
-        machine. For example, in a default MacOS installation the
-        folder will probably be something like
-        ``/opt/mopac/MOPAC2016.exe``.
-
-    hamiltonian : :class:`str`, optional
-        A series of different methods can be selected:
-        ``'PM7'``, ``'PM6'``, ``'AM1'``, ``'CIS'``
-        ``'(CISD, CISDT)'``, ``'MNDO'``, ``'RM1'``, etc.
-
-        ``'PM7'`` is the latest version of the reparametrization of
-        NDDO theory, where all the atomic and diatomic
-        parameters were re-optimized / updated from PM6 [#]_.
-
-    method : :class:`str`, optional
-        The default calculation consists of a geometry
-        optimization. You can run single point calculations
-        (SCF) or transition search algorithms (TS). Refer to
-        the MOPAC website for specific keywords.
-
-    minimum_gradient : :class:`float`, optional
-        The gradient at which the geometry optimization reaches
-        the convergence criteria (``kcal`` / ``mol`` /
-        ``Angstrom``). For small system and high precision
-        work, ``0.01`` is recommended.
-
-    eps : :class:`float`, optional
-        Sets the dielectric constant for the solvent. Presence
-        of this keyword will cause the COSMO (Conductor-like
-        Screening Model) method to be used to approximate the
-        effect of a solvent model surrounding the molecule.
-        Solvents with a low dielectric constant are not likely
-        to work well with this model. ``0`` means that the
-        dielectric constant is not included in the calculation.
-        ``80.1`` can be used to model a water environment at
-        room temperature.
-
-    charge : :class:`float`, optional
-        The charge of the system.
-
-    fileout : :class:`str`, optional
-        Determines the output file type.
-
-    timeout : :class:`float`, optional
-        The amount in seconds the optimization is allowed to
-        run before being terminated. The default value is ``2``
-        days or ``172,800`` seconds. ``None`` means there
-        is no timeout.
-
-    References
-    ----------
-    .. [#] http://openmopac.net/PM7_accuracy/PM7_accuracy.html
+    Examples
+    --------
+    .. code-block:: python
+
+        import stk
+
+        mol = stk.BuildingBlock('NCCNCCN', ['amine'])
+        mopac = stk.MOPAC('/opt/mopac/MOPAC2016.exe')
+        mopac.optimize(mol)
 
     """
 
@@ -85,6 +44,7 @@ class MOPAC(Optimizer):
                  charge=0,
                  fileout='PDBOUT',
                  timeout=172800,
+                 output_dir=None,
                  use_cache=False):
         """
         Initializes a :class:`MOPAC` instance.
@@ -133,7 +93,9 @@ class MOPAC(Optimizer):
             The charge of the system.
 
         fileout : :class:`str`, optional
-            Determines the output file type.
+            Determines the output file type. The optimized structure
+            is read from the ``.pdb`` file, so it must include
+            ``'PDBOUT'``.
 
         timeout : :class:`float`, optional
             The amount in seconds the optimization is allowed to
@@ -141,9 +103,14 @@ class MOPAC(Optimizer):
             days or ``172,800`` seconds. ``None`` means there
             is no timeout.
 
+        output_dir : :class:`str`, optional
+            The name of the directory into which files generated
+            during the optimization are written, if ``None`` then
+            :func:`uuid.uuid4` is used.
+
         use_cache : :class:`bool`, optional
             If ``True`` :meth:`optimize` will not run twice on the same
-            molecule and conformer.
+            molecule.
 
         References
         ----------
@@ -151,101 +118,88 @@ class MOPAC(Optimizer):
 
         """
 
-        self.mopac_path
-        self.hamiltonian = hamiltonian
-        self.method = method
-        self.minimum_gradient = minimum_gradient
-        self.eps = eps
-        self.charge = charge
-        self.fileout = fileout
-        self.timeout = timeout
+        self._mopac_path = mopac_path
+        self._hamiltonian = hamiltonian
+        self._method = method
+        self._minimum_gradient = minimum_gradient
+        self._eps = eps
+        self._charge = charge
+        self._fileout = fileout
+        self._timeout = timeout
+        self._output_dir = output_dir
         super().__init__(use_cache=use_cache)
 
-    def optimize(self, mol, conformer=-1):
+    def _optimize(self, mol):
         """
-        Optimizes a molecule.
+        Optimize `mol`.
 
         Parameters
         ----------
         mol : :class:`.Molecule`
             The molecule to be optimized.
 
-        conformer : :class:`int`, optional
-            The conformer to use.
-
         Returns
         -------
         None : :class:`NoneType`
 
         """
 
-        mol._file = f'{uuid4().int}.mol'
-
-        # First write a .mol file of the molecule.
-        mol.write(mol._file, conformer=conformer)
-        # MOPAC requires a ``.mop`` file as input. This creates a
-        # ``.mop`` file holding the molecule.
-        self.generate_mop(mol, conformer)
-        # Run the optimization.
-        self.run_mopac(mol)
-        # Update the mol with the generated .pdb file.
-        ofile = mol._file.replace('.mol', '.pdb')
-        mol.update_from_pdb(ofile, conformer=conformer)
-
-    def run_mopac(self, mol, mopac_path, settings, timeout=7200):
-        name, ext = os.path.splitext(mol._file)
-        mop_file = f'{name}.mop'
-
-        logger.info(f'Running MOPAC on "{mol.name}".')
-
-        # To run MOPAC a command is issued to the console via
-        # ``subprocess.Popen``. The command is the full path of the
-        # ``mopac`` program.
-        file_root, ext = os.path.splitext(mop_file)
-        opt_cmd = [mopac_path, file_root]
-        opt_proc = psutil.Popen(opt_cmd,
-                                stdout=sp.PIPE,
-                                stderr=sp.STDOUT,
-                                universal_newlines=True)
+        if self._output_dir is None:
+            output_dir = str(uuid.uuid4().int)
+        else:
+            output_dir = self._output_dir
+        output_dir = os.path.abspath(output_dir)
 
-        try:
-            proc_out, _ = opt_proc.communicate(timeout=timeout)
-        except sp.TimeoutExpired:
-            logger.warning(
-                f'Minimization took too long and was terminated '
-                f'by force - {mol.name}'
-            )
-            self.kill_mopac(mol)
+        if os.path.exists(output_dir):
+            shutil.rmtree(output_dir)
+        os.mkdir(output_dir)
 
-        return
+        # MOPAC requires a ``.mop`` file as input.
+        self._write_mop(mol, os.path.join(output_dir, 'optimization.mop'))
+        if not self._run_mopac(mol, output_dir):
+            return
 
-    def kill_mopac(self, mol):
-        """
-        Kills an in-progress MOPAC run.
+        # The optimized structure is written to a ``.pdb`` file.
+        pdb = os.path.join(output_dir, 'optimization.pdb')
+        mol.set_position_matrix(_get_pdb_position_matrix(pdb))
 
-        To kill a MOPAC run, a file with the molecule's name and a
-        ``.end`` extension is written.
+    def _run_mopac(self, mol, output_dir):
+        """
+        Run MOPAC on the ``.mop`` file in `output_dir`.
 
         Parameters
         ----------
         mol : :class:`.Molecule`
             The molecule being optimized.
 
+        output_dir : :class:`str`
+            The path to the directory in which MOPAC is run.
+
         Returns
         -------
-        None : :class:`NoneType`
+        :class:`bool`
+            ``True`` if MOPAC finished before the timeout.
 
         """
 
-        name, ext = os.path.splitext(mol._file)
-        end_file = name + '.end'
-
-        with open(end_file, 'w') as end:
-            end.write('SHUT')
+        logger.info(f'Running MOPAC on {mol}.')
+        try:
+            get_subprocess_engine().run(
+                args=[self._mopac_path, 'optimization.mop'],
+                cwd=output_dir,
+                timeout=self._timeout
+            )
+        except SubprocessTimeoutError:
+            logger.warning(
+                f'Minimization took too long and was terminated '
+                f'by force - {mol}'
+            )
+            return False
+        return True
 
-    def mop_header(self):
+    def _get_mop_header(self):
         """
-        Returns the header of the ``.mop`` file.
+        Return the header of the ``.mop`` file.
 
         Returns
         -------
@@ -255,56 +209,73 @@ class MOPAC(Optimizer):
 
         """
 
-        if self.method == 'OPT':
-            grad = f'GNORM={self.minimum_gradient}'
+        if self._method == 'OPT':
+            grad = f'GNORM={self._minimum_gradient}'
         else:
             grad = ''
 
         return (
-            f'{self.hamiltonian} {self.method} {self.method} {grad} '
-            f'EPS={self.eps} CHARGE={self.charge} {self.fileout} LET '
+            f'{self._hamiltonian} {self._method} {grad} '
+            f'EPS={self._eps} CHARGE={self._charge} '
+            f'{self._fileout} LET '
         )
 
-    def generate_mop(self, mol, conformer):
+    def _write_mop(self, mol, path):
         """
-        Creates the ``.mop`` file for the optimization.
+        Write the ``.mop`` file for the optimization.
 
         Parameters
         ----------
         mol : :class:`.Molecule`
-            The molecule which is to be optimized. Its molecular
-            structure file is converted to a ``.mop`` file.
+            The molecule which is to be optimized.
 
-        conformer : :class:`int`
-            The conformer of the molecule to be used.
+        path : :class:`str`
+            The path of the ``.mop`` file.
 
         Returns
         -------
-        :class:`str`
-            The full path of the newly created ``.mop`` file.
+        None : :class:`NoneType`
 
         """
 
-        logger.info(f'Creating ".mop" file - {mol.name}.')
-        name, ext = os.path.splitext(mol._file)
-        mop_file = f'{name}.mop'
-
-        # Generate the mop file containing the MOPAC run info.
-        with open(mop_file, 'w') as mop:
-            # Line for the run info.
-            mop.write(f'{self.mop_header()}\n')
+        logger.info(f'Creating ".mop" file - {mol}.')
+        lines = [
+            f'{self._get_mop_header()}\n',
             # Line with the name of the molecule.
-            mop.write(f'{name}\n\n')
+            'optimization\n\n',
+        ]
+        for atom, (x, y, z) in zip(
+            mol.atoms,
+            mol.get_position_matrix()
+        ):
+            lines.append(
+                f'{atom.__class__.__name__}   '
+                f'{x}   +1  {y}   +1  {z}   +1 \n'
+            )
+
+        with open(path, 'w') as mop:
+            mop.write(''.join(lines))
+
+
+def _get_pdb_position_matrix(path):
+    """
+    Get the atomic positions in a ``.pdb`` file.
+
+    Parameters
+    ----------
+    path : :class:`str`
+        The path to the ``.pdb`` file.
 
-            # Write the structural info.
-            atom_block = ''
-            for i in range(mol.mol.GetNumAtoms()):
-                elem = mol.atom_symbol(i)
-                x, y, z = mol.atom_coords(i, conformer)
-                atom_block += (
-                    f'{elem}   {x}   +1  {y}   +1  {z}   +1 \n'
-                )
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        A ``(n, 3)`` array holding the position of each atom.
 
-            mop.write(atom_block)
+    """
 
-        return mop_file
+    with open(path, 'r') as f:
+        return np.array([
+            [float(line[30:38]), float(line[38:46]), float(line[46:54])]
+            for line in f
+            if line.startswith(('ATOM', 'HETATM'))
+        ])
@@ -83,19 +83,20 @@ virtual methods must be implemented.
 
 import logging
 import rdkit.Chem.AllChem as rdkit
-import warnings
 import os
-import subprocess as sp
 import uuid
 import shutil
+import shlex
+import hashlib
 from ...utilities import (
     is_valid_xtb_solvent,
     XTBInvalidSolventError,
     XTBExtractor
 )
-import pywindow
 
 from ..base_calculators import MoleculeCalculator, _MoleculeCalculator
+from ..calculator_cache import CalculatorCache
+from ..subprocess_engine import get_subprocess_engine
 
 
 logger = logging.getLogger(__name__)
@@ -124,6 +125,29 @@ class Optimizer(MoleculeCalculator):
 
         return self._cache_result(self._optimize, mol)
 
+    def optimize_batch(self, mols):
+        """
+        Optimize the molecules in `mols`.
+
+        By default, the molecules are optimized one at a time, but
+        optimizers which can run many molecules in one calculation,
+        such as :class:`.MacroModelForceField`, optimize them
+        together.
+
+        Parameters
+        ----------
+        mols : :class:`iterable` of :class:`.Molecule`
+            The molecules to be optimized.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        for mol in mols:
+            self.optimize(mol)
+
     def _optimize(self, mol):
         """
         Optimize `mol`.
@@ -154,7 +178,9 @@ class CageOptimizerSequence(_MoleculeCalculator, Optimizer):
 
     Before each :class:`Optimizer` in the sequence is applied to the
     cage, it is checked to see if it is collapsed. If it is
-    collapsed, the optimization sequence ends immediately.
+    collapsed, the optimization sequence ends immediately. A cage is
+    collapsed if :meth:`.Molecule.get_windows` does not find the
+    expected number of windows.
 
     Examples
     --------
@@ -183,7 +209,8 @@ class CageOptimizerSequence(_MoleculeCalculator, Optimizer):
         self,
         num_expected_windows,
         optimizers,
-        use_cache=False
+        use_cache=False,
+        probe_radius=0.
     ):
         """
         Initialize a :class:`CageOptimizerSequence` instance.
@@ -202,10 +229,15 @@ class CageOptimizerSequence(_MoleculeCalculator, Optimizer):
             If ``True`` :meth:`optimize` will not run twice on the same
             molecule.
 
+        probe_radius : :class:`float`, optional
+            The radius of the smallest sphere, which must be able to
+            pass through a window. See :meth:`.Molecule.get_windows`.
+
         """
 
         self._num_expected_windows = num_expected_windows
         self._optimizers = optimizers
+        self._probe_radius = probe_radius
         super().__init__(use_cache=use_cache)
 
     def _optimize(self, mol):
@@ -224,17 +256,10 @@ class CageOptimizerSequence(_MoleculeCalculator, Optimizer):
         """
 
         for optimizer in self._optimizers:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                loader = pywindow.molecular.Molecule.load_rdkit_mol
-                pw_molecule = loader(mol.to_rdkit_mol())
-                windows = pw_molecule.calculate_windows()
+            windows = mol.get_windows(self._probe_radius)
             logger.debug(f'Windows found: {windows}.')
 
-            if (
-                windows is None
-                or len(windows) != self._num_expected_windows
-            ):
+            if len(windows) != self._num_expected_windows:
                 logger.info(f'"{mol}" is collapsed, exiting early.')
                 return
 
@@ -426,18 +451,13 @@ class XTB(_MoleculeCalculator, Optimizer):
 
     Notes
     -----
-    When running :meth:`optimize`, this calculator changes the
-    present working directory with :func:`os.chdir`. The original
-    working directory will be restored even if an error is raised, so
-    unless multi-threading is being used this implementation detail
-    should not matter.
-
-    If multi-threading is being used an error could occur if two
-    different threads need to know about the current working directory
-    as :class:`.XTB` can change it from under them.
-
-    Note that this does not have any impact on multi-processing,
-    which should always be safe.
+    When running :meth:`optimize`, this calculator does not change
+    the present working directory. xTB is run with its working
+    directory set to the output directory and all files are accessed
+    by their absolute paths. This means that :meth:`optimize` can be
+    run in multiple threads at the same time, as long as each thread
+    uses a different output directory, which is the case if
+    `output_dir` is ``None``.
 
     Furthermore, :meth:`optimize` will check that the
     structure is adequately optimized by checking for negative
@@ -450,6 +470,17 @@ class XTB(_MoleculeCalculator, Optimizer):
     The presence of negative frequencies can occur even when the
     optimization has converged based on the given `opt_level`.
 
+    If `warm_start` is ``True``, the optimized coordinates and the
+    ``xtbrestart`` file of each completed optimization are kept. A
+    molecule with the same atoms, in the same order, and the same
+    bonds as a previously optimized molecule, such as a mutant or
+    offspring which is nearly identical to its parent, is then
+    optimized starting from the coordinates and charges of that
+    molecule, rather than from its own coordinates. The number of
+    cycles each optimization took is returned by
+    :meth:`get_num_cycles`, so that the cycles saved by warm starts
+    can be measured.
+
     Attributes
     ----------
     incomplete : :class:`set` of :class:`.Molecule`
@@ -532,12 +563,38 @@ class XTB(_MoleculeCalculator, Optimizer):
             if polymer not in optimizer.incomplete:
                 break
 
+    Warm starts are useful when many similar molecules are optimized,
+    as in an evolutionary algorithm
+
+    .. code-block:: python
+
+        xtb = stk.XTB(
+            xtb_path='/opt/gfnxtb/xtb',
+            unlimited_memory=True,
+            warm_start=True,
+            max_seeds=1000
+        )
+        xtb.optimize(polymer)
+
+        # The clone has the same atoms and bonds, so its optimization
+        # starts from the optimized structure of polymer.
+        clone = polymer.clone()
+        xtb.optimize(clone)
+        print(xtb.get_num_cycles(polymer), xtb.get_num_cycles(clone))
+
     References
     ----------
     .. [1] https://xtb-docs.readthedocs.io/en/latest/setup.html
 
     """
 
+    # These hold the results of earlier optimizations, used for warm
+    # starts, rather than parameters of the calculator.
+    _unkeyed_attributes = _MoleculeCalculator._unkeyed_attributes | {
+        '_seeds',
+        '_num_cycles',
+    }
+
     def __init__(
         self,
         xtb_path,
@@ -553,6 +610,8 @@ class XTB(_MoleculeCalculator, Optimizer):
         charge=0,
         num_unpaired_electrons=0,
         unlimited_memory=False,
+        warm_start=False,
+        max_seeds=None,
         use_cache=False
     ):
         """
@@ -624,6 +683,16 @@ class XTB(_MoleculeCalculator, Optimizer):
             encountered, this should be ``True``, however this may
             raise issues on clusters.
 
+        warm_start : :class:`bool`, optional
+            If ``True``, molecules with the same atoms and bonds as a
+            previously optimized molecule are optimized starting from
+            its optimized coordinates and ``xtbrestart`` file.
+
+        max_seeds : :class:`int`, optional
+            The maximum number of optimized molecules kept for warm
+            starts. The least recently used are discarded first. If
+            ``None``, the number is not limited.
+
         use_cache : :class:`bool`, optional
             If ``True`` :meth:`optimize` will not run twice on the same
             molecule.
@@ -665,9 +734,50 @@ class XTB(_MoleculeCalculator, Optimizer):
         self._charge = str(charge)
         self._num_unpaired_electrons = str(num_unpaired_electrons)
         self._unlimited_memory = unlimited_memory
+        self._warm_start = warm_start
+        # Maps the connectivity digest of each optimized molecule to
+        # its optimized position matrix and xtbrestart file.
+        self._seeds = CalculatorCache(max_size=max_seeds)
+        # Maps each optimized molecule to the number of cycles of
+        # each of its runs.
+        self._num_cycles = CalculatorCache(weak=True)
         self.incomplete = set()
         super().__init__(use_cache=use_cache)
 
+    def get_num_cores(self):
+        """
+        Return the number of cores used by a single optimization.
+
+        Returns
+        -------
+        :class:`int`
+            The number of cores xTB uses.
+
+        """
+
+        return int(self._num_cores)
+
+    def get_num_cycles(self, mol):
+        """
+        Return the number of cycles of the last optimization of `mol`.
+
+        Parameters
+        ----------
+        mol : :class:`.Molecule`
+            An optimized molecule.
+
+        Returns
+        -------
+        :class:`list` of :class:`int`
+            The number of geometry optimization cycles of each xTB
+            run, which is ``None`` for runs whose output holds no
+            cycle count. ``None`` is returned instead if `mol` has
+            not been optimized.
+
+        """
+
+        return self._num_cycles.get(mol)
+
     def _has_neg_frequencies(self, output_file):
         """
         Check for negative frequencies.
@@ -683,17 +793,23 @@ class XTB(_MoleculeCalculator, Optimizer):
             Returns ``True`` if a negative frequency is present.
 
         """
-        xtbext = XTBExtractor(output_file=output_file)
+        xtbext = XTBExtractor(
+            output_file=output_file,
+            properties=['frequencies']
+        )
         # Check for one negative frequency, excluding the first
         # 6 frequencies.
         return any(x < 0 for x in xtbext.frequencies[6:])
 
-    def _is_complete(self, output_file):
+    def _is_complete(self, output_dir, output_file):
         """
         Check if xTB optimization has completed and converged.
 
         Parameters
         ----------
+        output_dir : :class:`str`
+            The path to the directory in which xTB was run.
+
         output_file : :class:`str`
             Name of xTB output file.
 
@@ -715,7 +831,7 @@ class XTB(_MoleculeCalculator, Optimizer):
             # No simulation has been run.
             return False
         # If convergence is achieved, then .xtboptok should exist.
-        if os.path.exists('.xtboptok'):
+        if os.path.exists(os.path.join(output_dir, '.xtboptok')):
             # Check for negative frequencies in output file if the
             # hessian was calculated.
             # Return True if there exists at least one.
@@ -723,17 +839,20 @@ class XTB(_MoleculeCalculator, Optimizer):
                 return not self._has_neg_frequencies(output_file)
             else:
                 return True
-        elif os.path.exists('NOT_CONVERGED'):
+        elif os.path.exists(os.path.join(output_dir, 'NOT_CONVERGED')):
             raise XTBConvergenceError('Optimization not converged.')
         else:
             raise XTBOptimizerError('Optimization failed to complete')
 
-    def _run_xtb(self, xyz, out_file):
+    def _run_xtb(self, output_dir, xyz, out_file):
         """
         Run GFN-xTB.
 
         Parameters
         ----------
+        output_dir : :class:`str`
+            The path to the directory in which xTB is run.
+
         xyz : :class:`str`
             The name of the input structure ``.xyz`` file.
 
@@ -766,7 +885,7 @@ class XTB(_MoleculeCalculator, Optimizer):
             solvent = ''
 
         cmd = (
-            f'{memory} {self._xtb_path} {xyz} '
+            f'{memory} {self._xtb_path} {shlex.quote(xyz)} '
             f'--gfn {self._gfn_version} '
             f'{optimization} --parallel {self._num_cores} '
             f'--etemp {self._electronic_temperature} '
@@ -774,19 +893,17 @@ class XTB(_MoleculeCalculator, Optimizer):
             f'--uhf {self._num_unpaired_electrons}'
         )
 
-        with open(out_file, 'w') as f:
-            # Note that sp.call will hold the program until completion
-            # of the calculation.
-            sp.call(
-                cmd,
-                stdin=sp.PIPE,
-                stdout=f,
-                stderr=sp.PIPE,
-                # Shell is required to run complex arguments.
-                shell=True
-            )
+        # Note that this will hold the calling thread until completion
+        # of the calculation.
+        get_subprocess_engine().run(
+            args=cmd,
+            cwd=output_dir,
+            output_path=out_file,
+            # Shell is required to run complex arguments.
+            shell=True
+        )
 
-    def _run_optimizations(self, mol):
+    def _run_optimizations(self, mol, output_dir):
         """
         Run loop of optimizations on `mol` using xTB.
 
@@ -795,6 +912,9 @@ class XTB(_MoleculeCalculator, Optimizer):
         mol : :class:`.Molecule`
             The molecule to be optimized.
 
+        output_dir : :class:`str`
+            The path to the directory in which xTB is run.
+
         Returns
         -------
         :class:`bool`
@@ -802,16 +922,32 @@ class XTB(_MoleculeCalculator, Optimizer):
             ``False`` if the calculation is incomplete.
 
         """
+        num_cycles = []
+        self._num_cycles[mol] = num_cycles
         for run in range(self._max_runs):
-            xyz = f'input_structure_{run+1}.xyz'
-            out_file = f'optimization_{run+1}.output'
+            xyz = os.path.join(output_dir, f'input_structure_{run+1}.xyz')
+            out_file = os.path.join(
+                output_dir,
+                f'optimization_{run+1}.output'
+            )
             mol.write(xyz)
-            self._run_xtb(xyz=xyz, out_file=out_file)
+            self._run_xtb(
+                output_dir=output_dir,
+                xyz=xyz,
+                out_file=out_file
+            )
+            xtbext = XTBExtractor(
+                output_file=out_file,
+                properties=['num_optimization_cycles']
+            )
+            num_cycles.append(
+                getattr(xtbext, 'num_optimization_cycles', None)
+            )
             # Check if the optimization is complete.
-            coord_file = 'xtbhess.coord'
+            coord_file = os.path.join(output_dir, 'xtbhess.coord')
             coord_exists = os.path.exists(coord_file)
-            output_xyz = 'xtbopt.xyz'
-            opt_complete = self._is_complete(out_file)
+            output_xyz = os.path.join(output_dir, 'xtbopt.xyz')
+            opt_complete = self._is_complete(output_dir, out_file)
             if not opt_complete:
                 if coord_exists:
                     # The calculation is incomplete.
@@ -851,8 +987,7 @@ class XTB(_MoleculeCalculator, Optimizer):
         """
 
         # Remove mol from self.incomplete if present.
-        if mol in self.incomplete:
-            self.incomplete.remove(mol)
+        self.incomplete.discard(mol)
 
         if self._output_dir is None:
             output_dir = str(uuid.uuid4().int)
@@ -864,14 +999,61 @@ class XTB(_MoleculeCalculator, Optimizer):
             shutil.rmtree(output_dir)
 
         os.mkdir(output_dir)
-        init_dir = os.getcwd()
-        os.chdir(output_dir)
-
-        try:
-            complete = self._run_optimizations(mol)
-        finally:
-            os.chdir(init_dir)
+        restart_file = os.path.join(output_dir, 'xtbrestart')
+        if self._warm_start:
+            connectivity_digest = _get_connectivity_digest(mol)
+            seed = self._seeds.get(connectivity_digest)
+            if seed is not None:
+                position_matrix, restart = seed
+                mol.set_position_matrix(position_matrix)
+                # xTB reads the restart file from its working
+                # directory.
+                if restart is not None:
+                    with open(restart_file, 'wb') as f:
+                        f.write(restart)
+                logger.debug(f'Warm starting optimization of {mol}.')
+
+        complete = self._run_optimizations(mol, output_dir)
 
         if not complete:
             self.incomplete.add(mol)
             logging.warning(f'Optimization is incomplete for {mol}.')
+        elif self._warm_start:
+            restart = None
+            if os.path.exists(restart_file):
+                with open(restart_file, 'rb') as f:
+                    restart = f.read()
+            self._seeds[connectivity_digest] = (
+                mol.get_position_matrix(),
+                restart,
+            )
+
+
+def _get_connectivity_digest(mol):
+    """
+    Return a digest of the atoms and bonds of `mol`.
+
+    Molecules have the same digest if they have the same elements
+    in the same order, and the same bonds between them.
+
+    Parameters
+    ----------
+    mol : :class:`.Molecule`
+        The molecule.
+
+    Returns
+    -------
+    :class:`str`
+        The hexadecimal, 128-bit digest.
+
+    """
+
+    atoms = tuple(atom.atomic_number for atom in mol.atoms)
+    bonds = tuple(sorted(
+        (*sorted((bond.atom1.id, bond.atom2.id)), bond.order)
+        for bond in mol.bonds
+    ))
+    return hashlib.blake2b(
+        repr((atoms, bonds)).encode(),
+        digest_size=16
+    ).hexdigest()
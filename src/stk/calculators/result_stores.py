@@ -0,0 +1,271 @@
+"""
+Result Stores
+=============
+
+#. :class:`.SqliteResultStore`
+
+Result stores persist the results of :class:`.MoleculeCalculator`
+instances, such as optimized structures, energies and fitness values.
+Unlike the cache turned on with the `use_cache` option, which only
+lives as long as the calculator, results held by a result store are
+shared by any calculator with the same parameters, in any process
+and across separate runs.
+
+.. code-block:: python
+
+    import stk
+
+    store = stk.SqliteResultStore('results.db')
+    mmff = stk.MMFF().set_result_store(store)
+    energy = stk.MMFFEnergy().set_result_store(store)
+
+    bb = stk.BuildingBlock('NCCN')
+    # Runs the optimization and the energy calculation and saves
+    # the results.
+    mmff.optimize(bb)
+    energy.get_energy(bb)
+
+    # In a later run, the same calls do not recalculate anything.
+    # The optimized structure is loaded from the store instead.
+    bb = stk.BuildingBlock('NCCN')
+    mmff.optimize(bb)
+    energy.get_energy(bb)
+
+Results are stored by the class and parameters of the calculator,
+the identity key of the molecule and the position matrix of the
+molecule at the time the calculator is used. If a calculator has a
+parameter whose value cannot be saved in a way which is the same
+across runs, for example an object whose :func:`repr` holds its
+memory address, the calculator does not use its result store.
+
+Parameters which are functions, such as the `fitness_fn` of a
+:class:`.FitnessFunction`, are represented by their code, default
+values and closure. The global variables they use and the other
+functions they call are not part of the representation. If these are
+changed between runs, results calculated before the change are still
+loaded from the store. In this case, use a new result store, or
+delete the old one.
+
+.. _`adding result stores`:
+
+Making New Result Stores
+------------------------
+
+New result stores can be made by simply making a class which
+inherits the :class:`.ResultStore` class. This is an abstract base
+class and its virtual methods must be implemented.
+
+"""
+
+import os
+import pickle
+import sqlite3
+import logging
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResultStore:
+    """
+    An abstract base class for result stores.
+
+    """
+
+    def get(self, key, default=None):
+        """
+        Return a stored result.
+
+        Parameters
+        ----------
+        key : :class:`tuple` of :class:`str`
+            A :class:`tuple` of the form ``(calculator_key,
+            molecule_key, coordinates_key)``.
+
+        default : :class:`object`, optional
+            Returned if `key` is not in the store.
+
+        Returns
+        -------
+        :class:`object`
+            The result stored with `key`, or `default`.
+
+        Raises
+        ------
+        :class:`NotImplementedError`
+            This is a virtual method and needs to be implemented in a
+            subclass.
+
+        """
+
+        raise NotImplementedError()
+
+    def put(self, key, value):
+        """
+        Store a result.
+
+        Parameters
+        ----------
+        key : :class:`tuple` of :class:`str`
+            A :class:`tuple` of the form ``(calculator_key,
+            molecule_key, coordinates_key)``.
+
+        value : :class:`object`
+            The result. It must be picklable.
+
+        Returns
+        -------
+        :class:`.ResultStore`
+            The result store.
+
+        Raises
+        ------
+        :class:`NotImplementedError`
+            This is a virtual method and needs to be implemented in a
+            subclass.
+
+        """
+
+        raise NotImplementedError()
+
+
+class SqliteResultStore(ResultStore):
+    """
+    Stores results in an SQLite database.
+
+    The database can be used by multiple processes and threads at
+    the same time, which means that results calculated in the worker
+    processes or threads of a :class:`.Population` are saved too.
+
+    """
+
+    def __init__(self, path, timeout=60):
+        """
+        Initialize a :class:`SqliteResultStore`.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The path to the database file. It is created if it does
+            not exist.
+
+        timeout : :class:`float`, optional
+            The number of seconds to wait for another process to
+            finish writing to the database.
+
+        """
+
+        self._path = os.path.abspath(path)
+        self._timeout = timeout
+        # Each thread makes its own connection lazily, because
+        # connections cannot be shared between processes or threads.
+        self._local = threading.local()
+
+    def _get_connection(self):
+        """
+        Return a connection to the database of the current thread.
+
+        Returns
+        -------
+        :class:`sqlite3.Connection`
+            The connection.
+
+        """
+
+        connection = getattr(self._local, 'connection', None)
+        # A forked process inherits the connection of the thread
+        # which forked it.
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(
+                database=self._path,
+                timeout=self._timeout,
+                isolation_level=None
+            )
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                'calculator TEXT, '
+                'molecule TEXT, '
+                'coordinates TEXT, '
+                'value BLOB, '
+                'PRIMARY KEY (calculator, molecule, coordinates))'
+            )
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key, default=None):
+        """
+        Return a stored result.
+
+        Parameters
+        ----------
+        key : :class:`tuple` of :class:`str`
+            A :class:`tuple` of the form ``(calculator_key,
+            molecule_key, coordinates_key)``.
+
+        default : :class:`object`, optional
+            Returned if `key` is not in the store.
+
+        Returns
+        -------
+        :class:`object`
+            The result stored with `key`, or `default`.
+
+        """
+
+        row = self._get_connection().execute(
+            'SELECT value FROM results '
+            'WHERE calculator=? AND molecule=? AND coordinates=?',
+            key
+        ).fetchone()
+        if row is None:
+            return default
+        return pickle.loads(row[0])
+
+    def put(self, key, value):
+        """
+        Store a result.
+
+        Parameters
+        ----------
+        key : :class:`tuple` of :class:`str`
+            A :class:`tuple` of the form ``(calculator_key,
+            molecule_key, coordinates_key)``.
+
+        value : :class:`object`
+            The result. It must be picklable.
+
+        Returns
+        -------
+        :class:`.SqliteResultStore`
+            The result store.
+
+        """
+
+        self._get_connection().execute(
+            'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)',
+            (*key, pickle.dumps(value))
+        )
+        return self
+
+    def __len__(self):
+        return self._get_connection().execute(
+            'SELECT COUNT(*) FROM results'
+        ).fetchone()[0]
+
+    def __getstate__(self):
+        state = dict(vars(self))
+        del state['_local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._path!r})'
@@ -0,0 +1,493 @@
+"""
+Subprocess Engine
+=================
+
+Calculators which use external programs, such as :class:`.XTB`,
+:class:`.XTBEnergy`, :class:`.MacroModelForceField`,
+:class:`.MacroModelMD` and :class:`.MOPAC`, run them through a
+:class:`.SubprocessEngine`. The engine launches and monitors every
+program from a single :mod:`asyncio` event loop, which runs in a
+background thread. A calculator waiting for its program to finish
+therefore only blocks its own thread, and no Python process is
+needed per running program.
+
+This means that many calculations can be in flight at the same time
+when a :class:`.Population` is optimized with threads
+
+.. code-block:: python
+
+    import stk
+
+    # Run at most 200 xTB jobs at the same time and stop any job
+    # which takes longer than an hour.
+    stk.set_subprocess_engine(
+        stk.SubprocessEngine(max_jobs=200, timeout=3600)
+    )
+
+    xtb = stk.XTB('/opt/xtb/xtb', unlimited_memory=True)
+    pop = stk.Population(...)
+    pop.optimize(xtb, num_threads=200, num_cores=200)
+
+Coroutines can also use the engine directly
+
+.. code-block:: python
+
+    import asyncio
+
+    async def run_all(commands):
+        engine = stk.get_subprocess_engine()
+        return await asyncio.gather(*(
+            engine.run_async(command) for command in commands
+        ))
+
+"""
+
+import os
+import signal
+import asyncio
+import threading
+import subprocess as sp
+from functools import partial
+
+
+class SubprocessTimeoutError(Exception):
+    ...
+
+
+class SubprocessEngine:
+    """
+    Runs external programs from a single :mod:`asyncio` event loop.
+
+    :meth:`run_async` is a coroutine which can be awaited from any
+    event loop. :meth:`run` is its synchronous wrapper, which can be
+    called from any thread and blocks only that thread until the
+    program finishes. Either way, the program is started and
+    monitored by the event loop of the engine.
+
+    """
+
+    def __init__(self, max_jobs=None, timeout=None):
+        """
+        Initialize a :class:`SubprocessEngine`.
+
+        Parameters
+        ----------
+        max_jobs : :class:`int`, optional
+            The largest number of programs which run at the same
+            time. Programs started once the limit is reached wait for
+            another program to finish. If ``None``, the number is not
+            limited.
+
+        timeout : :class:`float`, optional
+            The default number of seconds a program is allowed to run
+            before it is killed. If ``None``, programs are not killed.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `max_jobs` is smaller than ``1``.
+
+        """
+
+        if max_jobs is not None and max_jobs < 1:
+            raise ValueError('max_jobs must be at least 1.')
+
+        self._max_jobs = max_jobs
+        self._timeout = timeout
+        # The event loop is made lazily, because it cannot be shared
+        # between processes.
+        self._loop = None
+        self._semaphore = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _get_loop(self):
+        """
+        Return the event loop of the current process.
+
+        The event loop is started in a background thread the first
+        time it is needed.
+
+        Returns
+        -------
+        :class:`asyncio.AbstractEventLoop`
+            The event loop.
+
+        """
+
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name='SubprocessEngine',
+                    daemon=True,
+                )
+                thread.start()
+                self._loop = loop
+                self._semaphore = None
+                self._pid = os.getpid()
+            return self._loop
+
+    def _get_semaphore(self):
+        """
+        Return the semaphore which limits the number of programs.
+
+        Returns
+        -------
+        :class:`asyncio.Semaphore`
+            The semaphore, or ``None`` if the number of programs is
+            not limited.
+
+        """
+
+        if self._max_jobs is None:
+            return None
+        # Only called from the event loop, so no lock is needed.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_jobs)
+        return self._semaphore
+
+    async def run_async(
+        self,
+        args,
+        cwd=None,
+        output_path=None,
+        timeout=None,
+        shell=False,
+        cores=None,
+    ):
+        """
+        Run a program.
+
+        Parameters
+        ----------
+        args : :class:`list` of :class:`str` or :class:`str`
+            The program and its arguments. If `shell` is ``True``,
+            a :class:`str` holding the shell command.
+
+        cwd : :class:`str`, optional
+            The working directory of the program. If ``None``, the
+            present working directory is used.
+
+        output_path : :class:`str`, optional
+            The path to a file into which the standard output of the
+            program is written. If ``None``, the standard output and
+            standard error of the program are returned instead.
+
+        timeout : :class:`float`, optional
+            The number of seconds the program is allowed to run
+            before it is killed. If ``None``, the default timeout of
+            the engine is used.
+
+        shell : :class:`bool`, optional
+            If ``True``, `args` is run by the shell.
+
+        cores : :class:`iterable` of :class:`int`, optional
+            The ids of the cores the program is allowed to run on. If
+            ``None``, the program is allowed to run on the same cores
+            as the calling thread, for example the cores a job was
+            pinned to by :meth:`.Population.optimize`.
+
+        Returns
+        -------
+        :class:`str`
+            The output of the program, or an empty :class:`str` if
+            `output_path` is used.
+
+        Raises
+        ------
+        :class:`SubprocessTimeoutError`
+            If the program ran longer than the timeout.
+
+        """
+
+        coroutine = self._run_limited(
+            args=args,
+            cwd=cwd,
+            output_path=output_path,
+            timeout=timeout,
+            shell=shell,
+            cores=_get_cores(cores),
+        )
+        loop = self._get_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coroutine
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coroutine, loop)
+        )
+
+    async def _run_limited(
+        self,
+        args,
+        cwd,
+        output_path,
+        timeout,
+        shell,
+        cores,
+    ):
+        if timeout is None:
+            timeout = self._timeout
+
+        semaphore = self._get_semaphore()
+        if semaphore is None:
+            return await self._run(
+                args, cwd, output_path, timeout, shell, cores
+            )
+        async with semaphore:
+            return await self._run(
+                args, cwd, output_path, timeout, shell, cores
+            )
+
+    async def _run(self, args, cwd, output_path, timeout, shell, cores):
+        output_file = None
+        if output_path is None:
+            stdout, stderr = sp.PIPE, sp.STDOUT
+        else:
+            output_file = open(output_path, 'w')
+            stdout, stderr = output_file, sp.DEVNULL
+
+        # Start a new session, so that the program and any process
+        # it starts can be killed together.
+        kwargs = dict(
+            stdin=sp.DEVNULL,
+            stdout=stdout,
+            stderr=stderr,
+            cwd=cwd,
+            start_new_session=True,
+        )
+        # The program is started by the thread of the event loop, so
+        # it would inherit the affinity of that thread, rather than
+        # that of the thread which asked for it to be run.
+        if cores is not None:
+            kwargs['preexec_fn'] = partial(os.sched_setaffinity, 0, cores)
+        try:
+            if shell:
+                process = await asyncio.create_subprocess_shell(
+                    args,
+                    **kwargs
+                )
+            else:
+                process = await asyncio.create_subprocess_exec(
+                    *args,
+                    **kwargs
+                )
+
+            try:
+                output, _ = await asyncio.wait_for(
+                    process.communicate(),
+                    timeout
+                )
+            except asyncio.TimeoutError:
+                _kill(process)
+                await process.wait()
+                raise SubprocessTimeoutError(
+                    f'{args!r} ran longer than {timeout} seconds.'
+                )
+        finally:
+            if output_file is not None:
+                output_file.close()
+
+        if output is None:
+            return ''
+        return output.decode(errors='replace')
+
+    def run(
+        self,
+        args,
+        cwd=None,
+        output_path=None,
+        timeout=None,
+        shell=False,
+        cores=None,
+    ):
+        """
+        Run a program and wait for it to finish.
+
+        This is a synchronous wrapper of :meth:`run_async`. It must
+        not be called from the event loop of the engine.
+
+        Parameters
+        ----------
+        args : :class:`list` of :class:`str` or :class:`str`
+            The program and its arguments. If `shell` is ``True``,
+            a :class:`str` holding the shell command.
+
+        cwd : :class:`str`, optional
+            The working directory of the program. If ``None``, the
+            present working directory is used.
+
+        output_path : :class:`str`, optional
+            The path to a file into which the standard output of the
+            program is written. If ``None``, the standard output and
+            standard error of the program are returned instead.
+
+        timeout : :class:`float`, optional
+            The number of seconds the program is allowed to run
+            before it is killed. If ``None``, the default timeout of
+            the engine is used.
+
+        shell : :class:`bool`, optional
+            If ``True``, `args` is run by the shell.
+
+        cores : :class:`iterable` of :class:`int`, optional
+            The ids of the cores the program is allowed to run on. If
+            ``None``, the program is allowed to run on the same cores
+            as the calling thread, for example the cores a job was
+            pinned to by :meth:`.Population.optimize`.
+
+        Returns
+        -------
+        :class:`str`
+            The output of the program, or an empty :class:`str` if
+            `output_path` is used.
+
+        Raises
+        ------
+        :class:`SubprocessTimeoutError`
+            If the program ran longer than the timeout.
+
+        """
+
+        future = asyncio.run_coroutine_threadsafe(
+            coro=self._run_limited(
+                args=args,
+                cwd=cwd,
+                output_path=output_path,
+                timeout=timeout,
+                shell=shell,
+                cores=_get_cores(cores),
+            ),
+            loop=self._get_loop(),
+        )
+        return future.result()
+
+    def close(self):
+        """
+        Stop the event loop of the engine.
+
+        The engine starts a new event loop if it is used again.
+
+        Returns
+        -------
+        :class:`.SubprocessEngine`
+            The engine.
+
+        """
+
+        with self._lock:
+            if self._loop is not None and self._pid == os.getpid():
+                self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+            self._semaphore = None
+            self._pid = None
+        return self
+
+    def __getstate__(self):
+        state = dict(vars(self))
+        state['_loop'] = None
+        state['_semaphore'] = None
+        state['_pid'] = None
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return (
+            f'{self.__class__.__name__}('
+            f'max_jobs={self._max_jobs!r}, '
+            f'timeout={self._timeout!r})'
+        )
+
+
+def _kill(process):
+    """
+    Kill a program and any process it started.
+
+    Parameters
+    ----------
+    process : :class:`asyncio.subprocess.Process`
+        The program.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    try:
+        if hasattr(os, 'killpg'):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        # The program finished in the meantime.
+        pass
+
+
+def _get_cores(cores):
+    """
+    Return the cores a program is allowed to run on.
+
+    Parameters
+    ----------
+    cores : :class:`iterable` of :class:`int`
+        The ids of the cores. If ``None``, the cores of the calling
+        thread are used.
+
+    Returns
+    -------
+    :class:`set` of :class:`int`
+        The ids of the cores, or ``None`` if the platform does not
+        support setting them.
+
+    """
+
+    if not hasattr(os, 'sched_setaffinity'):
+        return None
+    if cores is None:
+        # On Linux, this is the affinity of the calling thread.
+        return os.sched_getaffinity(0)
+    return set(cores)
+
+
+_engine = SubprocessEngine()
+
+
+def get_subprocess_engine():
+    """
+    Return the engine used by calculators to run external programs.
+
+    Returns
+    -------
+    :class:`.SubprocessEngine`
+        The engine.
+
+    """
+
+    return _engine
+
+
+def set_subprocess_engine(engine):
+    """
+    Set the engine used by calculators to run external programs.
+
+    Parameters
+    ----------
+    engine : :class:`.SubprocessEngine`
+        The engine.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    global _engine
+    _engine = engine
@@ -208,7 +208,12 @@ class EAHistory:
 
     def pop_log_content(self, pop, underline, fitness_values):
         for i, mol in enumerate(pop, 1):
-            fitness = self.fitness_calculator._cache[mol]
+            # The fitness value may have been evicted from a bounded
+            # cache, see MoleculeCalculator.set_cache_policy().
+            fitness = self.fitness_calculator._get_cached_value(
+                mol=mol,
+                default=None
+            )
             yield (
                 f'{i:<10}\t{mol}\t\t{fitness!r:<40}\t'
                 f'{fitness_values[mol]}\n{underline}'
@@ -240,7 +245,13 @@ def ea_run(filename, input_file):
     if hasattr(input_file, 'fitness_normalizer'):
         fitness_normalizer = input_file.fitness_normalizer
 
-    num_processes = psutil.cpu_count()
+    # Each process may run a calculator which uses multiple cores,
+    # so only create as many processes as the cores can run at once.
+    num_cores = max(
+        stk.populations._get_num_cores(optimizer),
+        stk.populations._get_num_cores(fitness_calculator),
+    )
+    num_processes = max(psutil.cpu_count() // num_cores, 1)
     if hasattr(input_file, 'num_processes'):
         num_processes = input_file.num_processes
 
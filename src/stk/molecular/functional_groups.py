@@ -56,11 +56,57 @@ does not.
 """
 
 import rdkit.Chem.AllChem as rdkit
+import threading
 from collections import Counter
 
 from ..utilities import flatten
 
 
+# Maps the SMARTS of an FGType and the graph of a molecule to the ids
+# of the atoms in each functional group it matches. Each value is a
+# tuple holding a tuple of the form (atom_ids, bonder_ids, deleter_ids)
+# for each functional group. It lives outside of FGType so that it is
+# not pickled with every FunctionalGroup.
+_matches = {}
+
+# The maximum number of molecule graphs held in _matches. Once it is
+# reached, the oldest entries are removed first.
+_max_matches = 10000
+
+# Guards _matches, so that functional groups can be found in multiple
+# threads at the same time.
+_matches_lock = threading.Lock()
+
+
+def _get_graph_key(mol):
+    """
+    Return a key, which is the same for molecules with the same graph.
+
+    Unlike an identity key, the key accounts for the order of the
+    atoms, so that atom ids matched in one molecule can be reused by
+    any molecule with the same key.
+
+    Parameters
+    ----------
+    mol : :class:`.Molecule`
+        The molecule.
+
+    Returns
+    -------
+    :class:`tuple`
+        The key.
+
+    """
+
+    return (
+        tuple((atom.atomic_number, atom.charge) for atom in mol.atoms),
+        tuple(
+            (bond.atom1.id, bond.atom2.id, bond.order)
+            for bond in mol.bonds
+        ),
+    )
+
+
 class FGType:
     """
     Creates :class:`.FunctionalGroup` instances.
@@ -110,6 +156,11 @@ class FGType:
         """
 
         self.name = name
+        self._smarts = (
+            func_group_smarts,
+            tuple(bonder_smarts),
+            tuple(deleter_smarts),
+        )
         self._func_group = rdkit.MolFromSmarts(func_group_smarts)
         self._bonders = [
             (rdkit.MolFromSmarts(smarts), count)
@@ -124,6 +175,10 @@ class FGType:
         """
         Yield the functional groups in `mol`.
 
+        The ids of the matched atoms are cached, so that molecules with
+        the same atoms and bonds, in the same order, are only matched
+        with :mod:`rdkit` once.
+
         Parameters
         ----------
         mol : :class:`.Molecule`
@@ -155,6 +210,42 @@ class FGType:
 
         """
 
+        key = self._smarts, _get_graph_key(mol)
+        with _matches_lock:
+            matches = _matches.get(key)
+        if matches is None:
+            matches = tuple(self._get_matches(mol))
+            with _matches_lock:
+                while len(_matches) >= _max_matches:
+                    del _matches[next(iter(_matches))]
+                _matches[key] = matches
+
+        for fg, fg_bonders, fg_deleters in matches:
+            yield FunctionalGroup(
+                atoms=tuple(mol.atoms[id_] for id_ in fg),
+                bonders=tuple(mol.atoms[id_] for id_ in fg_bonders),
+                deleters=tuple(mol.atoms[id_] for id_ in fg_deleters),
+                fg_type=self
+            )
+
+    def _get_matches(self, mol):
+        """
+        Yield the atom ids of the functional groups in `mol`.
+
+        Parameters
+        ----------
+        mol : :class:`.Molecule`
+            The molecule which is to have functional groups
+            identified.
+
+        Yields
+        ------
+        :class:`tuple`
+            For each functional group, a :class:`tuple` of the form
+            ``(atom_ids, bonder_ids, deleter_ids)``.
+
+        """
+
         rdkit_mol = mol.to_rdkit_mol()
         rdkit.SanitizeMol(rdkit_mol)
 
@@ -191,14 +282,12 @@ class FGType:
             for fg_id, fg in enumerate(func_groups):
                 deleters[fg_id].extend(matched_deleters[fg_id][:count])
 
-        for atom_ids in zip(func_groups, bonders, deleters):
-            fg, fg_bonders, fg_deleters = atom_ids
-            yield FunctionalGroup(
-                atoms=tuple(mol.atoms[id_] for id_ in fg),
-                bonders=tuple(mol.atoms[id_] for id_ in fg_bonders),
-                deleters=tuple(mol.atoms[id_] for id_ in fg_deleters),
-                fg_type=self
-            )
+        for fg, fg_bonders, fg_deleters in zip(
+            func_groups,
+            bonders,
+            deleters
+        ):
+            yield tuple(fg), tuple(fg_bonders), tuple(fg_deleters)
 
     def __repr__(self):
         func_group_smarts = rdkit.MolToSmarts(self._func_group)
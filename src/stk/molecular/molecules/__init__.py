@@ -1,3 +1,4 @@
+from .molecule_cache import *
 from .molecule import *
 from .building_block import *
 from .constructed_molecule import *
@@ -7,6 +7,7 @@ Building Block
 
 import logging
 import os
+import sys
 import numpy as np
 import itertools as it
 import rdkit.Chem.AllChem as rdkit
@@ -18,7 +19,7 @@ from .. import elements
 from ..elements import Atom
 from .. import bonds
 from ..bonds import Bond
-from .molecule import Molecule
+from .molecule import Molecule, _get_identity_digest
 from ..functional_groups import fg_types
 from ...utilities import vector_angle, dedupe, remake
 
@@ -154,17 +155,20 @@ class BuildingBlock(Molecule):
             mol=mol,
             functional_groups=functional_groups
         )
-        if use_cache and identity_key in cls._cache:
-            return cls._cache[identity_key]
+        identity_digest = _get_identity_digest(identity_key)
+        cached = cls._cache.get(identity_digest) if use_cache else None
+        if cached is not None:
+            return cached
 
         rdkit.Kekulize(mol)
         obj._init_from_rdkit_mol(
             mol=mol,
             functional_groups=functional_groups,
-            identity_key=identity_key
+            identity_key=identity_key,
+            identity_digest=identity_digest
         )
         if use_cache:
-            cls._cache[identity_key] = obj
+            cls._cache[identity_digest] = obj
         return obj
 
     @classmethod
@@ -376,19 +380,22 @@ class BuildingBlock(Molecule):
             mol=mol,
             functional_groups=functional_groups
         )
-        if use_cache and key in cls._cache:
-            return cls._cache[key]
+        digest = _get_identity_digest(key)
+        cached = cls._cache.get(digest) if use_cache else None
+        if cached is not None:
+            return cached
 
         bb = cls.__new__(cls)
         cls._init_from_rdkit_mol(
             self=bb,
             mol=mol,
             functional_groups=functional_groups,
-            identity_key=key
+            identity_key=key,
+            identity_digest=digest
         )
 
         if use_cache:
-            cls._cache[key] = bb
+            cls._cache[digest] = bb
 
         return bb
 
@@ -396,7 +403,8 @@ class BuildingBlock(Molecule):
         self,
         mol,
         functional_groups,
-        identity_key
+        identity_key,
+        identity_digest
     ):
         """
         Initialize from an :mod:`rdkit` molecule.
@@ -414,6 +422,9 @@ class BuildingBlock(Molecule):
         identity_key : :class:`tuple`
             The identity key of the molecule.
 
+        identity_digest : :class:`str`
+            The digest of `identity_key`.
+
         Returns
         -------
         None : :class:`NoneType`
@@ -437,7 +448,13 @@ class BuildingBlock(Molecule):
         )
         position_matrix = mol.GetConformer().GetPositions()
 
-        super().__init__(atoms, bonds, position_matrix, identity_key)
+        super().__init__(
+            atoms=atoms,
+            bonds=bonds,
+            position_matrix=position_matrix,
+            identity_key=identity_key,
+            identity_digest=identity_digest
+        )
 
         fg_makers = (fg_types[name] for name in functional_groups)
         self.func_groups = tuple(
@@ -472,15 +489,22 @@ class BuildingBlock(Molecule):
         """
 
         d = dict(mol_dict)
-        identity_key = eval(d.pop('identity_key'))
-        if use_cache and identity_key in cls._cache:
-            return cls._cache[identity_key]
+        identity_key = d.pop('identity_key')
+        # Dumps made before identity digests were added lack them.
+        identity_digest = sys.intern(
+            d.pop('identity_digest', None)
+            or _get_identity_digest(identity_key)
+        )
+        cached = cls._cache.get(identity_digest) if use_cache else None
+        if cached is not None:
+            return cached
 
         d.pop('class')
         functional_groups = d.pop('func_groups')
 
         obj = cls.__new__(cls)
-        obj._identity_key = identity_key
+        obj._identity_key = eval(identity_key)
+        obj._identity_digest = identity_digest
         obj._position_matrix = np.array(d.pop('position_matrix')).T
         # If the cache is not being used, make sure to update all the
         # atoms and attributes to those in the dict.
@@ -500,7 +524,7 @@ class BuildingBlock(Molecule):
             setattr(obj, attr, eval(val))
 
         if use_cache:
-            cls._cache[identity_key] = obj
+            cls._cache[identity_digest] = obj
         return obj
 
     def clone(self):
@@ -859,7 +883,8 @@ class BuildingBlock(Molecule):
             'position_matrix': self.get_position_matrix().tolist(),
             'atoms': repr(self.atoms),
             'bonds': repr(bonds),
-            'identity_key': repr(self._identity_key)
+            'identity_key': repr(self._identity_key),
+            'identity_digest': self._identity_digest,
         }
 
         if ignore_missing_attrs:
@@ -5,11 +5,13 @@ Constructed Molecule
 """
 
 import logging
+import sys
 import numpy as np
 from collections import Counter
+from scipy.spatial import cKDTree
 
 from .. import elements, bonds, topology_graphs
-from .molecule import Molecule
+from .molecule import Molecule, _get_identity_digest
 from ..functional_groups import FunctionalGroup, fg_types
 
 logger = logging.getLogger(__name__)
@@ -145,6 +147,52 @@ class ConstructedMolecule(Molecule):
             }
         )
 
+    *Reusing the structure of another molecule*
+
+    If a molecule differs from an existing one only by some of its
+    building blocks, the existing molecule can be passed as `parent`.
+    Only the new building blocks are then placed, while the
+    remaining atoms keep their positions in `parent`, even if it was
+    optimized
+
+    .. code-block:: python
+
+        bb5 = stk.BuildingBlock('NCCCCN', ['amine'])
+        cage3 = stk.ConstructedMolecule(
+            building_blocks=[bb5, bb2],
+            topology_graph=tetrahedron,
+            parent=cage1
+        )
+
+    *Deferring construction*
+
+    If many molecules are made, but only some of them are used,
+    construction can be deferred until the structure of a molecule is
+    first needed
+
+    .. code-block:: python
+
+        cage4 = stk.ConstructedMolecule(
+            building_blocks=[bb5, bb2],
+            topology_graph=tetrahedron,
+            lazy=True
+        )
+        # The identity key does not need the structure.
+        key = cage4.get_identity_key()
+        # Accessing the atoms constructs the molecule.
+        atoms = cage4.atoms
+
+    *Detecting clashes*
+
+    Building blocks placed by a topology graph can interpenetrate.
+    Such molecules can be found before they are optimized
+
+    .. code-block:: python
+
+        if cage1.has_clashes(clash_distance=1.2):
+            for atom1_id, atom2_id, distance in cage1.get_clashes(1.2):
+                print(atom1_id, atom2_id, distance)
+
     *Building blocks with the wrong number of functional groups.*
 
     If the building block has too many functional groups, you can
@@ -171,13 +219,29 @@ class ConstructedMolecule(Molecule):
 
     """
 
+    # The attributes which are added when the structure of the
+    # molecule is constructed. Accessing any of them on a lazy
+    # molecule constructs it.
+    _structural_attributes = frozenset({
+        'atoms',
+        'bonds',
+        'construction_bonds',
+        'func_groups',
+        'building_block_counter',
+        '_position_matrix',
+        'num_windows',
+        'num_window_types',
+    })
+
     @classmethod
     def _construct(
         cls,
         building_blocks,
         topology_graph,
         building_block_vertices=None,
-        use_cache=False
+        use_cache=False,
+        parent=None,
+        lazy=False
     ):
         if building_block_vertices is None:
             building_block_vertices = (
@@ -190,17 +254,22 @@ class ConstructedMolecule(Molecule):
             topology_graph=topology_graph,
             building_block_vertices=building_block_vertices
         )
-        if use_cache and identity_key in cls._cache:
-            return cls._cache[identity_key]
+        identity_digest = _get_identity_digest(identity_key)
+        cached = cls._cache.get(identity_digest) if use_cache else None
+        if cached is not None:
+            return cached
 
         obj = cls._init_from_components(
             building_blocks=building_blocks,
             topology_graph=topology_graph,
             building_block_vertices=building_block_vertices,
-            identity_key=identity_key
+            identity_key=identity_key,
+            identity_digest=identity_digest,
+            parent=parent,
+            lazy=lazy
         )
         if use_cache:
-            cls._cache[identity_key] = obj
+            cls._cache[identity_digest] = obj
         return obj
 
     def __init__(
@@ -208,7 +277,9 @@ class ConstructedMolecule(Molecule):
         building_blocks,
         topology_graph,
         building_block_vertices=None,
-        use_cache=False
+        use_cache=False,
+        parent=None,
+        lazy=False
     ):
         """
         Initialize a :class:`ConstructedMolecule`.
@@ -246,6 +317,20 @@ class ConstructedMolecule(Molecule):
             and a cached, identical :class:`ConstructedMolecule` does
             not yet exist the created one will be added to the cache.
 
+        parent : :class:`ConstructedMolecule`, optional
+            A molecule with the same topology graph, from which
+            the positions of building blocks are taken. Building
+            blocks are only placed on vertices, which hold a different
+            building block in `parent`. See
+            :meth:`.TopologyGraph.construct`.
+
+        lazy : :class:`bool`, optional
+            If ``True``, the structure of the molecule is not
+            constructed until an attribute holding it, such as
+            :attr:`atoms` or :attr:`bonds`, or a method using it
+            is first accessed. The identity key is still available
+            straight away.
+
         """
 
         # This method does not get called, See _construct().
@@ -257,7 +342,10 @@ class ConstructedMolecule(Molecule):
         building_blocks,
         topology_graph,
         building_block_vertices,
-        identity_key
+        identity_key,
+        identity_digest,
+        parent=None,
+        lazy=False
     ):
         """
         Initialize a :class:`ConstructedMolecule`.
@@ -291,6 +379,17 @@ class ConstructedMolecule(Molecule):
             The identity key of the molecule. The identity key wil be
             equal for two molecules which ``stk`` sees as identical.
 
+        identity_digest : :class:`str`
+            The digest of `identity_key`.
+
+        parent : :class:`ConstructedMolecule`, optional
+            A molecule with the same topology graph, from which
+            the positions of building blocks are taken.
+
+        lazy : :class:`bool`, optional
+            If ``True``, construction is deferred until the structure
+            is first accessed.
+
         Returns
         -------
         :class:`.ConstructedMolecule`
@@ -300,19 +399,57 @@ class ConstructedMolecule(Molecule):
 
         obj = cls.__new__(cls)
         obj._identity_key = identity_key
+        obj._identity_digest = identity_digest
         obj.building_block_vertices = building_block_vertices
         obj.topology_graph = topology_graph
-        obj.atoms = []
-        obj.bonds = []
-        obj.construction_bonds = []
-        obj.func_groups = []
-        obj.building_block_counter = Counter()
+        if lazy:
+            # Construction is done by __getattr__(), the first time a
+            # structural attribute is accessed.
+            obj._lazy_components = (building_blocks, parent)
+        else:
+            obj._construct_structure(building_blocks, parent)
+        return obj
+
+    def _construct_structure(self, building_blocks, parent):
+        """
+        Construct the structure of the molecule.
+
+        Parameters
+        ----------
+        building_blocks : :class:`list` of :class:`.Molecule`
+            The :class:`.BuildingBlock` and
+            :class:`ConstructedMolecule` instances which
+            represent the building block molecules used for
+            construction.
+
+        parent : :class:`ConstructedMolecule`
+            A molecule with the same topology graph, from which
+            the positions of building blocks are taken. Can be
+            ``None``.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        Raises
+        ------
+        :class:`ConstructionError`
+            If construction fails.
+
+        """
+
+        topology_graph = self.topology_graph
+        self.atoms = []
+        self.bonds = []
+        self.construction_bonds = []
+        self.func_groups = []
+        self.building_block_counter = Counter()
         # A (3, n) numpy.ndarray holding the position of every atom in
         # the molecule.
-        obj._position_matrix = []
+        self._position_matrix = []
 
         try:
-            topology_graph.construct(obj)
+            topology_graph.construct(self, parent)
 
         except Exception as ex:
             errormsg = (
@@ -338,16 +475,43 @@ class ConstructedMolecule(Molecule):
             errormsg += '\n'.join(bb_blocks)
             raise ConstructionError(errormsg) from ex
 
-        obj.atoms = tuple(obj.atoms)
-        obj.bonds = tuple(obj.bonds)
-        obj.construction_bonds = tuple(obj.construction_bonds)
-        obj.func_groups = tuple(obj.func_groups)
+        self.atoms = tuple(self.atoms)
+        self.bonds = tuple(self.bonds)
+        self.construction_bonds = tuple(self.construction_bonds)
+        self.func_groups = tuple(self.func_groups)
 
         # Ensure that functional group ids are set correctly.
-        for id_, func_group in enumerate(obj.func_groups):
+        for id_, func_group in enumerate(self.func_groups):
             func_group.id = id_
 
-        return obj
+    def __getattr__(self, name):
+        # This is only called if normal attribute lookup fails, which
+        # for a structural attribute of a lazy molecule means its
+        # structure has not been constructed yet.
+        components = self.__dict__.get('_lazy_components')
+        if (
+            components is None
+            or name not in self._structural_attributes
+        ):
+            raise AttributeError(
+                f'{self.__class__.__name__!r} object has no '
+                f'attribute {name!r}'
+            )
+
+        # Drop the reference to the parent, so that it can be garbage
+        # collected once construction is done.
+        del self._lazy_components
+        attrs = set(self.__dict__)
+        try:
+            self._construct_structure(*components)
+        except ConstructionError:
+            # Remove any partially constructed structure, so that
+            # construction is attempted again on the next access.
+            for attr in set(self.__dict__) - attrs:
+                del self.__dict__[attr]
+            self._lazy_components = components
+            raise
+        return getattr(self, name)
 
     def clone(self):
         """
@@ -395,6 +559,85 @@ class ConstructedMolecule(Molecule):
 
         yield from self.building_block_vertices.keys()
 
+    def get_clashes(self, clash_distance=1.):
+        """
+        Yield pairs of atoms from different building blocks which clash.
+
+        Two atoms clash if they are closer than `clash_distance` and
+        have different :attr:`building_block_id` values. Atoms added by
+        reactions, which have no building block, are compared with all
+        other atoms. Atoms which are bonded, or which share a bonded
+        neighbor, never clash.
+
+        Parameters
+        ----------
+        clash_distance : :class:`float`, optional
+            The distance, in Angstrom, below which two atoms clash.
+
+        Yields
+        ------
+        :class:`tuple`
+            Holds the id of the first atom, the id of the second atom
+            and the distance between them. The id of the first atom is
+            always the smaller one.
+
+        """
+
+        positions = self._position_matrix.T
+        pairs = cKDTree(positions).query_pairs(
+            r=clash_distance,
+            output_type='ndarray',
+        )
+        if len(pairs) == 0:
+            return
+
+        # Atoms without a building block get a unique negative id,
+        # so that they are compared with every other atom.
+        bb_ids = np.array([
+            -1-atom.id
+            if getattr(atom, 'building_block_id', None) is None
+            else atom.building_block_id
+            for atom in self.atoms
+        ])
+        pairs = pairs[bb_ids[pairs[:, 0]] != bb_ids[pairs[:, 1]]]
+        if len(pairs) == 0:
+            return
+
+        neighbors = [{atom.id} for atom in self.atoms]
+        for bond in self.bonds:
+            neighbors[bond.atom1.id].add(bond.atom2.id)
+            neighbors[bond.atom2.id].add(bond.atom1.id)
+
+        distances = np.linalg.norm(
+            positions[pairs[:, 0]] - positions[pairs[:, 1]],
+            axis=1,
+        )
+        for (atom1_id, atom2_id), distance in zip(
+            pairs.tolist(),
+            distances.tolist(),
+        ):
+            if neighbors[atom1_id].isdisjoint(neighbors[atom2_id]):
+                yield atom1_id, atom2_id, distance
+
+    def has_clashes(self, clash_distance=1.):
+        """
+        Return ``True`` if atoms of different building blocks clash.
+
+        Parameters
+        ----------
+        clash_distance : :class:`float`, optional
+            The distance, in Angstrom, below which two atoms clash.
+            See :meth:`get_clashes`.
+
+        Returns
+        -------
+        :class:`bool`
+            ``True`` if the molecule has any clashes.
+
+        """
+
+        return next(self.get_clashes(clash_distance), None) is not None
+
     def to_dict(self, include_attrs=None, ignore_missing_attrs=False):
         """
         Return a :class:`dict` representation.
@@ -476,11 +719,12 @@ class ConstructedMolecule(Molecule):
             'construction_bonds': construction_bonds,
             'class': self.__class__.__name__,
             'position_matrix': self.get_position_matrix().tolist(),
-            'topology_graph': repr(self.topology_graph),
+            'topology_graph': self.topology_graph._get_repr(),
             'func_groups': repr(tuple(func_groups)),
             'atoms': repr(tuple(atoms)),
             'bonds': repr(tuple(bonds)),
             'identity_key': repr(self._identity_key),
+            'identity_digest': self._identity_digest,
         }
 
         if ignore_missing_attrs:
@@ -523,9 +767,15 @@ class ConstructedMolecule(Molecule):
         """
 
         d = dict(mol_dict)
-        identity_key = eval(d.pop('identity_key'))
-        if use_cache and identity_key in cls._cache:
-            return cls._cache[identity_key]
+        identity_key = d.pop('identity_key')
+        # Dumps made before identity digests were added lack them.
+        identity_digest = sys.intern(
+            d.pop('identity_digest', None)
+            or _get_identity_digest(identity_key)
+        )
+        cached = cls._cache.get(identity_digest) if use_cache else None
+        if cached is not None:
+            return cached
 
         tops = vars(topology_graphs)
         topology_graph = eval(d.pop('topology_graph'), tops)
@@ -535,7 +785,8 @@ class ConstructedMolecule(Molecule):
         ]
 
         obj = cls.__new__(cls)
-        obj._identity_key = identity_key
+        obj._identity_key = eval(identity_key)
+        obj._identity_digest = identity_digest
         obj.building_block_counter = Counter()
         obj.building_block_vertices = {}
 
@@ -582,7 +833,7 @@ class ConstructedMolecule(Molecule):
             setattr(obj, attr, eval(val))
 
         if use_cache:
-            cls._cache[identity_key] = obj
+            cls._cache[identity_digest] = obj
         return obj
 
     @classmethod
@@ -640,7 +891,13 @@ class ConstructedMolecule(Molecule):
             building_block_vertices=building_block_vertices,
             building_block_types=building_block_types
         )
-        return tuple(bb_keys), repr(topology_graph), tuple(vertices)
+        return (
+            tuple(bb_keys),
+            *topology_graph._get_identity_key(
+                building_block_vertices=building_block_vertices,
+                vertices=tuple(vertices)
+            )
+        )
 
     @classmethod
     def _get_sorted_building_block_keys(
@@ -1,8 +1,16 @@
 import json
 import os
+import sys
+import hashlib
 import numpy as np
 import rdkit.Chem.AllChem as rdkit
+from functools import lru_cache
+from scipy.spatial import cKDTree
 from scipy.spatial.distance import euclidean
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+from .molecule_cache import MoleculeCache
 
 from ...utilities import (
     vector_angle,
@@ -10,7 +18,8 @@ from ...utilities import (
     rotation_matrix_arbitrary_axis,
     mol_from_mae_file,
     remake,
-    periodic_table
+    periodic_table,
+    atom_vdw_radii
 )
 
 
@@ -18,6 +27,64 @@ class MoleculeSubclassError(Exception):
     ...
 
 
+def _get_identity_digest(identity_key):
+    """
+    Return the identity digest of an identity key.
+
+    Parameters
+    ----------
+    identity_key : :class:`object`
+        An identity key, or its :func:`repr`, if it is a :class:`str`.
+        Identity keys are never strings, so the :func:`repr` of
+        an identity key, such as the one held by a dump file, can be
+        digested without evaluating it.
+
+    Returns
+    -------
+    :class:`str`
+        The interned, hexadecimal, 128-bit digest of `identity_key`.
+
+    """
+
+    if not isinstance(identity_key, str):
+        identity_key = repr(identity_key)
+    digest = hashlib.blake2b(
+        identity_key.encode(),
+        digest_size=16
+    ).hexdigest()
+    return sys.intern(digest)
+
+
+@lru_cache(maxsize=8)
+def _get_sphere_directions(num_directions):
+    """
+    Return unit vectors spread evenly over a sphere.
+
+    Parameters
+    ----------
+    num_directions : :class:`int`
+        The number of vectors.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        An array of shape ``(num_directions, 3)``, placed on a
+        Fibonacci lattice.
+
+    """
+
+    indices = np.arange(num_directions) + 0.5
+    polar = np.arccos(1 - 2*indices/num_directions)
+    azimuth = np.pi * (1 + np.sqrt(5)) * indices
+    directions = np.stack([
+        np.cos(azimuth) * np.sin(polar),
+        np.sin(azimuth) * np.sin(polar),
+        np.cos(polar),
+    ], axis=1)
+    directions.setflags(write=False)
+    return directions
+
+
 class _Cached(type):
     def __call__(cls, *args, **kwargs):
         return cls._construct(*args, **kwargs)
@@ -107,7 +174,14 @@ class Molecule(metaclass=_Cached):
 
         raise NotImplementedError()
 
-    def __init__(self, atoms, bonds, position_matrix, identity_key):
+    def __init__(
+        self,
+        atoms,
+        bonds,
+        position_matrix,
+        identity_key,
+        identity_digest=None
+    ):
         """
         Initialize a :class:`Molecule`.
 
@@ -128,14 +202,22 @@ class Molecule(metaclass=_Cached):
             ``stk`` sees as identical will have the same identity key.
             Must be hashable.
 
+        identity_digest : :class:`str`, optional
+            The digest of `identity_key`. If ``None``, it is
+            calculated from `identity_key`.
+
         """
 
+        if identity_digest is None:
+            identity_digest = _get_identity_digest(identity_key)
+
         self.atoms = atoms
         self.bonds = bonds
         # A (3, n) numpy.ndarray holding the position of every atom in
         # the molecule.
         self._position_matrix = position_matrix.T
         self._identity_key = identity_key
+        self._identity_digest = identity_digest
 
     @classmethod
     def init_from_dict(self, mol_dict, use_cache=False):
@@ -205,9 +287,9 @@ class Molecule(metaclass=_Cached):
             msg = 'Subclass with this name already exists.'
             raise MoleculeSubclassError(msg)
         cls._subclasses[cls.__name__] = cls
-        # Maps the _key of each instance of a subclass to the
-        # to the actual instance.
-        cls._cache = {}
+        # Maps the _identity_digest of each instance of a subclass to
+        # the actual instance.
+        cls._cache = MoleculeCache()
         super().__init_subclass__(**kwargs)
 
     def apply_displacement(self, displacement):
@@ -416,6 +498,7 @@ class Molecule(metaclass=_Cached):
             bonds=bonds,
             position_matrix=self.get_position_matrix(),
             identity_key=self.get_identity_key(),
+            identity_digest=self.get_identity_digest(),
         )
         return clone
 
@@ -468,9 +551,25 @@ class Molecule(metaclass=_Cached):
 
         """
 
+        identity_digest = _get_identity_digest(identity_key)
         if default is None:
-            return cls._cache[identity_key]
-        return cls._cache.get(identity_key, default)
+            return cls._cache[identity_digest]
+        return cls._cache.get(identity_digest, default)
+
+    @classmethod
+    def get_cache(cls):
+        """
+        Return the cache of the class.
+
+        Returns
+        -------
+        :class:`.MoleculeCache`
+            The cache, which holds the molecules created with
+            `use_cache` set to ``True``.
+
+        """
+
+        return cls._cache
 
     def get_atom_distance(self, atom1_id, atom2_id):
         """
@@ -632,6 +731,33 @@ class Molecule(metaclass=_Cached):
 
         return self._identity_key
 
+    def get_identity_digest(self):
+        """
+        Return the identity digest.
+
+        The identity digest is a fixed-size digest of the identity
+        key. It is cheaper to hash and compare than the identity key,
+        which is useful when molecules are looked up often.
+
+        Returns
+        -------
+        :class:`str`
+            The hexadecimal, 128-bit digest of the identity key.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            import stk
+
+            bb1 = stk.BuildingBlock('NCCN', ['amine'])
+            bb2 = stk.BuildingBlock('NCCN', ['amine'])
+            assert bb1.get_identity_digest() == bb2.get_identity_digest()
+
+        """
+
+        return self._identity_digest
+
     def get_maximum_diameter(self, atom_ids=None):
         """
         Return the maximum diamater.
@@ -717,6 +843,143 @@ class Molecule(metaclass=_Cached):
             normal *= -1
         return normal
 
+    def get_pore_diameter(self, origin=None):
+        """
+        Return the diameter of the largest sphere placed at `origin`.
+
+        This method accounts for the van der Waals radius of atoms.
+
+        Parameters
+        ----------
+        origin : :class:`numpy.ndarray`, optional
+            The center of the sphere. If ``None``, the centroid of the
+            molecule is used.
+
+        Returns
+        -------
+        :class:`float`
+            The pore diameter. This is ``0`` if `origin` is inside an
+            atom.
+
+        """
+
+        if origin is None:
+            origin = self.get_centroid()
+
+        distances = np.linalg.norm(
+            self._position_matrix.T - origin,
+            axis=1,
+        )
+        radii = self._get_vdw_radii()
+        return float(max(0., 2*np.min(distances - radii)))
+
+    def get_windows(
+        self,
+        probe_radius=0.,
+        num_directions=2000,
+        origin=None
+    ):
+        """
+        Return the diameters of the windows around `origin`.
+
+        Rays are cast from `origin` in `num_directions` directions. A
+        ray leaves the molecule if it does not pass through the van
+        der Waals sphere of any atom, and if no atom comes closer to it
+        than `probe_radius`. Neighboring rays which leave the molecule
+        are grouped into the same window. A molecule which does not
+        enclose `origin` will therefore have a single window.
+
+        The diameter of a window is the diameter of the largest sphere,
+        which can travel out along any of its rays.
+
+        Parameters
+        ----------
+        probe_radius : :class:`float`, optional
+            The radius of the smallest sphere, which must be able to
+            pass through a window.
+
+        num_directions : :class:`int`, optional
+            The number of rays cast. Windows narrower than the spacing
+            between rays may be missed.
+
+        origin : :class:`numpy.ndarray`, optional
+            The point from which the rays are cast. If ``None``, the
+            centroid of the molecule is used.
+
+        Returns
+        -------
+        :class:`list` of :class:`float`
+            The diameter of each window. If the molecule has no
+            windows, the :class:`list` is empty.
+
+        Examples
+        --------
+        A cage is collapsed if it does not have the expected number of
+        windows
+
+        .. code-block:: python
+
+            import stk
+
+            cage = stk.BuildingBlock.init_from_file('cc3.mol')
+            collapsed = len(cage.get_windows()) != 4
+
+        """
+
+        if origin is None:
+            origin = self.get_centroid()
+
+        positions = self._position_matrix.T - origin
+        directions = _get_sphere_directions(num_directions)
+
+        # Get the distance between every ray and every atom. If an
+        # atom is behind a ray, the closest point of the ray is
+        # origin.
+        projections = directions @ positions.T
+        square_distances = np.einsum('ij,ij->i', positions, positions)
+        ray_distances = np.sqrt(np.where(
+            projections > 0,
+            np.maximum(square_distances - projections**2, 0),
+            square_distances,
+        ))
+        clearances = np.min(ray_distances - self._get_vdw_radii(), 1)
+        open_rays = np.flatnonzero(clearances > probe_radius)
+        if len(open_rays) == 0:
+            return []
+
+        spacing = 1.5 * np.sqrt(4*np.pi/num_directions)
+        pairs = cKDTree(directions[open_rays]).query_pairs(
+            r=spacing,
+            output_type='ndarray',
+        )
+        graph = coo_matrix(
+            (np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])),
+            shape=(len(open_rays), len(open_rays)),
+        )
+        num_windows, windows = connected_components(
+            csgraph=graph,
+            directed=False,
+        )
+        diameters = np.zeros(num_windows)
+        np.maximum.at(diameters, windows, 2*clearances[open_rays])
+        return diameters.tolist()
+
+    def _get_vdw_radii(self):
+        """
+        Return the van der Waals radius of every atom.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The radius of each atom, in Angstrom.
+
+        """
+
+        return np.array([
+            atom_vdw_radii.get(atom.__class__.__name__, 2)
+            for atom in self.atoms
+        ])
+
     @classmethod
     def has_cached_mol(cls, identity_key):
         """
@@ -734,7 +997,46 @@ class Molecule(metaclass=_Cached):
 
         """
 
-        return identity_key in cls._cache
+        return _get_identity_digest(identity_key) in cls._cache
+
+    @classmethod
+    def set_cache_policy(cls, max_size=None, max_memory=None, weak=False):
+        """
+        Set how many molecules the cache of the class keeps alive.
+
+        Molecules already in the cache are moved to the new cache,
+        in order of their last use, and are evicted if they exceed
+        its limits.
+
+        Parameters
+        ----------
+        max_size : :class:`int`, optional
+            The maximum number of molecules the cache keeps alive.
+            If ``None``, the number is not limited.
+
+        max_memory : :class:`int`, optional
+            The maximum estimated memory, in bytes, of the molecules
+            the cache keeps alive. If ``None``, the memory is not
+            limited.
+
+        weak : :class:`bool`, optional
+            If ``True``, molecules which have been evicted can still
+            be retrieved from the cache while they are alive.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        cache = MoleculeCache(
+            max_size=max_size,
+            max_memory=max_memory,
+            weak=weak
+        )
+        for key, mol in cls._cache._get_items():
+            cache[key] = mol
+        cls._cache = cache
 
     def get_position_matrix(self):
         """
@@ -1019,11 +1321,14 @@ class Molecule(metaclass=_Cached):
 
         """
 
-        if self._identity_key in self.__class__._cache:
-            d = dict(vars(self))
-            self.__class__._cache[self._identity_key].__dict__ = d
+        cache = self.__class__._cache
+        cached = cache.get(self._identity_digest)
+        if cached is not None:
+            cached.__dict__ = dict(vars(self))
+            # Account for the new attributes of the cached molecule.
+            cache[self._identity_digest] = cached
         else:
-            self.__class__._cache[self._identity_key] = self
+            cache[self._identity_digest] = self
 
     def update_from_rdkit_mol(self, mol):
         """
@@ -0,0 +1,322 @@
+"""
+Molecule Cache
+==============
+
+"""
+
+import sys
+import weakref
+from collections import OrderedDict
+
+
+class MoleculeCache:
+    """
+    Holds the cached molecules of a :class:`.Molecule` subclass.
+
+    Molecules are held by their identity digest. By default, the
+    cache is unbounded and every molecule added to it is kept alive
+    for the lifetime of the process. A cache can also be bounded by
+    the number of molecules it holds or by an estimate of their
+    memory usage, in which case the least recently used molecules are
+    evicted first. In weak mode, evicted molecules remain cached for
+    as long as they are used elsewhere.
+
+    Examples
+    --------
+    Each :class:`.Molecule` subclass has its own cache, and its policy
+    is set with :meth:`.Molecule.set_cache_policy`
+
+    .. code-block:: python
+
+        import stk
+
+        # Keep at most 1000 molecules alive, but find any molecule
+        # which is still in use, even if it was evicted.
+        stk.ConstructedMolecule.set_cache_policy(
+            max_size=1000,
+            weak=True
+        )
+        cache = stk.ConstructedMolecule.get_cache()
+        print(len(cache), cache.get_memory_usage())
+
+    """
+
+    def __init__(self, max_size=None, max_memory=None, weak=False):
+        """
+        Initialize a :class:`MoleculeCache`.
+
+        Parameters
+        ----------
+        max_size : :class:`int`, optional
+            The maximum number of molecules the cache keeps alive.
+            If ``None``, the number is not limited.
+
+        max_memory : :class:`int`, optional
+            The maximum estimated memory, in bytes, of the molecules
+            the cache keeps alive. If ``None``, the memory is not
+            limited.
+
+        weak : :class:`bool`, optional
+            If ``True``, molecules which have been evicted can still
+            be retrieved while they are alive.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `max_size` or `max_memory` is negative.
+
+        """
+
+        if max_size is not None and max_size < 0:
+            raise ValueError('max_size must not be negative.')
+        if max_memory is not None and max_memory < 0:
+            raise ValueError('max_memory must not be negative.')
+
+        self._max_size = max_size
+        self._max_memory = max_memory
+        self._weak = weak
+        # Holds the molecules kept alive by the cache, ordered from
+        # least to most recently used.
+        self._molecules = OrderedDict()
+        # Maps the key of each molecule in _molecules to its
+        # estimated memory usage.
+        self._memory_usages = {}
+        self._memory_usage = 0
+        self._num_evictions = 0
+        self._num_hits = 0
+        self._num_misses = 0
+        # Holds every molecule, including evicted ones, for as long
+        # as it is alive.
+        self._weak_molecules = (
+            weakref.WeakValueDictionary() if weak else None
+        )
+
+    def get(self, key, default=None):
+        """
+        Return a cached molecule.
+
+        Parameters
+        ----------
+        key : :class:`str`
+            The identity digest of the molecule.
+
+        default : :class:`object`, optional
+            Returned if `key` is not in the cache.
+
+        Returns
+        -------
+        :class:`.Molecule`
+            The cached molecule, or `default`.
+
+        """
+
+        mol = self._molecules.get(key)
+        if mol is not None:
+            self._molecules.move_to_end(key)
+            self._num_hits += 1
+            return mol
+
+        if self._weak:
+            mol = self._weak_molecules.get(key)
+            if mol is not None:
+                # The molecule is in use, so keep it alive again.
+                self[key] = mol
+                self._num_hits += 1
+                return mol
+
+        self._num_misses += 1
+        return default
+
+    def get_memory_usage(self):
+        """
+        Return the estimated memory usage of the cached molecules.
+
+        Only molecules kept alive by the cache are counted. The
+        estimate is made when a molecule is added to the cache.
+
+        Returns
+        -------
+        :class:`int`
+            The estimated memory usage in bytes.
+
+        """
+
+        return self._memory_usage
+
+    def get_num_hits(self):
+        """
+        Return the number of lookups which found a molecule.
+
+        Returns
+        -------
+        :class:`int`
+            The number of hits.
+
+        """
+
+        return self._num_hits
+
+    def get_num_misses(self):
+        """
+        Return the number of lookups which did not find a molecule.
+
+        Returns
+        -------
+        :class:`int`
+            The number of misses.
+
+        """
+
+        return self._num_misses
+
+    def get_num_evictions(self):
+        """
+        Return the number of molecules evicted from the cache.
+
+        Returns
+        -------
+        :class:`int`
+            The number of evicted molecules.
+
+        """
+
+        return self._num_evictions
+
+    def clear(self):
+        """
+        Remove all molecules from the cache.
+
+        Returns
+        -------
+        :class:`MoleculeCache`
+            The cache.
+
+        """
+
+        self._molecules.clear()
+        self._memory_usages.clear()
+        self._memory_usage = 0
+        if self._weak:
+            self._weak_molecules.clear()
+        return self
+
+    def _get_items(self):
+        """
+        Yield the cached molecules, from least to most recently used.
+
+        Molecules which have been evicted, but are still alive, are
+        yielded first.
+
+        Yields
+        ------
+        :class:`tuple`
+            The key and the molecule.
+
+        """
+
+        if self._weak:
+            for key, mol in list(self._weak_molecules.items()):
+                if key not in self._molecules:
+                    yield key, mol
+        yield from list(self._molecules.items())
+
+    def _evict(self):
+        """
+        Evict the least recently used molecules above the limits.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        while self._molecules and (
+            (
+                self._max_size is not None
+                and len(self._molecules) > self._max_size
+            )
+            or (
+                self._max_memory is not None
+                and self._memory_usage > self._max_memory
+            )
+        ):
+            key, _ = self._molecules.popitem(last=False)
+            self._memory_usage -= self._memory_usages.pop(key)
+            self._num_evictions += 1
+
+    def __getitem__(self, key):
+        mol = self.get(key)
+        if mol is None:
+            raise KeyError(key)
+        return mol
+
+    def __setitem__(self, key, mol):
+        if key in self._molecules:
+            self._memory_usage -= self._memory_usages[key]
+
+        memory_usage = _get_memory_usage(mol)
+        self._molecules[key] = mol
+        self._molecules.move_to_end(key)
+        self._memory_usages[key] = memory_usage
+        self._memory_usage += memory_usage
+        if self._weak:
+            self._weak_molecules[key] = mol
+        self._evict()
+
+    def __contains__(self, key):
+        return (
+            key in self._molecules
+            or (self._weak and key in self._weak_molecules)
+        )
+
+    def __iter__(self):
+        if self._weak:
+            # Every molecule in _molecules is also in _weak_molecules.
+            return iter(list(self._weak_molecules.keys()))
+        return iter(list(self._molecules))
+
+    def __len__(self):
+        if self._weak:
+            return len(self._weak_molecules)
+        return len(self._molecules)
+
+    def __str__(self):
+        return repr(self)
+
+    def __repr__(self):
+        return (
+            f'{self.__class__.__name__}('
+            f'max_size={self._max_size!r}, '
+            f'max_memory={self._max_memory!r}, '
+            f'weak={self._weak!r})'
+        )
+
+
+def _get_memory_usage(mol):
+    """
+    Return an estimate of the memory used by `mol`.
+
+    Parameters
+    ----------
+    mol : :class:`.Molecule`
+        The molecule.
+
+    Returns
+    -------
+    :class:`int`
+        The estimated memory usage in bytes. Only the atoms, bonds
+        and position matrix of `mol` are counted.
+
+    """
+
+    # Use vars() so that the structure of lazy molecules is not
+    # constructed.
+    attrs = vars(mol)
+    memory_usage = (
+        sys.getsizeof(mol)
+        + sys.getsizeof(attrs)
+        + getattr(attrs.get('_position_matrix'), 'nbytes', 0)
+    )
+    for item in (*attrs.get('atoms', ()), *attrs.get('bonds', ())):
+        memory_usage += sys.getsizeof(item) + sys.getsizeof(vars(item))
+    return memory_usage
@@ -26,7 +26,9 @@ For usage examples see :class:`.Cage`.
 """
 
 
+import itertools as it
 import numpy as np
+from scipy.spatial import cKDTree
 
 from ..topology_graph import TopologyGraph, VertexData, Vertex
 from ....utilities import vector_angle
@@ -464,6 +466,79 @@ class _CageVertex(Vertex):
             edges=edges
         )
 
+    def _has_symmetric_placement(
+        self,
+        vertex,
+        rotation,
+        translation,
+        edge_map,
+        vertices,
+        edges
+    ):
+        """
+        Check if a symmetry operation maps placement onto `vertex`.
+
+        Parameters
+        ----------
+        vertex : :class:`.Vertex`
+            The vertex onto which the symmetry operation maps this
+            vertex.
+
+        rotation : :class:`numpy.ndarray`
+            The ``(3, 3)`` rotation matrix of the symmetry operation.
+
+        translation : :class:`numpy.ndarray`
+            The translation of the symmetry operation.
+
+        edge_map : :class:`dict`
+            Maps the id of every edge connected to the vertex to the
+            id of the edge connected to `vertex` it is mapped onto.
+
+        vertices : :class:`tuple` of :class:`.Vertex`
+            All vertices in the topology graph. The index of each
+            vertex must match its :class:`~.Vertex.id`.
+
+        edges : :class:`tuple` of :class:`.Edge`
+            All edges in the topology graph. The index of each
+            edge must match its :class:`~.Edge.id`.
+
+        Returns
+        -------
+        :class:`bool`
+            ``True`` if the symmetry operation maps a building block
+            placed on the vertex onto a building block placed on
+            `vertex`.
+
+        """
+
+        aligner_edge = self._edge_ids[self._aligner_edge]
+        if (
+            edge_map[aligner_edge]
+            != vertex._edge_ids[vertex._aligner_edge]
+            or self._use_bonder_placement
+            != vertex._use_bonder_placement
+        ):
+            return False
+
+        if not self._use_bonder_placement:
+            return True
+
+        # The position of a vertex is updated from the bonder
+        # positions of its neighbors, so these need to be mapped too.
+        num_edges = len(self._edge_ids)
+        updated = len(self._neighbor_positions) == num_edges
+        if updated != (len(vertex._neighbor_positions) == num_edges):
+            return False
+        if not updated:
+            return True
+
+        position = np.mean(self._neighbor_positions, axis=0)
+        return np.allclose(
+            a=rotation @ position + translation,
+            b=np.mean(vertex._neighbor_positions, axis=0),
+            atol=1e-6
+        )
+
     def _assign_func_groups_to_linear_edges(
         self,
         building_block,
@@ -541,6 +616,12 @@ class _CageVertex(Vertex):
     ):
 
         def angle(fg_id):
+            # Rounding errors can give the first functional group a
+            # small, non-zero angle with itself, which would place it
+            # last.
+            if fg_id == 0:
+                return 0
+
             func_group = building_block.func_groups[fg_id]
             coord = building_block.get_centroid(
                 atom_ids=func_group.get_bonder_ids()
@@ -567,6 +648,11 @@ class _CageVertex(Vertex):
         aligner_edge_direction = aligner_edge_coord - edge_centroid
 
         def angle(edge_id):
+            # Same as for the first functional group, the aligner
+            # edge always comes first.
+            if edge_id == self._edge_ids[self._aligner_edge]:
+                return 0
+
             coord = edges[edge_id].get_position()
             edge_direction = coord - edge_centroid
             theta = vector_angle(
@@ -589,6 +675,151 @@ class _CageVertex(Vertex):
         )
 
 
+def _get_position_map(rotation, positions, tolerance):
+    """
+    Get the map of `positions` onto themselves under `rotation`.
+
+    Parameters
+    ----------
+    rotation : :class:`numpy.ndarray`
+        A ``(3, 3)`` rotation matrix.
+
+    positions : :class:`numpy.ndarray`
+        A ``(n, 3)`` array of positions.
+
+    tolerance : :class:`float`
+        The distance within which two positions are considered equal.
+
+    Returns
+    -------
+    :class:`tuple` of :class:`int`
+        For each position, the index of the position it is rotated
+        onto. If the positions are not mapped onto themselves,
+        ``None`` is returned.
+
+    """
+
+    distances, image_ids = cKDTree(positions).query(
+        x=positions @ rotation.T,
+        distance_upper_bound=tolerance
+    )
+    if (
+        np.any(np.isinf(distances))
+        or len(set(image_ids)) != len(image_ids)
+    ):
+        return None
+    return tuple(image_ids.tolist())
+
+
+def _get_symmetry_permutations(vertex_data, edge_data):
+    """
+    Get the proper rotations which map a cage onto itself.
+
+    The rotations are about the centroid of the vertices. They are
+    found by trying every rotation which maps two reference points of
+    the graph onto two points of the same kind and keeping those
+    which map all vertices and edges onto vertices and edges of the
+    same kind.
+
+    Parameters
+    ----------
+    vertex_data : :class:`tuple` of :class:`.VertexData`
+        The vertices of the cage.
+
+    edge_data : :class:`tuple` of :class:`.EdgeData`
+        The edges of the cage.
+
+    Returns
+    -------
+    :class:`tuple`
+        For each rotation, except the identity, a :class:`tuple` of
+        the form ``(rotation, vertex_map, edge_map)``, where
+        ``vertex_map`` and ``edge_map`` hold the id of the vertex
+        and edge onto which each vertex and edge is rotated.
+
+    """
+
+    centroid = np.mean([v.position for v in vertex_data], axis=0)
+    vertex_positions = np.array(
+        [v.position for v in vertex_data]
+    ) - centroid
+    edge_positions = np.array(
+        [e.position for e in edge_data]
+    ) - centroid
+    positions = np.concatenate((vertex_positions, edge_positions))
+    # Points can only be rotated onto points of the same kind.
+    kinds = [len(v.edges) for v in vertex_data]
+    kinds.extend(-1 for edge in edge_data)
+    norms = np.linalg.norm(positions, axis=1)
+    tolerance = 1e-6*max(1, norms.max())
+
+    # Two reference points which are not collinear with the
+    # centroid fix a rotation.
+    a = int(np.argmax(norms))
+    crosses = np.linalg.norm(np.cross(positions[a], positions), axis=1)
+    if crosses.max() < tolerance:
+        return ()
+    b = int(np.argmax(crosses))
+    basis = np.array([
+        positions[a],
+        positions[b],
+        np.cross(positions[a], positions[b]),
+    ]).T
+    inverse = np.linalg.inv(basis)
+
+    def candidates(reference):
+        for i, position in enumerate(positions):
+            if (
+                kinds[i] == kinds[reference]
+                and abs(norms[i]-norms[reference]) < tolerance
+            ):
+                yield i
+
+    permutations = []
+    for i, j in it.product(candidates(a), candidates(b)):
+        if (
+            abs(positions[i] @ positions[j] - positions[a] @ positions[b])
+            > tolerance
+        ):
+            continue
+
+        image = np.array([
+            positions[i],
+            positions[j],
+            np.cross(positions[i], positions[j]),
+        ]).T
+        rotation = image @ inverse
+        if (
+            np.allclose(rotation, np.identity(3))
+            or not np.allclose(rotation @ rotation.T, np.identity(3))
+        ):
+            continue
+
+        vertex_map = _get_position_map(
+            rotation=rotation,
+            positions=vertex_positions,
+            tolerance=tolerance
+        )
+        edge_map = _get_position_map(
+            rotation=rotation,
+            positions=edge_positions,
+            tolerance=tolerance
+        )
+        if vertex_map is None or edge_map is None:
+            continue
+        if any(kinds[v] != kinds[vertex_map[v]] for v in vertex_map):
+            continue
+        if any(
+            sorted(vertex_map[v.id] for v in edge.vertices)
+            != sorted(v.id for v in edge_data[edge_map[edge.id]].vertices)
+            for edge in edge_data
+        ):
+            continue
+        permutations.append((rotation, vertex_map, edge_map))
+
+    return tuple(permutations)
+
+
 class Cage(TopologyGraph):
     """
     Represents a cage topology graph.
@@ -683,9 +914,64 @@ class Cage(TopologyGraph):
             vertex.id = i
         for i, edge in enumerate(cls.edge_data):
             edge.id = i
+        # Calculated lazily by _get_symmetry_permutations().
+        cls._symmetry_permutations = None
         return super().__init_subclass__(**kwargs)
 
-    def __init__(self, vertex_alignments=None, num_processes=1):
+    @classmethod
+    def _get_symmetry_permutations(cls):
+        """
+        Get the proper rotations which map the cage onto itself.
+
+        The rotations are only found the first time they are needed
+        by the class.
+
+        Returns
+        -------
+        :class:`tuple`
+            See :func:`_get_symmetry_permutations`.
+
+        """
+
+        if cls._symmetry_permutations is None:
+            cls._symmetry_permutations = _get_symmetry_permutations(
+                vertex_data=cls.vertex_data,
+                edge_data=cls.edge_data
+            )
+        return cls._symmetry_permutations
+
+    @classmethod
+    def _get_symmetry_rotations(cls):
+        """
+        Get the rotations used for construction with symmetry.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`numpy.ndarray`
+            The rotations which map the cage onto itself. Empty if
+            the vertices are not centred on the origin, because
+            symmetry operations used during construction are
+            rotations about the origin.
+
+        """
+
+        centroid = np.mean(
+            [vertex.position for vertex in cls.vertex_data],
+            axis=0
+        )
+        if not np.allclose(centroid, 0, atol=1e-6):
+            return ()
+        return tuple(
+            rotation
+            for rotation, _, _ in cls._get_symmetry_permutations()
+        )
+
+    def __init__(
+        self,
+        vertex_alignments=None,
+        num_processes=1,
+        use_symmetry=False
+    ):
         """
         Initialize a :class:`.Cage`.
 
@@ -709,11 +995,26 @@ class Cage(TopologyGraph):
             The number of parallel processes to create during
             :meth:`construct`.
 
+        use_symmetry : :class:`bool`, optional
+            If ``True``, serial construction places a building block
+            on only one vertex of each set of symmetry equivalent
+            vertices and generates the placement on the others by
+            rotation. The symmetry of the cage is found from
+            :attr:`vertex_data` and :attr:`edge_data`.
+
         """
 
         if vertex_alignments is None:
             vertex_alignments = {}
 
+        if use_symmetry:
+            symmetry_operations = tuple(
+                (rotation, np.zeros(3))
+                for rotation in self._get_symmetry_rotations()
+            )
+        else:
+            symmetry_operations = ()
+
         vertex_data = {
             data: data.clone(True) for data in self.vertex_data
         }
@@ -735,9 +1036,275 @@ class Cage(TopologyGraph):
                     vertex.get_num_edges() == vertex_type
                 for vt in vertex_types
             ),
-            num_processes=num_processes
+            num_processes=num_processes,
+            symmetry_operations=symmetry_operations
         )
 
+    def get_unique_vertex_alignments(
+        self,
+        vertex_ids=None,
+        building_block_vertices=None
+    ):
+        """
+        Yield the vertex alignments of symmetry unique isomers.
+
+        Two sets of vertex alignments are equivalent if a proper
+        rotation of the cage maps one onto the other, because the
+        cages they construct differ only by that rotation. Only one
+        set of vertex alignments from each equivalence class is
+        yielded. Improper rotations are not used, so the enantiomers
+        of chiral isomers are both yielded.
+
+        The vertex alignments are generated lazily, so that isomers
+        can be constructed as they are yielded.
+
+        Parameters
+        ----------
+        vertex_ids : :class:`iterable` of :class:`int`, optional
+            The ids of the vertices which have their alignment
+            varied. The remaining vertices keep their alignment in
+            this topology graph. If ``None``, the alignments of all
+            vertices are varied.
+
+        building_block_vertices : :class:`dict`, optional
+            The building block vertices which will be used for
+            construction, if they are set explicitly. Vertices are
+            only considered equivalent if they hold the same building
+            block. If ``None``, every vertex with the same number of
+            edges holds the same building block, which matches
+            :meth:`assign_building_blocks_to_vertices`.
+
+        Yields
+        ------
+        :class:`dict`
+            Maps the id of each vertex in `vertex_ids` to the edge
+            used to align it. Can be used as the `vertex_alignments`
+            of :meth:`__init__`.
+
+        """
+
+        if vertex_ids is None:
+            vertex_ids = range(len(self.vertices))
+        vertex_ids = sorted(set(vertex_ids))
+        default = {
+            vertex.id: vertex.get_aligner_edge()
+            for vertex in self.vertices
+        }
+        fixed_ids = [
+            vertex.id for vertex in self.vertices
+            if vertex.id not in vertex_ids
+        ]
+        alignment_maps = [
+            (
+                {image: id_ for id_, image in enumerate(vertex_map)},
+                alignment_map
+            )
+            for vertex_map, alignment_map in (
+                self._get_alignment_maps(
+                    building_block_vertices=building_block_vertices
+                )
+            )
+        ]
+
+        def is_pruned(alignments):
+            # Only the first len(alignments) vertices in vertex_ids
+            # have an alignment. They are pruned if a symmetry
+            # operation maps every completion of them onto smaller
+            # alignments, because then no completion is the smallest
+            # set of alignments in its equivalence class.
+            known = {id_: default[id_] for id_ in fixed_ids}
+            known.update(zip(vertex_ids, alignments))
+
+            def get_image(preimage, alignment_map, id_):
+                source = preimage[id_]
+                if source not in known:
+                    return None
+                return alignment_map[source][known[source]]
+
+            for preimage, alignment_map in alignment_maps:
+                # The operation must map the fixed vertices onto
+                # their own alignments.
+                if any(
+                    get_image(preimage, alignment_map, id_)
+                    != default[id_]
+                    for id_ in fixed_ids
+                ):
+                    continue
+                for id_, edge in zip(vertex_ids, alignments):
+                    image = get_image(preimage, alignment_map, id_)
+                    if image is None or image > edge:
+                        break
+                    if image < edge:
+                        return True
+            return False
+
+        # Alignments are built up one vertex at a time, in
+        # lexicographic order, and prefixes which cannot lead to the
+        # smallest alignments in an equivalence class are dropped.
+        # This means only a fraction of all alignments is visited.
+        stack = [()]
+        while stack:
+            alignments = stack.pop()
+            if len(alignments) == len(vertex_ids):
+                yield dict(zip(vertex_ids, alignments))
+                continue
+
+            num_edges = self.vertices[
+                vertex_ids[len(alignments)]
+            ].get_num_edges()
+            stack.extend(
+                alignments + (edge, )
+                for edge in reversed(range(num_edges))
+                if not is_pruned(alignments + (edge, ))
+            )
+
+    def get_isomers(self, vertex_ids=None, building_block_vertices=None):
+        """
+        Yield topology graphs of the symmetry unique isomers.
+
+        The topology graphs are made from this one, by changing
+        the alignments of its vertices, rather than by creating them
+        from :attr:`vertex_data` and :attr:`edge_data`.
+
+        Parameters
+        ----------
+        vertex_ids : :class:`iterable` of :class:`int`, optional
+            The ids of the vertices which have their alignment
+            varied. The remaining vertices keep their alignment in
+            this topology graph. If ``None``, the alignments of all
+            vertices are varied.
+
+        building_block_vertices : :class:`dict`, optional
+            The building block vertices which will be used for
+            construction, if they are set explicitly. See
+            :meth:`get_unique_vertex_alignments`.
+
+        Yields
+        ------
+        :class:`.Cage`
+            The topology graph of an isomer.
+
+        Examples
+        --------
+        The isomers can be constructed in parallel with
+        :meth:`.Population.init_all`
+
+        .. code-block:: python
+
+            import stk
+
+            bb1 = stk.BuildingBlock('NCC(Cl)N', ['amine'])
+            bb2 = stk.BuildingBlock('O=CC(C=O)C=O', ['aldehyde'])
+
+            # Of the 5184 possible vertex alignments, 432 are unique.
+            tetrahedron = stk.cage.FourPlusSix()
+            isomers = stk.Population.init_all(
+                building_blocks=[[bb1], [bb2]],
+                topology_graphs=list(tetrahedron.get_isomers()),
+                num_processes=4
+            )
+
+        """
+
+        vertex_alignments = self.get_unique_vertex_alignments(
+            vertex_ids=vertex_ids,
+            building_block_vertices=building_block_vertices
+        )
+        for alignments in vertex_alignments:
+            yield self._with_vertex_alignments(alignments)
+
+    def _with_vertex_alignments(self, vertex_alignments):
+        """
+        Get a clone with different vertex alignments.
+
+        Parameters
+        ----------
+        vertex_alignments : :class:`dict`
+            Maps the id of a vertex to the edge used to align it.
+            Vertices which are not present keep their alignment.
+
+        Returns
+        -------
+        :class:`.Cage`
+            The clone.
+
+        """
+
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.vertices = tuple(
+            vertex.clone() for vertex in self.vertices
+        )
+        for vertex_id, aligner_edge in vertex_alignments.items():
+            clone.vertices[vertex_id]._aligner_edge = aligner_edge
+        clone._set_stages()
+        # The symmetry of the placements and the repr depend on the
+        # alignments.
+        clone._symmetry_maps = None
+        clone._repr = None
+        return clone
+
+    def _get_alignment_maps(self, building_block_vertices):
+        """
+        Get the maps of vertex alignments under the cage symmetry.
+
+        Parameters
+        ----------
+        building_block_vertices : :class:`dict`
+            Maps building blocks to the vertices they are placed on.
+            Only symmetry operations which map every vertex to one
+            holding the same building block are used. If ``None``,
+            each vertex is assumed to hold a building block picked by
+            its number of edges.
+
+        Returns
+        -------
+        :class:`list` of :class:`tuple`
+            For each symmetry operation, a :class:`tuple` of the form
+            ``(vertex_map, alignment_map)``. ``vertex_map`` holds the
+            id of the vertex onto which each vertex is mapped.
+            ``alignment_map`` holds, for each vertex, the aligner edge
+            of its image, for each of its own aligner edges.
+
+        """
+
+        if building_block_vertices is None:
+            labels = [
+                vertex.get_num_edges() for vertex in self.vertices
+            ]
+        else:
+            labels = [None for vertex in self.vertices]
+            for i, vertices in enumerate(
+                building_block_vertices.values()
+            ):
+                for vertex in vertices:
+                    labels[vertex.id] = i
+
+        edge_ids = [
+            list(vertex.get_edge_ids()) for vertex in self.vertices
+        ]
+        alignment_maps = []
+        for _, vertex_map, edge_map in (
+            self._get_symmetry_permutations()
+        ):
+            if any(
+                labels[vertex_id] != labels[image_id]
+                for vertex_id, image_id in enumerate(vertex_map)
+            ):
+                continue
+
+            alignment_map = [
+                tuple(
+                    edge_ids[vertex_map[vertex_id]].index(
+                        edge_map[edge_id]
+                    )
+                    for edge_id in edge_ids[vertex_id]
+                )
+                for vertex_id in range(len(self.vertices))
+            ]
+            alignment_maps.append((vertex_map, alignment_map))
+        return alignment_maps
+
     def assign_building_blocks_to_vertices(self, building_blocks):
         """
         Assign `building_blocks` to :attr:`vertices`.
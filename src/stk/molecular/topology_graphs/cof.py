@@ -16,7 +16,7 @@ import numpy as np
 import itertools as it
 
 from .topology_graph import TopologyGraph, VertexData, Vertex, EdgeData
-from ...utilities import vector_angle, flatten
+from ...utilities import vector_angle, flatten, normalize_vector
 
 
 class _COFVertexData(VertexData):
@@ -392,6 +392,101 @@ class _COFVertex(Vertex):
                 edges=edges
             )
 
+    def _has_symmetric_placement(
+        self,
+        vertex,
+        rotation,
+        translation,
+        edge_map,
+        vertices,
+        edges
+    ):
+        """
+        Check if a symmetry operation maps placement onto `vertex`.
+
+        Parameters
+        ----------
+        vertex : :class:`.Vertex`
+            The vertex onto which the symmetry operation maps this
+            vertex.
+
+        rotation : :class:`numpy.ndarray`
+            The ``(3, 3)`` rotation matrix of the symmetry operation.
+
+        translation : :class:`numpy.ndarray`
+            The translation of the symmetry operation.
+
+        edge_map : :class:`dict`
+            Maps the id of every edge connected to the vertex to the
+            id of the edge connected to `vertex` it is mapped onto.
+
+        vertices : :class:`tuple` of :class:`.Vertex`
+            All vertices in the topology graph. The index of each
+            vertex must match its :class:`~.Vertex.id`.
+
+        edges : :class:`tuple` of :class:`.Edge`
+            All edges in the topology graph. The index of each
+            edge must match its :class:`~.Edge.id`.
+
+        Returns
+        -------
+        :class:`bool`
+            ``True`` if the symmetry operation maps a building block
+            placed on the vertex onto a building block placed on
+            `vertex`.
+
+        """
+
+        aligner_edge = self._edge_ids[self._aligner_edge]
+        if (
+            edge_map[aligner_edge]
+            != vertex._edge_ids[vertex._aligner_edge]
+        ):
+            return False
+
+        if len(self._edge_ids) != 2:
+            return True
+
+        # Linear building blocks are rotated about their axis
+        # towards the position of the vertex, so the direction of the
+        # position perpendicular to the axis has to be mapped too.
+        direction = self._get_perpendicular_direction(vertices, edges)
+        return np.allclose(
+            a=rotation @ direction,
+            b=vertex._get_perpendicular_direction(vertices, edges),
+            atol=1e-6
+        )
+
+    def _get_perpendicular_direction(self, vertices, edges):
+        """
+        Get the direction of the position perpendicular to the edges.
+
+        Parameters
+        ----------
+        vertices : :class:`tuple` of :class:`.Vertex`
+            All vertices in the topology graph. The index of each
+            vertex must match its :class:`~.Vertex.id`.
+
+        edges : :class:`tuple` of :class:`.Edge`
+            All edges in the topology graph. The index of each
+            edge must match its :class:`~.Edge.id`.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The unit vector of the component of the vertex position
+            perpendicular to the line between its two edges.
+
+        """
+
+        e0_coord, e1_coord = (
+            edges[edge_id].get_position(self, vertices)
+            for edge_id in self._edge_ids
+        )
+        axis = normalize_vector(e0_coord - e1_coord)
+        perpendicular = self._position - (self._position @ axis)*axis
+        return normalize_vector(perpendicular)
+
     def _assign_func_groups_to_linear_edges(
         self,
         building_block,
@@ -476,6 +571,12 @@ class _COFVertex(Vertex):
     ):
 
         def angle(fg_id):
+            # Rounding errors can give the first functional group a
+            # small, non-zero angle with itself, which would place it
+            # last.
+            if fg_id == 0:
+                return 0
+
             func_group = building_block.func_groups[fg_id]
             coord = building_block.get_centroid(
                 atom_ids=func_group.get_bonder_ids()
@@ -503,6 +604,11 @@ class _COFVertex(Vertex):
         aligner_edge_direction = aligner_edge_coord - edge_centroid
 
         def angle(edge_id):
+            # Same as for the first functional group, the aligner
+            # edge always comes first.
+            if edge_id == self._edge_ids[self._aligner_edge]:
+                return 0
+
             coord = edges[edge_id].get_position(self, vertices)
             edge_direction = coord - edge_centroid
             theta = vector_angle(
@@ -584,6 +690,17 @@ class COF(TopologyGraph):
     connected to (exclusive). So a vertex connected to three edges
     can be mapped to ``0``, ``1`` or ``2``.
 
+    Large lattices can be made faster with `tile`, which places the
+    building blocks of only the first unit cell and shifts copies of
+    it into the others
+
+    .. code-block:: python
+
+        cof3 = stk.ConstructedMolecule(
+            building_blocks=[bb1, bb2],
+            topology_graph=stk.cof.Honeycomb((10, 10, 1), tile=True)
+        )
+
     You can also build COFs with multiple building blocks, but you
     have to assign each building block to a vertex with
     `building_block_vertices`.
@@ -623,7 +740,9 @@ class COF(TopologyGraph):
         lattice_size,
         periodic=False,
         vertex_alignments=None,
-        num_processes=1
+        num_processes=1,
+        use_symmetry=False,
+        tile=False
     ):
         """
         Initialize a :class:`.COF`.
@@ -657,13 +776,41 @@ class COF(TopologyGraph):
             The number of parallel processes to create during
             :meth:`construct`.
 
+        use_symmetry : :class:`bool`, optional
+            If ``True``, serial construction places building blocks
+            only on the vertices of one unit cell, and generates the
+            placement on the equivalent vertices of the other unit
+            cells by translation.
+
+        tile : :class:`bool`, optional
+            If ``True``, :meth:`construct` places building blocks
+            only on the vertices of the first unit cell. The atoms,
+            bonds and functional groups of the other unit cells are
+            then made by shifting the first unit cell by the lattice
+            vectors, so that every unit cell is identical. Linear
+            building blocks can be rotated about their axis
+            differently to when `tile` is ``False``. If ``True``,
+            `num_processes` and `use_symmetry` are ignored. Unit
+            cells are only copied if they all hold the same
+            building blocks.
+
         """
 
         if vertex_alignments is None:
             vertex_alignments = {}
 
+        # Translations by the lattice constants map each unit cell
+        # onto the next one.
+        symmetry_operations = ()
+        if use_symmetry:
+            symmetry_operations = tuple(
+                (np.identity(3), constant)
+                for constant in self._lattice_constants
+            )
+
         self._lattice_size = lattice_size
         self._periodic = periodic
+        self._tile = tile
 
         vertex_data = self._get_vertex_data(vertex_alignments)
         edge_data = self._get_edge_data(vertex_data)
@@ -673,7 +820,13 @@ class COF(TopologyGraph):
             for clones in flatten(vertex_data, {dict})
             for vertex in clones.values()
         )
-        super().__init__(vertex_data, edge_data, (), num_processes)
+        super().__init__(
+            vertex_data=vertex_data,
+            edge_data=edge_data,
+            construction_stages=(),
+            num_processes=num_processes,
+            symmetry_operations=symmetry_operations
+        )
 
     def _get_vertex_data(self, vertex_alignments):
         """
@@ -789,6 +942,92 @@ class COF(TopologyGraph):
 
         return tuple(edge_clones)
 
+    def _place_building_blocks(self, mol, vertices, edges):
+        num_vertices = len(self.vertex_data)
+        vertex_building_blocks = {
+            vertex: bb
+            for bb, vertices in mol.building_block_vertices.items()
+            for vertex in vertices
+        }
+        building_blocks = [
+            vertex_building_blocks[vertex] for vertex in self.vertices
+        ]
+        # Unit cells can only be copied if they all hold the same
+        # building blocks.
+        is_tiled = self._tile and all(
+            bb is building_blocks[i % num_vertices]
+            for i, bb in enumerate(building_blocks)
+        )
+        if not is_tiled:
+            return super()._place_building_blocks(mol, vertices, edges)
+
+        num_edges = len(self.edge_data)
+        lattice_size = np.array(self._lattice_size)
+        cells = np.array(list(it.product(
+            *(range(dim) for dim in self._lattice_size)
+        )))
+        # The scaled lattice vector by which each unit cell is shifted
+        # relative to the first one.
+        offsets = np.array([
+            vertices[i*num_vertices].get_position()
+            for i in range(len(cells))
+        ]) - vertices[0].get_position()
+
+        # Place the building blocks of the first unit cell.
+        placements = []
+        assignments = []
+        for vertex in vertices[:num_vertices]:
+            bb = building_blocks[vertex.id]
+            original_coords = bb.get_position_matrix()
+            placements.append(
+                vertex.place_building_block(bb, vertices, edges)
+            )
+            assignments.append(vertex.assign_func_groups_to_edges(
+                building_block=bb,
+                vertices=vertices,
+                edges=edges
+            ))
+            bb.set_position_matrix(original_coords)
+
+        # Shift the first unit cell onto every unit cell at once.
+        cell_positions = (
+            np.concatenate(placements)[np.newaxis]
+            + offsets[:, np.newaxis]
+        )
+        mol._position_matrix.extend(cell_positions.reshape(-1, 3))
+
+        bb_id = 0
+        # Use a shorter alias.
+        counter = mol.building_block_counter
+        for cell in cells:
+            # The unit cell holding each edge, once the edges of the
+            # first unit cell are shifted to this one.
+            edge_cells = np.repeat(
+                a=np.ravel_multi_index(
+                    ((cells + cell) % lattice_size).T,
+                    lattice_size
+                ),
+                repeats=num_edges
+            )
+            edge_ids = (
+                edge_cells*num_edges + np.arange(len(edges)) % num_edges
+            )
+            for vertex_id, bb in enumerate(building_blocks[:num_vertices]):
+                atom_map = self._assign_func_groups_to_edges(
+                    mol=mol,
+                    bb=bb,
+                    bb_id=bb_id,
+                    edges=edges,
+                    assignments={
+                        fg_id: edge_ids[edge_id]
+                        for fg_id, edge_id
+                        in assignments[vertex_id].items()
+                    }
+                )
+                mol.bonds.extend(b.clone(atom_map) for b in bb.bonds)
+                counter.update([bb])
+                bb_id += 1
+
     def _before_react(self, mol, vertices, edges):
         if self._periodic:
             return vertices, edges
@@ -891,11 +1130,12 @@ class COF(TopologyGraph):
 
         x, y, z = self._lattice_size
         periodic = ', periodic=True' if self._periodic else ''
+        tile = ', tile=True' if self._tile else ''
         return (
             f'cof.{self.__class__.__name__}('
             f'lattice_size=({x}, {y}, {z}), '
             f'vertex_alignments={{{vertex_alignments}}}'
-            f'{periodic})'
+            f'{periodic}{tile})'
         )
 
 
@@ -7,9 +7,57 @@ Host Guest Complex
 """
 
 
+import weakref
 import numpy as np
+from collections import namedtuple
+from scipy.spatial import cKDTree
 
 from .topology_graph import TopologyGraph, VertexData, Vertex
+from ...utilities import rotation_matrix
+
+
+# The geometry of a host, which is shared by every complex it is
+# placed in. It holds no references to the host, so that the host can
+# be garbage collected while it is a key of Complex._host_templates.
+_HostTemplate = namedtuple(
+    '_HostTemplate',
+    [
+        'position_matrix',
+        'positions',
+        'tree',
+    ]
+)
+
+
+def _get_random_rotations(generator, num_rotations):
+    """
+    Get uniformly distributed random rotation matrices.
+
+    Parameters
+    ----------
+    generator : :class:`numpy.random.RandomState`
+        The random number generator to use.
+
+    num_rotations : :class:`int`
+        The number of rotation matrices to make.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        An array of shape ``(num_rotations, 3, 3)``.
+
+    """
+
+    # Normalized 4D Gaussian samples are uniformly distributed unit
+    # quaternions.
+    quaternions = generator.normal(size=(num_rotations, 4))
+    quaternions /= np.linalg.norm(quaternions, axis=1)[:, np.newaxis]
+    w, x, y, z = quaternions.T
+    return np.array([
+        [1-2*(y*y+z*z), 2*(x*y-z*w), 2*(x*z+y*w)],
+        [2*(x*y+z*w), 1-2*(x*x+z*z), 2*(y*z-x*w)],
+        [2*(x*z-y*w), 2*(y*z+x*w), 1-2*(x*x+y*y)],
+    ]).transpose(2, 0, 1)
 
 
 class _HostVertexData(VertexData):
@@ -177,8 +225,21 @@ class Complex(TopologyGraph):
     `building_blocks` of the :class:`.ConstructedMolecule`
     and the guest must be second.
 
+    Complexes made with the same host share the centred positions of
+    the host and the KD-tree used to score trial poses, so screening
+    many guests against one host only calculates them once. The
+    :class:`.Atom`, :class:`.Bond` and :class:`.FunctionalGroup`
+    instances of the host are cloned for every complex.
+    :meth:`get_position_matrices` can be used to get the positions of
+    many complexes without constructing them.
+
     Attributes
     ----------
+    clash_distance : :class:`float`
+        A class attribute. The distance from a host atom, in
+        Angstrom, within which a guest atom is considered to overlap
+        with the host when trial poses are scored.
+
     vertices : :class:`tuple` of :class:`.Vertex`
         The vertices which make up the topology graph.
 
@@ -220,14 +281,35 @@ class Complex(TopologyGraph):
             )
         )
 
+    Search for a pose of the guest which does not overlap with the
+    host
+
+    .. code-block:: python
+
+        complex3 = stk.ConstructedMolecule(
+            building_blocks=[host, guest],
+            topology_graph=stk.host_guest.Complex(
+                displacement=[5.3, 2.1, 7.1],
+                num_trial_poses=1000
+            )
+        )
+
     """
 
+    clash_distance = 3.
+
+    # Maps hosts to their _HostTemplate.
+    _host_templates = weakref.WeakKeyDictionary()
+
     def __init__(
         self,
         guest_start=None,
         guest_target=None,
         displacement=None,
-        num_processes=1
+        num_processes=1,
+        num_trial_poses=0,
+        max_trial_displacement=1.,
+        random_seed=4
     ):
         """
         Initialize an instance of :class:`.Complex`.
@@ -251,6 +333,24 @@ class Complex(TopologyGraph):
             The number of parallel processes to create during
             :meth:`construct`.
 
+        num_trial_poses : :class:`int`, optional
+            The number of random poses of the guest which are tried
+            in addition to the pose defined by `guest_start`,
+            `guest_target` and `displacement`. Each trial pose
+            rotates the guest about its centroid and displaces it by
+            up to `max_trial_displacement`. The pose with the least
+            steric overlap with the host is used for construction.
+            The overlap of a pose is the sum, over the guest atoms,
+            of the squared amount by which each is closer than
+            :attr:`clash_distance` to its nearest host atom.
+
+        max_trial_displacement : :class:`float`, optional
+            The maximum distance a trial pose displaces the guest
+            from the pose defined by `displacement`.
+
+        random_seed : :class:`int`, optional
+            The random seed used to generate the trial poses.
+
         Raises
         ------
         :class:`TypeError`
@@ -279,6 +379,9 @@ class Complex(TopologyGraph):
         self._guest_start = guest_start
         self._guest_target = guest_target
         self._displacement = displacement
+        self._num_trial_poses = num_trial_poses
+        self._max_trial_displacement = max_trial_displacement
+        self._random_seed = random_seed
 
         if displacement is None:
             displacement = np.array([0, 0, 0])
@@ -331,6 +434,291 @@ class Complex(TopologyGraph):
             for bb, vertex in zip(building_blocks, self.vertices)
         }
 
+    def _place_building_blocks(self, mol, vertices, edges):
+        """
+        Place building blocks in `mol` on :attr:`vertices`.
+
+        The centred positions of the host are shared by all complexes
+        with the same host, so that they are only calculated once.
+
+        Parameters
+        ----------
+        mol : :class:`.ConstructedMolecule`
+            The molecule being constructed.
+
+        vertices : :class:`tuple` of :class:`.Vertex`
+            The vertex clones used for construction.
+
+        edges : :class:`tuple` of :class:`.Edge`
+            The edge clones used for construction.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        host_vertex, guest_vertex = vertices
+        vertex_building_blocks = {
+            vertex.id: bb
+            for bb, vertices_ in mol.building_block_vertices.items()
+            for vertex in vertices_
+        }
+        host = vertex_building_blocks[host_vertex.id]
+        guest = vertex_building_blocks[guest_vertex.id]
+
+        host_template = self._get_host_template(host)
+        host_atom_map = self._assign_func_groups_to_edges(
+            mol=mol,
+            bb=host,
+            bb_id=0,
+            edges=edges,
+            assignments={}
+        )
+        mol.bonds.extend(b.clone(host_atom_map) for b in host.bonds)
+        mol._position_matrix.extend(
+            host_template.positions + host_vertex.get_position()
+        )
+        mol.building_block_counter.update([host])
+
+        original_coords = guest.get_position_matrix()
+        guest_positions = guest_vertex.place_building_block(
+            building_block=guest,
+            vertices=vertices,
+            edges=edges
+        )
+        if self._num_trial_poses:
+            guest_positions = self._search_guest_pose(
+                host_tree=host_template.tree,
+                guest_positions=guest_positions
+            )
+        mol._position_matrix.extend(guest_positions)
+        atom_map = self._assign_func_groups_to_edges(
+            mol=mol,
+            bb=guest,
+            bb_id=1,
+            edges=edges,
+            assignments={}
+        )
+        guest.set_position_matrix(original_coords)
+        mol.bonds.extend(b.clone(atom_map) for b in guest.bonds)
+        mol.building_block_counter.update([guest])
+
+    @classmethod
+    def _get_host_template(cls, host):
+        """
+        Get the geometry of `host` shared by its complexes.
+
+        Parameters
+        ----------
+        host : :class:`.Molecule`
+            The host.
+
+        Returns
+        -------
+        :class:`._HostTemplate`
+            The host geometry. It is updated if `host` has moved
+            since it was last requested.
+
+        """
+
+        position_matrix = host.get_position_matrix()
+        template = cls._host_templates.get(host)
+        if template is not None and np.array_equal(
+            position_matrix,
+            template.position_matrix
+        ):
+            return template
+
+        positions = position_matrix - position_matrix.mean(axis=0)
+        template = _HostTemplate(
+            position_matrix=position_matrix,
+            positions=positions,
+            tree=cKDTree(positions)
+        )
+        cls._host_templates[host] = template
+        return template
+
+    def _search_guest_pose(self, host_tree, guest_positions):
+        """
+        Get the trial pose of the guest with the least host overlap.
+
+        Parameters
+        ----------
+        host_tree : :class:`scipy.spatial.cKDTree`
+            A tree of the host atom positions, with the host
+            centroid at the origin.
+
+        guest_positions : :class:`numpy.ndarray`
+            The ``(m, 3)`` positions of the guest atoms in the pose
+            defined by `guest_start`, `guest_target` and
+            `displacement`.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The ``(m, 3)`` positions of the guest atoms in the trial
+            pose with the least overlap. If no trial pose is better
+            than the initial pose, `guest_positions` is returned.
+
+        """
+
+        generator = np.random.RandomState(self._random_seed)
+        num_poses = self._num_trial_poses + 1
+        # The first pose is the initial pose.
+        rotations = _get_random_rotations(generator, num_poses)
+        rotations[0] = np.identity(3)
+        directions = generator.normal(size=(num_poses, 3))
+        directions /= np.linalg.norm(directions, axis=1)[:, np.newaxis]
+        # Scaling by the cube root of a uniform number gives points
+        # uniformly distributed in a sphere.
+        distances = (
+            self._max_trial_displacement
+            * np.cbrt(generator.uniform(size=num_poses))
+        )
+        distances[0] = 0
+        displacements = directions * distances[:, np.newaxis]
+
+        centroid = guest_positions.mean(axis=0)
+        trial_positions = np.einsum(
+            'pij,aj->pai',
+            rotations,
+            guest_positions - centroid
+        ) + (centroid + displacements)[:, np.newaxis, :]
+
+        # Guest atoms further than clash_distance from the host get a
+        # distance of infinity.
+        host_distances, _ = host_tree.query(
+            x=trial_positions.reshape(-1, 3),
+            distance_upper_bound=self.clash_distance
+        )
+        overlaps = np.square(
+            np.clip(self.clash_distance - host_distances, 0, None)
+        )
+        scores = overlaps.reshape(num_poses, -1).sum(axis=1)
+        return trial_positions[np.argmin(scores)]
+
+    @classmethod
+    def get_position_matrices(cls, host, guests, complexes=None):
+        """
+        Get the positions of many complexes in one pass.
+
+        The positions are the same as those of the
+        :class:`.ConstructedMolecule` made from `host`, a guest in
+        `guests` and a topology graph in `complexes`, but no
+        molecules are made and the host positions are only found
+        once.
+
+        Parameters
+        ----------
+        host : :class:`.Molecule`
+            The host.
+
+        guests : :class:`list` of :class:`.Molecule`
+            The guests.
+
+        complexes : :class:`list` of :class:`.Complex`, optional
+            The topology graphs, which define the poses of the
+            guests. If ``None``, only the default pose is used.
+
+        Returns
+        -------
+        :class:`tuple`
+            The first element is a ``(n, 3)`` array holding the
+            position matrix of the host, which is shared by all
+            complexes. The second element is a :class:`list`, holding
+            an array of shape ``(len(complexes), m, 3)`` for each
+            guest. Element ``[i]`` of the array is the position
+            matrix of the guest in ``complexes[i]``, which follows
+            the host in the position matrix of the complex.
+
+        Examples
+        --------
+        Screen the overlap of many guests in a few poses
+
+        .. code-block:: python
+
+            import numpy as np
+            from scipy.spatial.distance import cdist
+
+            complexes = [
+                stk.host_guest.Complex(),
+                stk.host_guest.Complex(displacement=[1, 0, 0]),
+            ]
+            host_positions, guest_positions = (
+                stk.host_guest.Complex.get_position_matrices(
+                    host=host,
+                    guests=guests,
+                    complexes=complexes
+                )
+            )
+            for guest, positions in zip(guests, guest_positions):
+                for complex_, guest_pose in zip(complexes, positions):
+                    min_distance = cdist(
+                        host_positions,
+                        guest_pose
+                    ).min()
+
+        The identity keys of the complexes can be found without
+        constructing them
+
+        .. code-block:: python
+
+            identity_keys = [
+                stk.ConstructedMolecule(
+                    building_blocks=[host, guest],
+                    topology_graph=complex_,
+                    lazy=True
+                ).get_identity_key()
+                for guest in guests
+                for complex_ in complexes
+            ]
+
+        """
+
+        if complexes is None:
+            complexes = [cls()]
+
+        host_template = cls._get_host_template(host)
+
+        guest_positions = [
+            guest.get_position_matrix() for guest in guests
+        ]
+        for positions in guest_positions:
+            positions -= positions.mean(axis=0)
+
+        rotations = np.array([
+            rotation_matrix(
+                vector1=complex_.vertices[1]._start,
+                vector2=complex_.vertices[1]._target
+            )
+            for complex_ in complexes
+        ])
+        displacements = np.array([
+            complex_.vertices[1].get_position()
+            for complex_ in complexes
+        ])
+        all_guest_positions = np.einsum(
+            'cij,aj->cai',
+            rotations,
+            np.concatenate(guest_positions),
+        ) + displacements[:, np.newaxis, :]
+        split_ids = np.cumsum([len(p) for p in guest_positions])[:-1]
+        guest_positions = np.split(
+            all_guest_positions,
+            split_ids,
+            axis=1
+        )
+        for complex_id, complex_ in enumerate(complexes):
+            if not complex_._num_trial_poses:
+                continue
+            for positions in guest_positions:
+                positions[complex_id] = complex_._search_guest_pose(
+                    host_tree=host_template.tree,
+                    guest_positions=positions[complex_id]
+                )
+        return np.array(host_template.positions), guest_positions
+
     def _get_scale(self, mol):
         """
         Get the scale used for the positions of :attr:`vertices`.
@@ -357,5 +745,15 @@ class Complex(TopologyGraph):
             f'host_guest.Complex('
             f'guest_start={self._guest_start!r}, '
             f'guest_target={self._guest_target!r}, '
-            f'displacement={self._displacement!r})'
+            f'displacement={self._displacement!r}'
+            f'{self._get_pose_search_repr()})'
+        )
+
+    def _get_pose_search_repr(self):
+        if not self._num_trial_poses:
+            return ''
+        return (
+            f', num_trial_poses={self._num_trial_poses!r}, '
+            f'max_trial_displacement={self._max_trial_displacement!r}, '
+            f'random_seed={self._random_seed!r}'
         )
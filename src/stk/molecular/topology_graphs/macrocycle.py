@@ -11,6 +11,7 @@ import logging
 from scipy.spatial.distance import euclidean
 
 from .topology_graph import TopologyGraph, VertexData, Vertex, EdgeData
+from ...utilities import rotation_matrix_arbitrary_axis
 
 
 logger = logging.getLogger(__name__)
@@ -171,6 +172,17 @@ class _CycleVertex(Vertex):
             ))
         }
 
+    def _has_symmetric_placement(
+        self,
+        vertex,
+        rotation,
+        translation,
+        edge_map,
+        vertices,
+        edges
+    ):
+        return self._flip == vertex._flip
+
     def _fg0_distance(self, building_block, edge_id, edges):
         fg_position = building_block.get_centroid(
             atom_ids=building_block.func_groups[0].get_bonder_ids()
@@ -246,7 +258,8 @@ class Macrocycle(TopologyGraph):
         num_repeating_units,
         orientations=None,
         random_seed=None,
-        num_processes=1
+        num_processes=1,
+        use_symmetry=False
     ):
         """
         Initialize a :class:`Macrocycle` instance.
@@ -290,6 +303,12 @@ class Macrocycle(TopologyGraph):
             The number of parallel processes to create during
             :meth:`construct`.
 
+        use_symmetry : :class:`bool`, optional
+            If ``True``, serial construction places a building block
+            on only one vertex of each set of repeating unit
+            positions with the same orientation, and generates the
+            placement on the others by rotation.
+
         """
 
         if orientations is None:
@@ -341,11 +360,28 @@ class Macrocycle(TopologyGraph):
         self._orientations = tuple(int(v.flip) for v in vertex_data)
 
         edge_data.append(EdgeData(vertex_data[0], vertex_data[-1]))
+
+        # Rotating by a whole number of repeating units maps the
+        # macrocycle onto itself.
+        symmetry_operations = ()
+        if use_symmetry:
+            symmetry_operations = tuple(
+                (
+                    rotation_matrix_arbitrary_axis(
+                        angle=i*len(repeating_unit)*angle_diff,
+                        axis=np.array([0, 0, 1])
+                    ),
+                    np.zeros(3)
+                )
+                for i in range(1, num_repeating_units)
+            )
+
         super().__init__(
             vertex_data=tuple(vertex_data),
             edge_data=tuple(edge_data),
             construction_stages=(),
-            num_processes=num_processes
+            num_processes=num_processes,
+            symmetry_operations=symmetry_operations
         )
 
     @staticmethod
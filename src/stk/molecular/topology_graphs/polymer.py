@@ -7,7 +7,11 @@ Polymer
 """
 
 import logging
+import itertools as it
+import weakref
 import numpy as np
+import rdkit.Chem.AllChem as rdkit
+from collections import namedtuple
 
 from .topology_graph import TopologyGraph, VertexData, Vertex, EdgeData
 
@@ -15,6 +19,50 @@ from .topology_graph import TopologyGraph, VertexData, Vertex, EdgeData
 logger = logging.getLogger(__name__)
 
 
+# The placement of a building block on a kind of vertex. The
+# positions are relative to the position of the vertex and the
+# edge slots map the id of each functional group to the index of its
+# edge in the edges of the vertex.
+_Placement = namedtuple('_Placement', ['positions', 'edge_slots'])
+
+# The data of a building block which is shared by all chains it is
+# placed in. The placements are held in a dict, which maps the
+# class of a vertex and the flip of the vertex to a _Placement.
+_MonomerData = namedtuple(
+    '_MonomerData',
+    ['position_matrix', 'maximum_diameter', 'placements']
+)
+
+
+def _has_equivalent_func_groups(building_block):
+    """
+    Check if the functional groups of `building_block` are equivalent.
+
+    Parameters
+    ----------
+    building_block : :class:`.Molecule`
+        A building block with two functional groups.
+
+    Returns
+    -------
+    :class:`bool`
+        ``True`` if the atoms of both functional groups are
+        topologically equivalent, which means that flipping
+        `building_block` along a chain gives the same polymer.
+
+    """
+
+    ranks = rdkit.CanonicalRankAtoms(
+        building_block.to_rdkit_mol(),
+        breakTies=False
+    )
+    fg1, fg2 = (
+        sorted(ranks[atom_id] for atom_id in fg.get_atom_ids())
+        for fg in building_block.func_groups
+    )
+    return fg1 == fg2
+
+
 class _LinearVertexData(VertexData):
     """
     Holds the data of a linear polymer vertex.
@@ -499,6 +547,10 @@ class Linear(TopologyGraph):
         p6 = stk.ConstructedMolecule([bb2, bb4], chain2)
         p7 = stk.ConstructedMolecule([bb2, bb4], chain2)
 
+    Building blocks are placed on the first vertex of each kind and
+    orientation only, and then translated along the chain to the other
+    vertices, so that very long chains can be built quickly.
+
     The `random_seed` parameter can be used to get reproducible results
 
     .. code-block:: python
@@ -522,9 +574,46 @@ class Linear(TopologyGraph):
         )
         p9 = stk.ConstructedMolecule([bb2, bb4], chain4)
 
+    All chains of a given length can be enumerated with
+    :meth:`get_unique_chains`, which skips chains that are the
+    reverse of one already yielded. Combined with
+    :meth:`.Population.iter_all`, large sequence spaces can be
+    screened without holding all polymers in memory
+
+    .. code-block:: python
+
+        chains = stk.polymer.Linear.get_unique_chains(
+            building_blocks=[bb2, bb4, bb3],
+            num_vertices=8
+        )
+        polymers = stk.Population.iter_all(
+            building_blocks=[[bb2], [bb4], [bb3]],
+            topology_graphs=chains,
+            num_processes=4
+        )
+        for polymer in polymers:
+            ...
+
+    Reversed chains are also given the same identity key, so
+    that they are recognized as the same molecule
+
+    .. code-block:: python
+
+        p10 = stk.ConstructedMolecule(
+            building_blocks=[bb1, bb2, bb3],
+            topology_graph=stk.polymer.Linear('CAAB', 1, (0, 0, 1, 0))
+        )
+        p11 = stk.ConstructedMolecule(
+            building_blocks=[bb1, bb2, bb3],
+            topology_graph=stk.polymer.Linear('BAAC', 1, (1, 0, 1, 0))
+        )
+        assert p10.get_identity_key() == p11.get_identity_key()
 
     """
 
+    # Maps each building block to its _MonomerData.
+    _monomer_data = weakref.WeakKeyDictionary()
+
     def __init__(
         self,
         repeating_unit,
@@ -579,7 +668,8 @@ class Linear(TopologyGraph):
         ------
         :class:`ValueError`
             If the length of `orientations` is not equal in length to
-            `repeating_unit` or to the total number of vertices.
+            `repeating_unit` or to the total number of vertices, or if
+            a value in `orientations` is not between ``0`` and ``1``.
 
         """
 
@@ -599,6 +689,12 @@ class Linear(TopologyGraph):
                 'total number of vertices.'
             )
 
+        probabilities = np.array(orientations, dtype=np.float64)
+        if np.any((probabilities < 0) | (probabilities > 1)):
+            raise ValueError(
+                'The values in orientations must be between 0 and 1.'
+            )
+
         generator = np.random.RandomState(random_seed)
 
         # Keep these for __repr__.
@@ -607,19 +703,15 @@ class Linear(TopologyGraph):
         )
         self._num_repeating_units = num_repeating_units
 
-        head, *body, tail = orientations
-        choices = [True, False]
-        vertex_data = [
-            _HeadVertexData(
-                x=0,
-                y=0,
-                z=0,
-                flip=generator.choice(choices, p=[head, 1-head])
-            )
-        ]
+        # This draws the same flips as calling generator.choice() with
+        # p=[p, 1-p] for each vertex in turn, but in a single call.
+        head, *body, tail = (
+            generator.random_sample(len(probabilities))
+            < probabilities / (probabilities + (1 - probabilities))
+        )
+        vertex_data = [_HeadVertexData(x=0, y=0, z=0, flip=head)]
         edge_data = []
-        for i, p in enumerate(body, 1):
-            flip = generator.choice(choices, p=[p, 1-p])
+        for i, flip in enumerate(body, 1):
             v = _LinearVertexData(i, 0, 0, flip)
             vertex_data.append(v)
             edge_data.append(
@@ -631,7 +723,8 @@ class Linear(TopologyGraph):
                 x=len(vertex_data),
                 y=0,
                 z=0,
-                flip=generator.choice(choices, p=[tail, 1-tail]))
+                flip=tail
+            )
         )
 
         # Save the chosen orientations for __repr__.
@@ -646,6 +739,128 @@ class Linear(TopologyGraph):
             num_processes=num_processes
         )
 
+    @classmethod
+    def get_unique_sequences(cls, building_blocks, num_vertices):
+        """
+        Yield the sequences of all unique chains.
+
+        Two chains are the same if one is the reverse of the other.
+        Reversing a chain reverses the order of its building blocks
+        and flips each one. Only one chain of each such pair is
+        yielded. Building blocks with one functional group are only
+        placed at the ends of the chain. The orientation of building
+        blocks with one functional group, or with two equivalent
+        functional groups, is never varied.
+
+        The sequences are generated lazily, so that chains can be
+        constructed as they are yielded.
+
+        Parameters
+        ----------
+        building_blocks : :class:`list` of :class:`.Molecule`
+            The building blocks, which will be used for construction.
+
+        num_vertices : :class:`int`
+            The number of building blocks in each chain.
+
+        Yields
+        ------
+        :class:`tuple`
+            A :class:`tuple` of the form
+            ``(repeating_unit, orientations)``. ``repeating_unit``
+            holds the index in `building_blocks` of the building block
+            on each vertex and ``orientations`` holds ``1`` for each
+            flipped building block and ``0`` otherwise. They can be
+            used as the `repeating_unit` and `orientations` of
+            :meth:`__init__`, when `num_repeating_units` is ``1``.
+
+        Raises
+        ------
+        :class:`ValueError`
+            If `num_vertices` is less than ``2``.
+
+        """
+
+        if num_vertices < 2:
+            raise ValueError('A chain must have at least 2 vertices.')
+
+        caps = {
+            bb_id for bb_id, bb in enumerate(building_blocks)
+            if len(bb.func_groups) == 1
+        }
+        symmetric = caps | {
+            bb_id for bb_id, bb in enumerate(building_blocks)
+            if len(bb.func_groups) == 2
+            and _has_equivalent_func_groups(bb)
+        }
+
+        def get_units(bb_ids):
+            for bb_id in bb_ids:
+                yield bb_id, 0
+                if bb_id not in symmetric:
+                    yield bb_id, 1
+
+        terminal_units = tuple(get_units(range(len(building_blocks))))
+        body_units = tuple(get_units(
+            bb_id for bb_id in range(len(building_blocks))
+            if bb_id not in caps
+        ))
+        chains = it.product(
+            terminal_units,
+            *(body_units for i in range(num_vertices-2)),
+            terminal_units
+        )
+        for chain in chains:
+            reverse = tuple(
+                (bb_id, flip if bb_id in symmetric else 1-flip)
+                for bb_id, flip in reversed(chain)
+            )
+            if chain <= reverse:
+                repeating_unit, orientations = zip(*chain)
+                yield repeating_unit, orientations
+
+    @classmethod
+    def get_unique_chains(
+        cls,
+        building_blocks,
+        num_vertices,
+        num_processes=1
+    ):
+        """
+        Yield topology graphs of all unique chains.
+
+        Parameters
+        ----------
+        building_blocks : :class:`list` of :class:`.Molecule`
+            The building blocks, which will be used for construction.
+
+        num_vertices : :class:`int`
+            The number of building blocks in each chain.
+
+        num_processes : :class:`int`, optional
+            The number of parallel processes to create during
+            :meth:`construct`.
+
+        Yields
+        ------
+        :class:`Linear`
+            The topology graph of a chain. See
+            :meth:`get_unique_sequences`.
+
+        """
+
+        sequences = cls.get_unique_sequences(
+            building_blocks=building_blocks,
+            num_vertices=num_vertices
+        )
+        for repeating_unit, orientations in sequences:
+            yield cls(
+                repeating_unit=repeating_unit,
+                num_repeating_units=1,
+                orientations=orientations,
+                num_processes=num_processes
+            )
+
     @staticmethod
     def _normalize_repeating_unit(repeating_unit):
         if isinstance(repeating_unit, tuple):
@@ -700,6 +915,72 @@ class Linear(TopologyGraph):
             building_block_vertices[bb].append(vertex)
         return building_block_vertices
 
+    def _get_identity_key(self, building_block_vertices, vertices):
+        """
+        Return the topology graph part of an identity key.
+
+        The key is the same for a chain and its reverse, as defined
+        in :meth:`get_unique_sequences`.
+
+        Parameters
+        ----------
+        building_block_vertices : :class:`dict`
+            Maps the building block molecules to the
+            :class:`~.topologies.base.Vertex` objects they are placed
+            on.
+
+        vertices : :class:`tuple`
+            For each building block molecule, holds a :class:`tuple`
+            of its identity key and the sorted ids of the vertices it
+            is placed on. The building block molecules are in a
+            canonical order.
+
+        Returns
+        -------
+        :class:`tuple`
+            The part of the identity key of a
+            :class:`.ConstructedMolecule`, which depends on the
+            topology graph. It holds the identity keys of the
+            building blocks in `vertices` and, for each vertex, the
+            index of its building block and its orientation.
+
+        """
+
+        labels = {}
+        for label, (bb_key, vertex_ids) in enumerate(vertices):
+            for vertex_id in vertex_ids:
+                labels[vertex_id] = label
+
+        # The orientation of a cap does not change the polymer.
+        caps = {
+            vertex.id
+            for bb, bb_vertices in building_block_vertices.items()
+            if len(bb.func_groups) == 1
+            for vertex in bb_vertices
+        }
+        # Same as in get_unique_sequences(), reversing the chain does
+        # not flip caps and building blocks with two equivalent
+        # functional groups.
+        symmetric = caps | {
+            vertex.id
+            for bb, bb_vertices in building_block_vertices.items()
+            if len(bb.func_groups) == 2
+            and _has_equivalent_func_groups(bb)
+            for vertex in bb_vertices
+        }
+        chain = tuple(
+            (labels[vertex_id], 0 if vertex_id in caps else flip)
+            for vertex_id, flip in enumerate(self._orientations)
+        )
+        reverse = tuple(
+            (label, flip if vertex_id in symmetric else 1-flip)
+            for vertex_id, (label, flip) in reversed(
+                tuple(enumerate(chain))
+            )
+        )
+        bb_keys = tuple(bb_key for bb_key, vertex_ids in vertices)
+        return 'polymer.Linear', bb_keys, min(chain, reverse)
+
     def _get_scale(self, mol):
         """
         Get the scale used for the positions of :attr:`vertices`.
@@ -720,10 +1001,185 @@ class Linear(TopologyGraph):
         """
 
         return max(
-            bb.get_maximum_diameter()
+            self._get_monomer_data(bb).maximum_diameter
             for bb in mol.building_block_vertices
         )
 
+    @classmethod
+    def _get_monomer_data(cls, building_block):
+        """
+        Get the data of `building_block` shared by all chains.
+
+        Parameters
+        ----------
+        building_block : :class:`.Molecule`
+            A building block of the chain.
+
+        Returns
+        -------
+        :class:`._MonomerData`
+            The data of `building_block`. It is recalculated if
+            `building_block` has moved since it was last requested.
+
+        """
+
+        position_matrix = building_block.get_position_matrix()
+        data = cls._monomer_data.get(building_block)
+        if data is None or not np.array_equal(
+            position_matrix,
+            data.position_matrix
+        ):
+            data = _MonomerData(
+                position_matrix=position_matrix,
+                maximum_diameter=building_block.get_maximum_diameter(),
+                placements={}
+            )
+            cls._monomer_data[building_block] = data
+        return data
+
+    def _place_building_blocks(self, mol, vertices, edges):
+        """
+        Place building blocks in `mol` on :attr:`vertices`.
+
+        When construction is serial, a building block is only placed
+        on the first vertex of each kind and orientation. Its
+        positions on the other vertices are found by translation, and
+        written into a preallocated array.
+
+        Parameters
+        ----------
+        mol : :class:`.ConstructedMolecule`
+            The molecule being constructed.
+
+        vertices : :class:`tuple` of :class:`.Vertex`
+            The vertex clones used for construction.
+
+        edges : :class:`tuple` of :class:`.Edge`
+            The edge clones used for construction.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        if self._num_processes != 1:
+            return super()._place_building_blocks(mol, vertices, edges)
+
+        vertex_building_blocks = {
+            vertex.id: bb
+            for bb, bb_vertices in mol.building_block_vertices.items()
+            for vertex in bb_vertices
+        }
+        monomer_data = {
+            bb: self._get_monomer_data(bb)
+            for bb in mol.building_block_vertices
+        }
+        num_atoms = sum(
+            len(bb.atoms) for bb in vertex_building_blocks.values()
+        )
+        position_matrix = np.empty((num_atoms, 3))
+        start = 0
+        bb_id = 0
+        # Use a shorter alias.
+        counter = mol.building_block_counter
+        for stage in self._stages:
+            for instance_vertex in stage:
+                vertex = vertices[instance_vertex.id]
+                bb = vertex_building_blocks[vertex.id]
+                placement = self._get_placement(
+                    building_block=bb,
+                    monomer_data=monomer_data[bb],
+                    vertex=vertex,
+                    vertices=vertices,
+                    edges=edges
+                )
+                end = start + len(bb.atoms)
+                position_matrix[start:end] = (
+                    placement.positions + vertex.get_position()
+                )
+                start = end
+
+                edge_ids = tuple(vertex.get_edge_ids())
+                atom_map = self._assign_func_groups_to_edges(
+                    mol=mol,
+                    bb=bb,
+                    bb_id=bb_id,
+                    edges=edges,
+                    assignments={
+                        fg_id: edge_ids[slot]
+                        for fg_id, slot in placement.edge_slots.items()
+                    }
+                )
+                mol.bonds.extend(b.clone(atom_map) for b in bb.bonds)
+                counter.update([bb])
+                bb_id += 1
+
+        mol._position_matrix.extend(position_matrix)
+
+    @staticmethod
+    def _get_placement(
+        building_block,
+        monomer_data,
+        vertex,
+        vertices,
+        edges
+    ):
+        """
+        Get the placement of `building_block` on `vertex`.
+
+        Parameters
+        ----------
+        building_block : :class:`.Molecule`
+            The building block to place.
+
+        monomer_data : :class:`._MonomerData`
+            The data of `building_block`, which holds its placements
+            on vertices seen before.
+
+        vertex : :class:`._LinearVertex`
+            The vertex on which `building_block` is placed.
+
+        vertices : :class:`tuple` of :class:`.Vertex`
+            The vertex clones used for construction.
+
+        edges : :class:`tuple` of :class:`.Edge`
+            The edge clones used for construction.
+
+        Returns
+        -------
+        :class:`._Placement`
+            The placement of `building_block`.
+
+        """
+
+        key = vertex.__class__, vertex._flip
+        placement = monomer_data.placements.get(key)
+        if placement is not None:
+            return placement
+
+        position_matrix = vertex.place_building_block(
+            building_block,
+            vertices,
+            edges
+        )
+        assignments = vertex.assign_func_groups_to_edges(
+            building_block=building_block,
+            vertices=vertices,
+            edges=edges
+        )
+        building_block.set_position_matrix(monomer_data.position_matrix)
+        edge_ids = list(vertex.get_edge_ids())
+        placement = _Placement(
+            positions=position_matrix - vertex.get_position(),
+            edge_slots={
+                fg_id: edge_ids.index(edge_id)
+                for fg_id, edge_id in assignments.items()
+            }
+        )
+        monomer_data.placements[key] = placement
+        return placement
+
     def __repr__(self):
         return (
             f'polymer.Linear({self._repeating_unit!r}, '
@@ -7,10 +7,13 @@ Rotaxane
 """
 
 
+import weakref
 import numpy as np
 import rdkit.Chem.AllChem as rdkit
+from collections import namedtuple
 
 from .topology_graph import TopologyGraph, VertexData, Vertex
+from ...utilities import rotation_matrix
 
 
 class _AxleVertexData(VertexData):
@@ -32,6 +35,13 @@ class _AxleVertex(Vertex):
         return {}
 
 
+# The largest ring of a macrocycle building block and its local frame.
+_MacrocycleFrame = namedtuple(
+    '_MacrocycleFrame',
+    ['atom_ids', 'atom_positions', 'centroid', 'normal']
+)
+
+
 class _CycleVertexData(VertexData):
     """
     Holds data for a :class:`._CycleVertex`.
@@ -102,6 +112,11 @@ class _CycleVertex(Vertex):
 
     """
 
+    # Maps building blocks to the _MacrocycleFrame of their largest
+    # ring, so that ring perception is done once per building block,
+    # rather than once per placement.
+    _macrocycle_frames = weakref.WeakKeyDictionary()
+
     def __init__(self, data):
         self._flip = data.flip
         super().__init__(data)
@@ -112,20 +127,59 @@ class _CycleVertex(Vertex):
         return clone
 
     def place_building_block(self, building_block, vertices, edges):
-        rdkit_mol = building_block.to_rdkit_mol()
-        macrocycle = max(rdkit.GetSymmSSSR(rdkit_mol), key=len)
-        cycle_normal = building_block.get_plane_normal(macrocycle)
-        building_block.set_centroid(
-            position=self._position,
-            atom_ids=macrocycle
+        frame = self._get_macrocycle_frame(building_block)
+        rotation = rotation_matrix(
+            vector1=frame.normal,
+            vector2=[-1 if self._flip else 1, 0, 0]
         )
-        building_block.apply_rotation_between_vectors(
-            start=cycle_normal,
-            target=[-1 if self._flip else 1, 0, 0],
-            origin=self._position
+        position_matrix = building_block.get_position_matrix()
+        building_block.set_position_matrix(
+            (position_matrix - frame.centroid) @ rotation.T
+            + self._position
         )
         return building_block.get_position_matrix()
 
+    @classmethod
+    def _get_macrocycle_frame(cls, building_block):
+        """
+        Get the frame of the largest ring in `building_block`.
+
+        Parameters
+        ----------
+        building_block : :class:`.Molecule`
+            The macrocycle.
+
+        Returns
+        -------
+        :class:`._MacrocycleFrame`
+            The frame of the largest ring. The ring is only perceived
+            the first time the frame of `building_block` is requested.
+            The centroid and normal of the ring are recalculated if
+            the ring atoms have moved since then.
+
+        """
+
+        frame = cls._macrocycle_frames.get(building_block)
+        if frame is None:
+            rdkit_mol = building_block.to_rdkit_mol()
+            atom_ids = list(max(rdkit.GetSymmSSSR(rdkit_mol), key=len))
+        else:
+            atom_ids = frame.atom_ids
+
+        atom_positions = building_block.get_position_matrix()[atom_ids]
+        if frame is None or not np.array_equal(
+            atom_positions,
+            frame.atom_positions
+        ):
+            frame = _MacrocycleFrame(
+                atom_ids=atom_ids,
+                atom_positions=atom_positions,
+                centroid=atom_positions.mean(axis=0),
+                normal=building_block.get_plane_normal(atom_ids)
+            )
+            cls._macrocycle_frames[building_block] = frame
+        return frame
+
     def assign_func_groups_to_edges(
         self,
         building_block,
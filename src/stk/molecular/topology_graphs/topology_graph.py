@@ -24,6 +24,16 @@ into separate stages. However,
 if this is not the case, then an empty :class:`tuple` can simply be
 passed.
 
+If the topology graph has symmetry, the :class:`.TopologyGraph`
+subclass can also pass `symmetry_operations` to
+:meth:`.TopologyGraph.__init__`. During serial construction, a
+building block is then only placed on one vertex of each set of
+symmetry equivalent vertices, and the placement on the remaining
+vertices is generated by applying the symmetry operations to it.
+If the placement done by a :class:`.Vertex` subclass depends on more
+than the positions of the vertex and its edges, it should implement
+:meth:`~.Vertex._has_symmetric_placement`.
+
 Why is both :class:`.VertexData` and :class:`.Vertex` needed?
 -------------------------------------------------------------
 
@@ -62,9 +72,10 @@ into its :class:`.Vertex` counterpart.
 import numpy as np
 import pathos
 from collections import namedtuple
+from scipy.spatial import cKDTree
 
 from ..reactor import Reactor
-from ...utilities import vector_angle
+from ...utilities import vector_angle, kabsch
 
 
 class VertexData:
@@ -455,6 +466,62 @@ class Vertex:
 
         return
 
+    def _has_symmetric_placement(
+        self,
+        vertex,
+        rotation,
+        translation,
+        edge_map,
+        vertices,
+        edges
+    ):
+        """
+        Check if a symmetry operation maps placement onto `vertex`.
+
+        The symmetry operation already maps the position of the
+        vertex onto the position of `vertex` and the edges of the
+        vertex onto the edges of `vertex`. This method checks that
+        any other state used by :meth:`place_building_block` is also
+        mapped.
+
+        It returns ``True`` by default, but should be overridden when
+        necessary.
+
+        Parameters
+        ----------
+        vertex : :class:`.Vertex`
+            The vertex onto which the symmetry operation maps this
+            vertex.
+
+        rotation : :class:`numpy.ndarray`
+            The ``(3, 3)`` rotation matrix of the symmetry operation.
+
+        translation : :class:`numpy.ndarray`
+            The translation of the symmetry operation.
+
+        edge_map : :class:`dict`
+            Maps the id of every edge connected to the vertex to the
+            id of the edge connected to `vertex` it is mapped onto.
+
+        vertices : :class:`tuple` of :class:`.Vertex`
+            All vertices in the topology graph. The index of each
+            vertex must match its :class:`~.Vertex.id`.
+
+        edges : :class:`tuple` of :class:`.Edge`
+            All edges in the topology graph. The index of each
+            edge must match its :class:`~.Edge.id`.
+
+        Returns
+        -------
+        :class:`bool`
+            ``True`` if the symmetry operation maps a building block
+            placed on the vertex onto a building block placed on
+            `vertex`.
+
+        """
+
+        return True
+
     def _get_edge_centroid(self, centroid_edges, vertices):
         """
         Return the centroid of `centroid_edges`.
@@ -998,6 +1065,14 @@ def _place_building_blocks(vertices, edges):
     return inner
 
 
+# Describes how the placement on a vertex is generated from the
+# placement on the representative vertex of its symmetry orbit.
+_SymmetryImage = namedtuple(
+    '_SymmetryImage',
+    ['representative', 'rotation', 'edge_map']
+)
+
+
 class TopologyGraph:
     """
     Represents topology graphs of :class:`.ConstructedMolecule`.
@@ -1042,7 +1117,8 @@ class TopologyGraph:
         vertex_data,
         edge_data,
         construction_stages,
-        num_processes
+        num_processes,
+        symmetry_operations=()
     ):
         """
         Initialize an instance of :class:`.TopologyGraph`.
@@ -1079,6 +1155,20 @@ class TopologyGraph:
             The number of parallel processes to create during
             :meth:`construct`.
 
+        symmetry_operations : :class:`tuple`, optional
+            The symmetry operations of the graph. Each is a
+            :class:`tuple` of the form ``(rotation, translation)``,
+            where ``rotation`` is a ``(3, 3)`` proper rotation matrix
+            and ``translation`` is a translation vector. Together,
+            they map the position of every vertex onto the position of
+            a vertex, or outside of the graph. When construction is
+            serial, a building block is only placed on one vertex of
+            each symmetry orbit, and the placement on the remaining
+            vertices holding the same building block is generated by
+            the symmetry operations. The positions of the atoms
+            agree with regular placement to within floating point
+            precision.
+
         """
 
         self._set_data_ids(vertex_data)
@@ -1092,6 +1182,14 @@ class TopologyGraph:
         self._construction_stages = construction_stages
         self._set_stages()
         self._num_processes = num_processes
+        self._symmetry_operations = tuple(
+            (np.array(rotation), np.array(translation))
+            for rotation, translation in symmetry_operations
+        )
+        # Calculated lazily by _get_symmetry_maps().
+        self._symmetry_maps = None
+        # Calculated lazily by _get_repr().
+        self._repr = None
 
     def _set_data_ids(self, data):
         for i, data in enumerate(data):
@@ -1111,7 +1209,7 @@ class TopologyGraph:
             if not placed:
                 self._stages[-1].append(vertex)
 
-    def construct(self, mol):
+    def construct(self, mol, parent=None):
         """
         Construct a :class:`.ConstructedMolecule`.
 
@@ -1121,6 +1219,20 @@ class TopologyGraph:
             The :class:`.ConstructedMolecule` instance which needs to
             be constructed.
 
+        parent : :class:`.ConstructedMolecule`, optional
+            A molecule with an equivalent topology graph, which
+            differs from `mol` only by the building blocks on some of
+            the vertices. Building blocks are only placed on the
+            vertices holding a different building block to `parent`.
+            The atoms on the other vertices keep their positions in
+            `parent`, which means any optimization of `parent` is
+            carried over. The scale of `parent` is used for the
+            positions of :attr:`vertices`, so that the carried over
+            positions stay consistent. If the building blocks of
+            `mol` need a larger scale than `parent`, they would
+            not fit into its structure and `parent` is ignored. If
+            `parent` is used, construction is always done serially.
+
         Returns
         -------
         None : :class:`NoneType`
@@ -1128,11 +1240,28 @@ class TopologyGraph:
         """
 
         scale = self._get_scale(mol)
+        if parent is not None:
+            parent_scale = self._get_scale(parent)
+            if np.all(np.less_equal(scale, parent_scale)):
+                scale = parent_scale
+            else:
+                parent = None
         vertices = tuple(self._get_vertex_clones(mol, scale))
         edges = tuple(self._get_edge_clones(scale))
 
         self._prepare(mol)
-        self._place_building_blocks(mol, vertices, edges)
+        if parent is None:
+            self._place_building_blocks(mol, vertices, edges)
+        else:
+            self._place_building_blocks_serial(
+                mol=mol,
+                vertices=vertices,
+                edges=edges,
+                parent_placements=self._get_parent_placements(
+                    mol=mol,
+                    parent=parent
+                )
+            )
 
         vertices, edges = self._before_react(mol, vertices, edges)
         reactor = Reactor(mol)
@@ -1189,6 +1318,56 @@ class TopologyGraph:
 
         raise NotImplementedError()
 
+    def _get_identity_key(self, building_block_vertices, vertices):
+        """
+        Return the topology graph part of an identity key.
+
+        Subclasses can override this method if different topology
+        graphs, or different placements of building blocks, construct
+        the same molecule.
+
+        Parameters
+        ----------
+        building_block_vertices : :class:`dict`
+            Maps the building block molecules to the
+            :class:`~.topologies.base.Vertex` objects they are placed
+            on.
+
+        vertices : :class:`tuple`
+            For each building block molecule, holds a :class:`tuple`
+            of its identity key and the sorted ids of the vertices it
+            is placed on. The building block molecules are in a
+            canonical order.
+
+        Returns
+        -------
+        :class:`tuple`
+            The part of the identity key of a
+            :class:`.ConstructedMolecule`, which depends on the
+            topology graph.
+
+        """
+
+        return self._get_repr(), vertices
+
+    def _get_repr(self):
+        """
+        Return the :func:`repr` of the topology graph.
+
+        The :func:`repr` is calculated once and reused, as it is part
+        of identity keys and used to compare topology graphs.
+
+        Returns
+        -------
+        :class:`str`
+            The :func:`repr` of the topology graph.
+
+        """
+
+        if self._repr is None:
+            self._repr = repr(self)
+        return self._repr
+
     def _get_scale(self, mol):
         """
         Get the scale used for vertex and edge positions.
@@ -1365,7 +1544,390 @@ class TopologyGraph:
             )
         return atom_map
 
-    def _place_building_blocks_serial(self, mol, vertices, edges):
+    def _get_symmetry_maps(self):
+        """
+        Get the vertex maps of the symmetry operations.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`tuple`
+            For each symmetry operation, a :class:`tuple` of the form
+            ``(rotation, vertex_map)``. ``vertex_map`` is a
+            :class:`dict` which maps the id of a vertex to a
+            :class:`tuple` holding the id of the vertex it is mapped
+            onto and a :class:`dict` mapping the ids of its edges
+            onto the ids of the edges of that vertex. Vertices which
+            are not mapped onto an equivalent vertex are not present.
+
+        """
+
+        if self._symmetry_maps is not None:
+            return self._symmetry_maps
+
+        positions = np.array([
+            vertex.get_position() for vertex in self.vertices
+        ])
+        tree = cKDTree(positions)
+        symmetry_maps = []
+        for rotation, translation in self._symmetry_operations:
+            images = positions @ rotation.T + translation
+            distances, image_ids = tree.query(
+                x=images,
+                distance_upper_bound=1e-6
+            )
+            vertex_map = {}
+            for vertex, distance, image_id in zip(
+                self.vertices,
+                distances,
+                image_ids
+            ):
+                # Vertices mapped outside of the graph have an
+                # infinite distance.
+                if np.isinf(distance):
+                    continue
+
+                image = self.vertices[image_id]
+                edge_map = self._get_symmetry_edge_map(
+                    vertex=vertex,
+                    image=image,
+                    rotation=rotation,
+                    translation=translation
+                )
+                if edge_map is not None and (
+                    vertex._has_symmetric_placement(
+                        vertex=image,
+                        rotation=rotation,
+                        translation=translation,
+                        edge_map=edge_map,
+                        vertices=self.vertices,
+                        edges=self.edges
+                    )
+                ):
+                    vertex_map[vertex.id] = (image.id, edge_map)
+
+            symmetry_maps.append((rotation, vertex_map))
+
+        self._symmetry_maps = tuple(symmetry_maps)
+        return self._symmetry_maps
+
+    def _get_symmetry_edge_map(self, vertex, image, rotation, translation):
+        """
+        Get the map of the edges of `vertex` onto those of `image`.
+
+        Parameters
+        ----------
+        vertex : :class:`.Vertex`
+            The vertex being mapped.
+
+        image : :class:`.Vertex`
+            The vertex onto which `vertex` is mapped.
+
+        rotation : :class:`numpy.ndarray`
+            The ``(3, 3)`` rotation matrix of the symmetry operation.
+
+        translation : :class:`numpy.ndarray`
+            The translation of the symmetry operation.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps the id of each edge of `vertex` to the id of an edge
+            of `image`. If the edges cannot be mapped one-to-one,
+            ``None`` is returned.
+
+        """
+
+        if vertex.get_num_edges() != image.get_num_edges():
+            return None
+
+        image_edges = {
+            edge_id: self.edges[edge_id].get_position(
+                reference=image,
+                vertices=self.vertices
+            )
+            for edge_id in image.get_edge_ids()
+        }
+        edge_map = {}
+        for edge_id in vertex.get_edge_ids():
+            position = rotation @ self.edges[edge_id].get_position(
+                reference=vertex,
+                vertices=self.vertices
+            ) + translation
+            matches = [
+                image_edge_id
+                for image_edge_id, image_position in image_edges.items()
+                if np.allclose(position, image_position, atol=1e-6)
+            ]
+            # Edges in the same position cannot be told apart.
+            if len(matches) != 1:
+                return None
+            edge_map[edge_id] = matches[0]
+
+        if len(set(edge_map.values())) != len(edge_map):
+            return None
+        return edge_map
+
+    def _get_symmetry_images(self, mol):
+        """
+        Get the symmetry images used to place building blocks in `mol`.
+
+        The vertices holding the same building block are split into
+        orbits of the symmetry operations. The first vertex of each
+        orbit to be placed is its representative.
+
+        Parameters
+        ----------
+        mol : :class:`.ConstructedMolecule`
+            The molecule being constructed.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps the id of each vertex, which is not the
+            representative of its orbit, to a :class:`_SymmetryImage`.
+
+        """
+
+        if not self._symmetry_operations:
+            return {}
+
+        vertex_building_blocks = {
+            vertex.id: bb
+            for bb, vertices in mol.building_block_vertices.items()
+            for vertex in vertices
+        }
+        stage_ids = {
+            vertex.id: stage_id
+            for stage_id, stage in enumerate(self._stages)
+            for vertex in stage
+        }
+        symmetry_maps = self._get_symmetry_maps()
+
+        images = {}
+        representatives = set()
+        for stage in self._stages:
+            for vertex in stage:
+                if vertex.id in images or vertex.id in representatives:
+                    continue
+
+                representatives.add(vertex.id)
+                bb = vertex_building_blocks[vertex.id]
+                identity = _SymmetryImage(
+                    representative=vertex.id,
+                    rotation=np.identity(3),
+                    edge_map={
+                        edge_id: edge_id
+                        for edge_id in vertex.get_edge_ids()
+                    }
+                )
+                unvisited = [(vertex.id, identity)]
+                while unvisited:
+                    id_, image = unvisited.pop()
+                    for rotation, vertex_map in symmetry_maps:
+                        if id_ not in vertex_map:
+                            continue
+                        image_id, edge_map = vertex_map[id_]
+                        if (
+                            image_id in images
+                            or image_id in representatives
+                            or vertex_building_blocks[image_id] is not bb
+                            or stage_ids[image_id] != stage_ids[id_]
+                        ):
+                            continue
+
+                        images[image_id] = _SymmetryImage(
+                            representative=vertex.id,
+                            rotation=rotation @ image.rotation,
+                            edge_map={
+                                edge_id: edge_map[image_edge_id]
+                                for edge_id, image_edge_id
+                                in image.edge_map.items()
+                            }
+                        )
+                        unvisited.append((image_id, images[image_id]))
+        return images
+
+    def _get_symmetric_placement(
+        self,
+        vertex,
+        vertices,
+        edges,
+        images,
+        placements,
+        positions
+    ):
+        """
+        Get the placement on `vertex` from its representative.
+
+        Parameters
+        ----------
+        vertex : :class:`.Vertex`
+            The vertex clone whose placement is needed.
+
+        vertices : :class:`tuple` of :class:`.Vertex`
+            The vertex clones used for construction.
+
+        edges : :class:`tuple` of :class:`.Edge`
+            The edge clones used for construction.
+
+        images : :class:`dict`
+            The symmetry images returned by
+            :meth:`_get_symmetry_images`.
+
+        placements : :class:`dict`
+            Maps the id of a placed representative vertex to the
+            position matrix of the building block placed on it.
+
+        positions : :class:`dict`
+            Maps the id of each vertex clone to its position before
+            any building blocks were placed.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The position matrix of the placed building block. If the
+            placement cannot be generated by symmetry, ``None`` is
+            returned.
+
+        """
+
+        image = images.get(vertex.id)
+        if image is None or image.representative not in placements:
+            return None
+
+        representative = vertices[image.representative]
+        translation = (
+            positions[vertex.id]
+            - image.rotation @ positions[representative.id]
+        )
+        if not representative._has_symmetric_placement(
+            vertex=vertex,
+            rotation=image.rotation,
+            translation=translation,
+            edge_map=image.edge_map,
+            vertices=vertices,
+            edges=edges
+        ):
+            return None
+
+        return (
+            placements[representative.id] @ image.rotation.T
+            + translation
+        )
+
+    def _get_parent_placements(self, mol, parent):
+        """
+        Get the placements which can be taken from `parent`.
+
+        Parameters
+        ----------
+        mol : :class:`.ConstructedMolecule`
+            The molecule being constructed.
+
+        parent : :class:`.ConstructedMolecule`
+            The molecule from which placements are taken.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps the id of a vertex, which holds the same building
+            block in `mol` and `parent`, to the position matrix of
+            the building block placed on it. Rows of atoms, which
+            are still present in `parent`, hold their positions in
+            `parent`. The remaining rows are found by fitting the
+            building block onto them.
+
+        """
+
+        if parent.topology_graph._get_repr() != self._get_repr():
+            return {}
+
+        building_blocks = {
+            vertex.id: bb
+            for bb, vertices in mol.building_block_vertices.items()
+            for vertex in vertices
+        }
+        parent_building_blocks = {
+            vertex.id: bb
+            for bb, vertices in parent.building_block_vertices.items()
+            for vertex in vertices
+        }
+        # The building_block_id of an atom in parent is the index
+        # of its vertex in the order of placement.
+        parent_vertex_ids = [
+            vertex.id
+            for stage in parent.topology_graph._stages
+            for vertex in stage
+        ]
+        bb_atoms = [[] for vertex_id in parent_vertex_ids]
+        for atom in parent.atoms:
+            # Atoms added by reactions do not have a building block.
+            bb_id = getattr(atom, 'building_block_id', None)
+            if bb_id is not None:
+                bb_atoms[bb_id].append(atom)
+
+        parent_positions = parent.get_position_matrix()
+        placements = {}
+        fg_id = 0
+        for bb_id, vertex_id in enumerate(parent_vertex_ids):
+            parent_bb = parent_building_blocks[vertex_id]
+            func_groups = parent.func_groups[
+                fg_id:fg_id+len(parent_bb.func_groups)
+            ]
+            fg_id += len(parent_bb.func_groups)
+
+            bb = building_blocks[vertex_id]
+            if bb.get_identity_digest() != parent_bb.get_identity_digest():
+                continue
+
+            # Functional groups of parent lose their deleters when
+            # they react.
+            deleter_ids = {
+                deleter_id
+                for fg, parent_fg in zip(bb.func_groups, func_groups)
+                if not parent_fg.deleters
+                for deleter_id in fg.get_deleter_ids()
+            }
+            atom_ids = [
+                atom.id for atom in bb.atoms
+                if atom.id not in deleter_ids
+            ]
+            atoms = bb_atoms[bb_id]
+            if len(atom_ids) != len(atoms) or any(
+                bb.atoms[atom_id].__class__ is not atom.__class__
+                for atom_id, atom in zip(atom_ids, atoms)
+            ):
+                continue
+
+            # Fit the building block onto the atoms of parent, so that
+            # deleter atoms get positions too.
+            target = parent_positions[[atom.id for atom in atoms]]
+            target_centroid = target.mean(axis=0)
+            position_matrix = bb.get_position_matrix()
+            centroid = position_matrix[atom_ids].mean(axis=0)
+            rotation = kabsch(
+                coords1=position_matrix[atom_ids] - centroid,
+                coords2=target-target_centroid
+            )
+            position_matrix = (
+                (position_matrix-centroid) @ rotation.T
+                + target_centroid
+            )
+            position_matrix[atom_ids] = target
+            placements[vertex_id] = position_matrix
+
+        return placements
+
+    def _place_building_blocks_serial(
+        self,
+        mol,
+        vertices,
+        edges,
+        parent_placements=None
+    ):
+        if parent_placements is None:
+            parent_placements = {}
+
         bb_id = 0
 
         vertex_building_blocks = {
@@ -1373,6 +1935,18 @@ class TopologyGraph:
             for bb, vertices in mol.building_block_vertices.items()
             for vertex in vertices
         }
+        images = self._get_symmetry_images(mol)
+        representatives = {
+            image.representative for image in images.values()
+        }
+        # The translations of the symmetry operations are found
+        # from the positions before any vertices get moved.
+        positions = {
+            vertex.id: vertex.get_position()
+            for vertex in vertices
+            if vertex.id in images or vertex.id in representatives
+        }
+        placements = {}
         # Use a shorter alias.
         counter = mol.building_block_counter
         for stage in self._stages:
@@ -1381,9 +1955,39 @@ class TopologyGraph:
                 bb = vertex_building_blocks[instance_vertex]
                 original_coords = bb.get_position_matrix()
 
-                mol._position_matrix.extend(
-                    vertex.place_building_block(bb, vertices, edges)
-                )
+                position_matrix = parent_placements.get(vertex.id)
+                if position_matrix is None:
+                    position_matrix = self._get_symmetric_placement(
+                        vertex=vertex,
+                        vertices=vertices,
+                        edges=edges,
+                        images=images,
+                        placements=placements,
+                        positions=positions
+                    )
+                    is_placed = position_matrix is None
+                else:
+                    # Placements taken from a parent need not be
+                    # symmetric.
+                    is_placed = False
+
+                if position_matrix is None:
+                    position_matrix = vertex.place_building_block(
+                        bb,
+                        vertices,
+                        edges
+                    )
+                else:
+                    bb.set_position_matrix(position_matrix)
+
+                if is_placed and vertex.id in representatives:
+                    placements[vertex.id] = position_matrix
+
+                mol._position_matrix.extend(position_matrix)
+                # Assignment is always done explicitly, because
+                # building blocks which are symmetric themselves can
+                # have their functional groups assigned to edges in
+                # more than one way.
                 assignments = vertex.assign_func_groups_to_edges(
                     building_block=bb,
                     vertices=vertices,
@@ -1418,7 +2022,7 @@ class TopologyGraph:
             for vertex in vertices
         }
         bb_map = {
-            bb.get_identity_key(): bb
+            bb.get_identity_digest(): bb
             for bb in mol.get_building_blocks()
         }
         # Use a shorter alias.
@@ -1435,7 +2039,7 @@ class TopologyGraph:
 
                 for result in results:
                     result_bb = result.building_block
-                    bb = bb_map[result_bb.get_identity_key()]
+                    bb = bb_map[result_bb.get_identity_digest()]
 
                     mol._position_matrix.extend(
                         result_bb.get_position_matrix()
@@ -16,6 +16,8 @@ import psutil
 from functools import wraps
 import logging
 import pathos
+import queue
+from concurrent.futures import ThreadPoolExecutor
 
 from .utilities import dedupe, dice_similarity
 from .molecular import ConstructedMolecule, Molecule
@@ -374,6 +376,84 @@ class Population:
             p.remove_duplicates()
         return p
 
+    @staticmethod
+    def iter_all(
+        building_blocks,
+        topology_graphs,
+        num_processes=None,
+        chunk_size=100
+    ):
+        """
+        Yield all possible molecules from groups of building blocks.
+
+        Unlike :meth:`init_all`, the molecules are constructed in
+        chunks, as they are requested. Only one chunk of molecules is
+        held at a time, so `topology_graphs` can be an arbitrarily
+        long generator.
+
+        Parameters
+        ----------
+        building_blocks : :class:`list` of :class:`.Molecule`
+            A :class:`list` holding nested building blocks. See
+            :meth:`init_all`.
+
+        topology_graphs : :class:`iterable` of :class:`.TopologyGraph`
+            The topology graphs of the molecules being made. Each
+            topology graph is combined with every combination of
+            `building_blocks`.
+
+        num_processes : :class:`int`, optional
+            The number of parallel processes to create when
+            constructing the molecules. If ``None``, creates a process
+            for each core on the computer.
+
+        chunk_size : :class:`int`, optional
+            The number of molecules constructed in parallel at a time.
+
+        Yields
+        ------
+        :class:`.ConstructedMolecule`
+            A constructed molecule.
+
+        Examples
+        --------
+        Screen every unique pentamer of two monomers, and keep
+        only those which pass a filter
+
+        .. code-block:: python
+
+            import stk
+
+            bb1 = stk.BuildingBlock('NC(C)CN', ['amine'])
+            bb2 = stk.BuildingBlock('O=CCC=O', ['aldehyde'])
+            chains = stk.polymer.Linear.get_unique_chains(
+                building_blocks=[bb1, bb2],
+                num_vertices=5
+            )
+            polymers = stk.Population.iter_all(
+                building_blocks=[[bb1], [bb2]],
+                topology_graphs=chains
+            )
+            pop = stk.Population(*(
+                polymer for polymer in polymers
+                if not polymer.has_clashes()
+            ))
+
+        """
+
+        mols = (
+            (list(mol_bbs), topology)
+            for topology in topology_graphs
+            for mol_bbs in it.product(*building_blocks)
+        )
+        with pathos.pools.ProcessPool(num_processes) as pool:
+            while True:
+                chunk = list(it.islice(mols, chunk_size))
+                if not chunk:
+                    break
+                bbs, topologies = zip(*chunk)
+                yield from pool.map(ConstructedMolecule, bbs, topologies)
+
     def clone(self):
         """
         Return a clone.
@@ -1041,7 +1121,57 @@ class Population:
         for member in self:
             optimizer.optimize(member)
 
-    def optimize(self, optimizer, num_processes=None):
+    def _optimize_batched(
+        self,
+        optimizer,
+        batch_size,
+        num_threads,
+        num_cores,
+        pin_cores,
+    ):
+        mols = iter(dedupe(self, key=id))
+        batches = iter(lambda: list(it.islice(mols, batch_size)), [])
+        if num_threads is None:
+            for batch in batches:
+                optimizer.optimize_batch(batch)
+            return
+
+        scheduler = _CoreScheduler(
+            num_cores_per_job=_get_num_cores(optimizer),
+            num_cores=num_cores,
+            max_jobs=num_threads,
+            pin_cores=pin_cores,
+        )
+        scheduler.map(optimizer.optimize_batch, batches)
+
+    def _optimize_threaded(
+        self,
+        optimizer,
+        num_threads,
+        num_cores,
+        pin_cores,
+    ):
+        scheduler = _CoreScheduler(
+            num_cores_per_job=_get_num_cores(optimizer),
+            num_cores=num_cores,
+            max_jobs=num_threads,
+            pin_cores=pin_cores,
+        )
+        # Threads share the molecules of the population, so they
+        # are optimized in place. Each molecule is only optimized
+        # once, so that two threads never optimize it at the same
+        # time.
+        scheduler.map(optimizer.optimize, dedupe(self, key=id))
+
+    def optimize(
+        self,
+        optimizer,
+        num_processes=None,
+        num_threads=None,
+        num_cores=None,
+        pin_cores=False,
+        batch_size=None,
+    ):
         """
         Optimize the structures of molecules in the population.
 
@@ -1052,6 +1182,22 @@ class Population:
         In this case creating a parallel process pool creates
         unnecessary overhead.
 
+        If `num_threads` is used, the molecules are optimized in a
+        pool of threads instead of processes. This is a good choice
+        for optimizers which spend their time waiting for an external
+        program, such as :class:`.XTB` or :class:`.MacroModelForceField`,
+        because threads are much cheaper to create than processes and
+        the molecules do not need to be copied between them. The
+        `optimizer` must be safe to use from multiple threads.
+
+        Both processes and threads take the number of cores used by
+        a single optimization, given by
+        :meth:`~.MoleculeCalculator.get_num_cores`, into account, so
+        that an optimizer such as :class:`.XTB` with multiple
+        `num_cores` does not oversubscribe the computer. When threads
+        are used, each optimization is given its own set of cores,
+        to which it can optionally be pinned.
+
         Parameters
         ----------
         optimizer : :class:`.Optimizer`
@@ -1059,18 +1205,69 @@ class Population:
 
         num_processes : :class:`int`, optional
             The number of parallel processes to create. Optimization
-            will run serially if ``1``. If ``None``, creates a
-            process for each core on the computer. This parameter will
-            be ignored if the population has an open process pool.
+            will run serially if ``1``. If ``None``, creates as many
+            processes as can run on the cores of the computer at the
+            same time. This parameter will be ignored if the
+            population has an open process pool.
+
+        num_threads : :class:`int`, optional
+            The largest number of threads used to optimize the
+            molecules. If ``None``, threads are not used.
+
+        num_cores : :class:`int`, optional
+            The number of cores shared by the threads. If ``None``,
+            all cores available to the process are used. Only used
+            if `num_threads` is used.
+
+        pin_cores : :class:`bool`, optional
+            If ``True``, each thread, and any program it runs, is
+            pinned to the cores it was given. Only used if
+            `num_threads` is used and the operating system supports
+            it.
+
+        batch_size : :class:`int`, optional
+            If used, the molecules are given to
+            :meth:`~.Optimizer.optimize_batch` in batches of this
+            size, so that optimizers such as
+            :class:`.MacroModelForceField` can optimize each batch
+            with a single calculation. The batches are optimized
+            serially, or in threads if `num_threads` is used, and
+            `num_processes` is ignored.
 
         Returns
         -------
         None : :class:`NoneType`
 
+        Raises
+        ------
+        :class:`ValueError`
+            If `batch_size` is smaller than ``1``.
+
         """
 
+        if batch_size is not None:
+            if batch_size < 1:
+                raise ValueError('batch_size must be at least 1.')
+            self._optimize_batched(
+                optimizer=optimizer,
+                batch_size=batch_size,
+                num_threads=num_threads,
+                num_cores=num_cores,
+                pin_cores=pin_cores,
+            )
+            return
+
+        if num_threads is not None:
+            self._optimize_threaded(
+                optimizer=optimizer,
+                num_threads=num_threads,
+                num_cores=num_cores,
+                pin_cores=pin_cores,
+            )
+            return
+
         if num_processes is None:
-            num_processes = psutil.cpu_count()
+            num_processes = _get_num_processes(optimizer)
 
         if self._process_pool is None and num_processes == 1:
             self._optimize_serial(optimizer)
@@ -1153,6 +1350,36 @@ class Population:
         for subpop in self.subpopulations:
             subpop.remove_members(key)
 
+    def remove_clashing_members(self, clash_distance=1.):
+        """
+        Remove all constructed molecules with clashing building blocks.
+
+        This is a cheap filter, which can be applied before a
+        population is optimized, in order to avoid spending time on
+        structures which are unlikely to be useful. Members which are
+        not :class:`.ConstructedMolecule` instances are kept.
+
+        Parameters
+        ----------
+        clash_distance : :class:`float`, optional
+            The distance, in Angstrom, below which atoms from different
+            building blocks clash.
+            See :meth:`.ConstructedMolecule.get_clashes`.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        def clashes(mol):
+            return (
+                isinstance(mol, ConstructedMolecule)
+                and mol.has_clashes(clash_distance)
+            )
+
+        self.remove_members(clashes)
+
     def to_list(self, include_attrs=None, ignore_missing_attrs=False):
         """
         Convert the population to a :class:`list` representation.
@@ -1459,10 +1686,17 @@ class EAPopulation(Population):
         fitness_calculator,
         fitness_normalizer=None,
         num_processes=None,
+        num_threads=None,
+        num_cores=None,
+        pin_cores=False,
     ):
         """
         Set the fitness values of molecules.
 
+        The fitness values are calculated in processes or threads in
+        the same way as molecules are optimized in
+        :meth:`~.Population.optimize`.
+
         Parameters
         ----------
         fitness_calculator : :class:`.FitnessCalculator`
@@ -1473,9 +1707,25 @@ class EAPopulation(Population):
 
         num_processes : :class:`int`, optional
             The number of parallel processes to create. Calculations
-            will run serially if ``1``. If ``None``, creates a
-            process for each core on the computer. This parameter will
-            be ignored if the population has an open process pool.
+            will run serially if ``1``. If ``None``, creates as many
+            processes as can run on the cores of the computer at the
+            same time. This parameter will be ignored if the
+            population has an open process pool.
+
+        num_threads : :class:`int`, optional
+            The largest number of threads used to calculate the
+            fitness values. If ``None``, threads are not used.
+
+        num_cores : :class:`int`, optional
+            The number of cores shared by the threads. If ``None``,
+            all cores available to the process are used. Only used
+            if `num_threads` is used.
+
+        pin_cores : :class:`bool`, optional
+            If ``True``, each thread, and any program it runs, is
+            pinned to the cores it was given. Only used if
+            `num_threads` is used and the operating system supports
+            it.
 
         Returns
         -------
@@ -1485,9 +1735,16 @@ class EAPopulation(Population):
         """
 
         if num_processes is None:
-            num_processes = psutil.cpu_count()
+            num_processes = _get_num_processes(fitness_calculator)
 
-        if self._process_pool is None and num_processes == 1:
+        if num_threads is not None:
+            self._set_fitness_values_threaded(
+                fitness_calculator=fitness_calculator,
+                num_threads=num_threads,
+                num_cores=num_cores,
+                pin_cores=pin_cores,
+            )
+        elif self._process_pool is None and num_processes == 1:
             self._set_fitness_values_serial(fitness_calculator)
         else:
             self._set_fitness_values_parallel(
@@ -1507,6 +1764,26 @@ class EAPopulation(Population):
             for mol in self
         }
 
+    def _set_fitness_values_threaded(
+        self,
+        fitness_calculator,
+        num_threads,
+        num_cores,
+        pin_cores,
+    ):
+        scheduler = _CoreScheduler(
+            num_cores_per_job=_get_num_cores(fitness_calculator),
+            num_cores=num_cores,
+            max_jobs=num_threads,
+            pin_cores=pin_cores,
+        )
+        to_evaluate = list(dedupe(self, key=id))
+        fitness_values = scheduler.map(
+            fitness_calculator.get_fitness,
+            to_evaluate
+        )
+        self._fitness_values = dict(zip(to_evaluate, fitness_values))
+
     def _set_fitness_values_parallel(
         self,
         fitness_calculator,
@@ -1610,3 +1887,179 @@ class _Guard:
             )
             logger.error(errormsg, exc_info=True)
             return ex
+
+
+class _CoreScheduler:
+    """
+    Runs jobs in threads, without using more cores than available.
+
+    The available cores are split into sets, each holding the number
+    of cores used by a single job. A job is run only once it gets a
+    set of cores for itself.
+
+    """
+
+    def __init__(
+        self,
+        num_cores_per_job,
+        num_cores=None,
+        max_jobs=None,
+        pin_cores=False,
+    ):
+        """
+        Initialize a :class:`_CoreScheduler`.
+
+        Parameters
+        ----------
+        num_cores_per_job : :class:`int`
+            The number of cores used by a single job. Jobs which
+            need more cores than are available are given all of them.
+
+        num_cores : :class:`int`, optional
+            The number of cores which can be used. If ``None``, all
+            cores available to the process are used.
+
+        max_jobs : :class:`int`, optional
+            The largest number of jobs which can run at the same time.
+            If ``None``, this is limited only by the number of cores.
+
+        pin_cores : :class:`bool`, optional
+            If ``True``, jobs are pinned to their cores.
+
+        """
+
+        cores = _get_available_cores()
+        if num_cores is not None:
+            cores = cores[:num_cores]
+        num_cores_per_job = min(max(num_cores_per_job, 1), len(cores))
+        num_slots = len(cores) // num_cores_per_job
+        if max_jobs is not None:
+            num_slots = max(min(num_slots, max_jobs), 1)
+
+        self._num_slots = num_slots
+        self._slots = queue.SimpleQueue()
+        for i in range(num_slots):
+            start = i*num_cores_per_job
+            self._slots.put(cores[start:start+num_cores_per_job])
+        self._pin_cores = pin_cores and hasattr(os, 'sched_setaffinity')
+
+    def _run(self, fn, item):
+        """
+        Run a single job once a set of cores is free.
+
+        Parameters
+        ----------
+        fn : :class:`callable`
+            The job.
+
+        item : :class:`object`
+            The argument of `fn`.
+
+        Returns
+        -------
+        :class:`object`
+            The value returned by `fn`.
+
+        """
+
+        cores = self._slots.get()
+        try:
+            if not self._pin_cores:
+                return fn(item)
+
+            # On Linux, this sets the affinity of the calling thread
+            # only. The subprocess engine gives it to any program the
+            # job runs.
+            affinity = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, cores)
+            try:
+                return fn(item)
+            finally:
+                os.sched_setaffinity(0, affinity)
+        finally:
+            self._slots.put(cores)
+
+    def map(self, fn, items):
+        """
+        Apply `fn` to every item of `items`.
+
+        Parameters
+        ----------
+        fn : :class:`callable`
+            The job, which takes a single item as its argument.
+
+        items : :class:`iterable`
+            The items.
+
+        Returns
+        -------
+        :class:`list`
+            The value returned by `fn` for each item, in order.
+
+        Raises
+        ------
+        :class:`Exception`
+            The first error raised by a job, once all jobs are done.
+
+        """
+
+        with ThreadPoolExecutor(max_workers=self._num_slots) as pool:
+            return list(pool.map(lambda item: self._run(fn, item), items))
+
+
+def _get_available_cores():
+    """
+    Return the ids of the cores the process can use.
+
+    Returns
+    -------
+    :class:`list` of :class:`int`
+        The ids of the cores.
+
+    """
+
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(psutil.cpu_count()))
+
+
+def _get_num_cores(calculator):
+    """
+    Return the number of cores used by a single calculation.
+
+    Parameters
+    ----------
+    calculator : :class:`.MoleculeCalculator`
+        The calculator.
+
+    Returns
+    -------
+    :class:`int`
+        The number of cores. ``1`` if `calculator` does not say.
+
+    """
+
+    try:
+        return calculator.get_num_cores()
+    except NotImplementedError:
+        return 1
+
+
+def _get_num_processes(calculator):
+    """
+    Return the number of processes which can use `calculator` at once.
+
+    Parameters
+    ----------
+    calculator : :class:`.MoleculeCalculator`
+        The calculator.
+
+    Returns
+    -------
+    :class:`int`
+        The number of processes which can run on the cores of the
+        computer at the same time.
+
+    """
+
+    return max(psutil.cpu_count() // _get_num_cores(calculator), 1)
@@ -239,6 +239,75 @@ class MAEExtractor:
                 # Save the path of the newly created file.
                 self.path = new_name
 
+    def extract_structures(self):
+        """
+        Creates a ``.mae`` file for each structure in the ``.mae`` file.
+
+        This is used to split the output of a MacroModel run which
+        was given many structures.
+
+        Returns
+        -------
+        :class:`list` of :class:`tuple`
+            For each structure, in the order of the ``.mae`` file,
+            its title, its potential energy and the path of the
+            ``.mae`` file holding it. The title or energy is ``None``
+            if it is not found.
+
+        """
+
+        with open(self.mae_path, 'r') as mae_file:
+            self.content = mae_file.read()
+
+        header, *blocks = self.content.split('f_m_ct')
+        structures = []
+        for i, block in enumerate(blocks):
+            properties = self._extract_properties(block)
+            title = properties.get('s_m_title')
+            if title is not None:
+                title = title.strip('"')
+            energy = next(
+                (
+                    float(value)
+                    for name, value in properties.items()
+                    if 'r_mmod_Potential_Energy' in name
+                ),
+                None
+            )
+
+            path = self.mae_path.replace('.mae', f'STRUCTURE_{i}.mae')
+            with open(path, 'w') as mae_file:
+                mae_file.write(f'{header}f_m_ct{block}')
+            structures.append((title, energy, path))
+
+        return structures
+
+    def _extract_properties(self, block):
+        """
+        Extracts the properties of a ``.mae`` structure block.
+
+        Parameters
+        ----------
+        block : :class:`str`
+            A ``.mae`` structure block, which follows ``f_m_ct``.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps the name of each property of the structure to its
+            value, as a :class:`str`.
+
+        """
+
+        names, values, *_ = block.split(':::')
+        names = [
+            name.strip() for name in names.split('{', 1)[1].split('\n')
+            if name.strip() and not name.strip().startswith('#')
+        ]
+        values = [value.strip() for value in values.split('\n')]
+        values = [value for value in values if value]
+        return dict(zip(names, values))
+
     def extract_energy(self, block):
         """
         Extracts the energy value from a ``.mae`` energy data block.
@@ -457,7 +526,8 @@ def kabsch(coords1, coords2):
     Given two sets of coordinates, `coords1` and `coords2`, this
     function returns a rotation matrix. When the rotation matrix is
     applied to `coords1` the resulting coordinates have their rms
-    distance to `coords2` minimized.
+    distance to `coords2` minimized. Both sets of coordinates should
+    have their centroids at the origin.
 
     Parameters
     ----------
@@ -487,13 +557,13 @@ def kabsch(coords1, coords2):
 
     """
 
-    h = np.dot(coords1, coords2.T)
-    u, s, v = np.linalg.svd(h)
-
-    if int(np.linalg.det(v)) < 0:
-        v[:, 2] = -v[:, 2]
+    h = np.dot(coords1.T, coords2)
+    u, s, vt = np.linalg.svd(h)
 
-    return np.dot(v, u)
+    # Make sure a proper rotation, rather than a reflection, is
+    # returned.
+    d = np.sign(np.linalg.det(np.dot(vt.T, u.T)))
+    return np.dot(vt.T * [1, 1, d], u.T)
 
 
 def kill_macromodel():
@@ -1123,15 +1193,16 @@ class XTBExtractor:
     """
     Extracts properties from GFN-xTB output files.
 
+    The output file is streamed once, and never held in memory as a
+    whole. The last printed value of each property is used. If only
+    properties which xTB prints once are requested, such as
+    :attr:`frequencies`, reading stops as soon as they are all found.
+
     Attributes
     ----------
     output_file : :class:`str`
         Output file to extract properties from.
 
-    output_lines : :class:`list` : :class:`str`
-        :class:`list` of all lines in as :class:`str` in the output
-        file.
-
     total_energy : :class:`float`
         The total energy in the :attr:`output_file` as
         :class:`float`. The energy is in units of a.u..
@@ -1184,8 +1255,16 @@ class XTBExtractor:
         in the :attr:`output_file`. Vibrational frequencies are in
         units of wavenumber and calculated at 298.15K.
 
+    num_scc_cycles : :class:`int`
+        The number of iterations the self-consistent charge
+        calculation in the :attr:`output_file` took to converge.
+
+    num_optimization_cycles : :class:`int`
+        The number of iterations of the geometry optimization in the
+        :attr:`output_file`, whether or not it converged.
+
     """
-    def __init__(self, output_file):
+    def __init__(self, output_file, properties=None):
         """
         Initializes :class:`XTBExtractor`
 
@@ -1194,97 +1273,44 @@ class XTBExtractor:
         output_file : :class:`str`
             Output file to extract properties from.
 
-        """
-        self.output_file = output_file
-        # Explictly set encoding to UTF-8 because default encoding on
-        # Windows will fail to read the file otherwise.
-        with open(self.output_file, 'r', encoding='UTF-8') as f:
-            self.output_lines = f.readlines()
-
-        self._extract_values()
-
-    def _extract_values(self):
-        """
-        Extract all properties from xTB output file.
-
-        Returns
-        -------
-        None : :class:`NoneType`
+        properties : :class:`iterable` of :class:`str`, optional
+            The names of the attributes to extract, for example
+            ``['total_energy']``. Other attributes are not set. If
+            all of them are printed only once, reading of
+            :attr:`output_file` stops as soon as they are found. If
+            ``None``, all properties are extracted.
 
-        """
+        Raises
+        ------
+        :class:`ValueError`
+            If an unknown property is requested.
 
-        for i, line in enumerate(self.output_lines):
-            if self._check_line(line, 'total_energy'):
-                self._extract_total_energy(line)
-            elif self._check_line(line, 'homo_lumo_gap'):
-                self._extract_homo_lumo_gap(line)
-            elif self._check_line(line, 'fermi_level'):
-                self._extract_fermi_level(line)
-            elif self._check_line(line, 'dipole_moment'):
-                self._extract_qonly_dipole_moment(i)
-                self._extract_full_dipole_moment(i)
-            elif self._check_line(line, 'quadrupole_moment'):
-                self._extract_qonly_quadrupole_moment(i)
-                self._extract_qdip_quadrupole_moment(i)
-                self._extract_full_quadrupole_moment(i)
-            elif self._check_line(line, 'homo_lumo_occ_HOMO'):
-                self.homo_lumo_occ = {}
-                self._extract_homo_lumo_occ(line, 'HOMO')
-            elif self._check_line(line, 'homo_lumo_occ_LUMO'):
-                self._extract_homo_lumo_occ(line, 'LUMO')
-            elif self._check_line(line, 'total_free_energy'):
-                self._extract_total_free_energy(line)
-
-        # Frequency formatting requires loop through full file.
-        self._extract_frequencies()
-
-    def _check_line(self, line, option):
         """
-        Checks a line for a string based on option.
-
-        All formatting based on the 190418 version of xTB.
 
-        Parameters
-        ----------
-        line : :class:`str`
-            Line of output file to check.
-
-        option : :class:`str`
-            Define which property and string being checked for.
-            Can be one of ``'total_energy'``, ``'homo_lumo_gap'``,
-            ``'fermi_level'``, ``'dipole_moment'``,
-            ``'quadrupole_moment'``, ``'homo_lumo_occ_HOMO'``,
-            ``'homo_lumo_occ_LUMO'``,
-            ``'total_free_energy'``.
+        if properties is not None:
+            properties = set(properties)
+            unknown = properties - set(_xtb_properties)
+            if unknown:
+                raise ValueError(
+                    f'Unknown xTB properties: {sorted(unknown)}.'
+                )
 
-        Returns
-        -------
-        :class:`bool`
-            Returns ``True`` if the desired string is present.
+        self.output_file = output_file
+        self._extract_values(properties)
 
+    def _extract_values(self, properties):
         """
-        options = {
-            'total_energy': '          | TOTAL ENERGY  ',
-            'homo_lumo_gap': '          | HOMO-LUMO GAP   ',
-            'fermi_level': '             Fermi-level        ',
-            'dipole_moment': 'molecular dipole:',
-            'quadrupole_moment': 'molecular quadrupole (traceless):',
-            'homo_lumo_occ_HOMO': '(HOMO)',
-            'homo_lumo_occ_LUMO': '(LUMO)',
-            'total_free_energy': '          | TOTAL FREE ENERGY  ',
-        }
+        Extract properties from xTB output file.
 
-        if options[option] in line:
-            return True
-
-    def _extract_total_energy(self, line):
-        """
-        Updates :attr:`total_energy`.
+        The file is read line by line, only once. Properties which
+        are printed over multiple lines, such as the dipole moments,
+        are extracted by keeping track of the block being read.
 
         Parameters
         ----------
-        line : :class:`str`
-            Line of output file to extract property from.
+        properties : :class:`set` of :class:`str`
+            The names of the properties to extract. If ``None``, all
+            properties are extracted.
 
         Returns
         -------
@@ -1292,178 +1318,199 @@ class XTBExtractor:
 
         """
 
-        nums = re.compile(r"[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
-        string = nums.search(line.rstrip()).group(0)
-        self.total_energy = float(string)
+        if properties is None:
+            remaining = None
+            wanted = set(_xtb_properties)
+        elif properties <= _xtb_single_properties:
+            remaining = set(properties)
+            wanted = set(properties)
+        else:
+            # Read the whole file, so that the last printed value of
+            # each property is used. For example, with --ohess the
+            # first total energy is that of the starting geometry.
+            remaining = None
+            wanted = set(properties)
+
+        if 'frequencies' in wanted:
+            self.frequencies = []
+        if 'homo_lumo_occ' in wanted:
+            self.homo_lumo_occ = {}
+
+        # The multi-line block being read, if any, and the number of
+        # lines read since its header.
+        block = None
+        block_line = 0
 
-    def _extract_homo_lumo_gap(self, line):
+        # Explictly set encoding to UTF-8 because default encoding on
+        # Windows will fail to read the file otherwise.
+        with open(self.output_file, 'r', encoding='UTF-8') as f:
+            for line in f:
+                if block is not None:
+                    block_line += 1
+                    block = self._extract_block_line(
+                        block=block,
+                        block_line=block_line,
+                        line=line,
+                        wanted=wanted,
+                        remaining=remaining,
+                    )
+                else:
+                    for option, marker in _xtb_markers:
+                        if marker in line:
+                            block = self._extract_marked_line(
+                                option=option,
+                                line=line,
+                                wanted=wanted,
+                                remaining=remaining,
+                            )
+                            block_line = 0
+                            break
+
+                if remaining is not None and not remaining:
+                    break
+
+    def _extract_marked_line(self, option, line, wanted, remaining):
         """
-        Updates :attr:`homo_lumo_gap`.
+        Extract the property of a line holding a marker.
 
         Parameters
         ----------
-        line : :class:`str`
-            Line of output file to extract property from.
-
-        Returns
-        -------
-        None : :class:`NoneType`
-
-        """
-
-        nums = re.compile(r"[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
-        string = nums.search(line.rstrip()).group(0)
-        self.homo_lumo_gap = float(string)
-
-    def _extract_fermi_level(self, line):
-        """
-        Updates :attr:`fermi_level`.
+        option : :class:`str`
+            The name of the marker found in `line`.
 
-        Parameters
-        ----------
         line : :class:`str`
             Line of output file to extract property from.
 
-        Returns
-        -------
-        None : :class:`NoneType`
+        wanted : :class:`set` of :class:`str`
+            The names of the properties to extract.
 
-        """
-
-        nums = re.compile(r"[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
-        part2 = line.split('Eh')
-        string = nums.search(part2[1].rstrip()).group(0)
-        self.fermi_level = float(string)
-
-    def _extract_qonly_dipole_moment(self, index):
-        """
-        Updates :attr:`qonly_dipole_moment`.
-
-        Parameters
-        ----------
-        line : :class:`str`
-            Line of output file to extract property from.
-
-        index : :class:`int`
-            Index of line in :attr:`output_lines`.
+        remaining : :class:`set` of :class:`str`
+            The names of the properties which are yet to be found.
+            Updated in place. If ``None``, the whole file is read.
 
         Returns
         -------
-        None : :class:`NoneType`
+        :class:`str`
+            The name of the multi-line block which starts at `line`,
+            or ``None`` if no block is to be read.
 
         """
 
-        sample_set = self.output_lines[index+2].rstrip()
+        if option in _xtb_blocks:
+            return option if _xtb_blocks[option] & wanted else None
 
-        if 'q only:' in sample_set:
-            self.qonly_dipole_moment = [
-                float(i)
-                for i in sample_set.split(':')[1].split(' ') if i
-            ]
-
-    def _extract_full_dipole_moment(self, index):
+        if option.startswith('homo_lumo_occ'):
+            name = 'homo_lumo_occ'
+        else:
+            name = option
+
+        if name in wanted:
+            self._extract_line(option, line)
+            # The HOMO and LUMO are printed on consecutive lines.
+            if option != 'homo_lumo_occ_HOMO':
+                _discard(remaining, name)
+        return None
+
+    def _extract_block_line(
+        self,
+        block,
+        block_line,
+        line,
+        wanted,
+        remaining,
+    ):
         """
-        Updates :attr:`full_dipole_moment`.
+        Extract properties from a line of a multi-line block.
 
         Parameters
         ----------
-        line : :class:`str`
-            Line of output file to extract property from.
-
-        index : :class:`int`
-            Index of line in :attr:`output_lines`.
-
-        Returns
-        -------
-        None : :class:`NoneType`
-
-        """
-
-        sample_set = self.output_lines[index+3].rstrip()
-
-        if 'full:' in sample_set:
-            self.full_dipole_moment = [
-                float(i)
-                for i in sample_set.split(':')[1].split(' ') if i
-            ]
+        block : :class:`str`
+            The name of the block being read. Can be one of
+            ``'dipole_moment'``, ``'quadrupole_moment'`` or
+            ``'frequencies'``.
 
-    def _extract_qonly_quadrupole_moment(self, index):
-        """
-        Updates :attr:`qonly_quadrupole_moment`.
+        block_line : :class:`int`
+            The number of lines read since the header of the block.
 
-        Parameters
-        ----------
         line : :class:`str`
             Line of output file to extract property from.
 
-        index : :class:`int`
-            Index of line in :attr:`output_lines`.
-
-        Returns
-        -------
-        None : :class:`NoneType`
-
-        """
+        wanted : :class:`set` of :class:`str`
+            The names of the properties to extract.
 
-        sample_set = self.output_lines[index+2].rstrip()
-
-        if 'q only:' in sample_set:
-            self.qonly_quadrupole_moment = [
-                float(i)
-                for i in sample_set.split(':')[1].split(' ') if i
-            ]
-
-    def _extract_qdip_quadrupole_moment(self, index):
-        """
-        Updates :attr:`qdip_quadrupole_moment`.
-
-        Parameters
-        ----------
-        line : :class:`str`
-            Line of output file to extract property from.
-
-        index : :class:`int`
-            Index of line in :attr:`output_lines`.
+        remaining : :class:`set` of :class:`str`
+            The names of the properties which are yet to be found.
+            Updated in place. If ``None``, the whole file is read.
 
         Returns
         -------
-        None : :class:`NoneType`
+        :class:`str`
+            `block` if the next line is part of the block too,
+            ``None`` otherwise.
 
         """
 
-        sample_set = self.output_lines[index+3].rstrip()
-
-        if 'q+dip:' in sample_set:
-            self.qdip_quadrupole_moment = [
-                float(i)
-                for i in sample_set.split(':')[1].split(' ') if i
-            ]
-
-    def _extract_full_quadrupole_moment(self, index):
+        if block == 'frequencies':
+            if ' reduced masses (amu)' in line:
+                # The frequency section is done.
+                _discard(remaining, 'frequencies')
+                return None
+            if 'eigval :' in line:
+                self.frequencies.extend(
+                    float(i) for i in line.split(':')[1].split()
+                )
+            return block
+
+        # Maps the line number of a block to the property on the line
+        # and the label which must be on the line.
+        lines = _xtb_block_lines[block]
+        if block_line in lines:
+            name, label = lines[block_line]
+            sample_set = line.rstrip()
+            if name in wanted and label in sample_set:
+                setattr(self, name, [
+                    float(i)
+                    for i in sample_set.split(':')[1].split(' ') if i
+                ])
+                _discard(remaining, name)
+        return block if block_line < max(lines) else None
+
+    def _extract_line(self, option, line):
         """
-        Updates :attr:`full_quadrupole_moment`.
+        Extract a property printed on a single line.
+
+        All formatting based on the 190418 version of xTB.
 
         Parameters
         ----------
+        option : :class:`str`
+            The property on the line. Can be one of
+            ``'total_energy'``, ``'homo_lumo_gap'``,
+            ``'fermi_level'``, ``'homo_lumo_occ_HOMO'``,
+            ``'homo_lumo_occ_LUMO'``, ``'total_free_energy'``,
+            ``'num_scc_cycles'`` or ``'num_optimization_cycles'``.
+
         line : :class:`str`
             Line of output file to extract property from.
 
-        index : :class:`int`
-            Index of line in :attr:`output_lines`.
-
         Returns
         -------
         None : :class:`NoneType`
 
         """
 
-        sample_set = self.output_lines[index+4].rstrip()
+        if option == 'fermi_level':
+            line = line.split('Eh')[1]
+        elif option == 'homo_lumo_occ_HOMO':
+            return self._extract_homo_lumo_occ(line, 'HOMO')
+        elif option == 'homo_lumo_occ_LUMO':
+            return self._extract_homo_lumo_occ(line, 'LUMO')
 
-        if 'full:' in sample_set:
-            self.full_quadrupole_moment = [
-                float(i)
-                for i in sample_set.split(':')[1].split(' ') if i
-            ]
+        string = _xtb_number.search(line.rstrip()).group(0)
+        if option in _xtb_counts:
+            setattr(self, option, int(string))
+        else:
+            setattr(self, option, float(string))
 
     def _extract_homo_lumo_occ(self, line, orbital):
         """
@@ -1508,49 +1555,101 @@ class XTBExtractor:
 
         self.homo_lumo_occ[orbital] = orbital_val
 
-    def _extract_total_free_energy(self, line):
-        """
-        Updates :attr:`total_free_energy`.
-
-        Returns
-        -------
-        None : :class:`NoneType`
-
-        """
 
-        nums = re.compile(r"[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
-        string = nums.search(line.rstrip()).group(0)
-        self.total_free_energy = float(string)
+def _discard(remaining, name):
+    """
+    Remove `name` from `remaining`, unless it is ``None``.
 
-    def _extract_frequencies(self):
-        """
-        Updates :attr:`frequencies`.
+    Parameters
+    ----------
+    remaining : :class:`set` of :class:`str`
+        The properties which are yet to be found. If ``None``, all
+        properties are extracted.
 
-        Returns
-        -------
-        None : :class:`NoneType`
+    name : :class:`str`
+        The property which was found.
 
-        """
+    Returns
+    -------
+    None : :class:`NoneType`
 
-        test = '|               Frequency Printout                |'
+    """
 
-        # Use a switch to make sure we are extracting values after the
-        # final property readout.
-        switch = False
+    if remaining is not None:
+        remaining.discard(name)
+
+
+# Matches a number in a line of an xTB output file.
+_xtb_number = re.compile(r"[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
+
+# The properties which can be extracted by XTBExtractor.
+_xtb_properties = (
+    'total_energy',
+    'homo_lumo_gap',
+    'fermi_level',
+    'qonly_dipole_moment',
+    'full_dipole_moment',
+    'qonly_quadrupole_moment',
+    'qdip_quadrupole_moment',
+    'full_quadrupole_moment',
+    'homo_lumo_occ',
+    'total_free_energy',
+    'frequencies',
+    'num_scc_cycles',
+    'num_optimization_cycles',
+)
+
+# The properties which are counts, rather than values.
+_xtb_counts = {'num_scc_cycles', 'num_optimization_cycles'}
+
+# The properties which xTB prints only once, so that reading can stop
+# once they are found.
+_xtb_single_properties = {'frequencies', 'num_optimization_cycles'}
+
+# The strings which mark the line of a property. Checked in order,
+# all formatting based on the 190418 version of xTB.
+_xtb_markers = (
+    ('total_energy', '          | TOTAL ENERGY  '),
+    ('homo_lumo_gap', '          | HOMO-LUMO GAP   '),
+    ('fermi_level', '             Fermi-level        '),
+    ('dipole_moment', 'molecular dipole:'),
+    ('quadrupole_moment', 'molecular quadrupole (traceless):'),
+    ('homo_lumo_occ_HOMO', '(HOMO)'),
+    ('homo_lumo_occ_LUMO', '(LUMO)'),
+    ('total_free_energy', '          | TOTAL FREE ENERGY  '),
+    ('frequencies', '|               Frequency Printout                |'),
+    ('num_scc_cycles', '*** convergence criteria satisfied after'),
+    (
+        'num_optimization_cycles',
+        '*** GEOMETRY OPTIMIZATION CONVERGED AFTER',
+    ),
+    (
+        'num_optimization_cycles',
+        '*** FAILED TO CONVERGE GEOMETRY OPTIMIZATION IN',
+    ),
+)
+
+# Maps markers of multi-line blocks to the properties in the block.
+_xtb_blocks = {
+    'dipole_moment': {'qonly_dipole_moment', 'full_dipole_moment'},
+    'quadrupole_moment': {
+        'qonly_quadrupole_moment',
+        'qdip_quadrupole_moment',
+        'full_quadrupole_moment',
+    },
+    'frequencies': {'frequencies'},
+}
 
-        frequencies = []
-        for i, line in enumerate(self.output_lines):
-            if test in line:
-                # Turn on reading as final frequency printout has
-                # begun.
-                switch = True
-            if ' reduced masses (amu)' in line:
-                # Turn off reading as frequency section is done.
-                switch = False
-            if 'eigval :' in line and switch is True:
-                samp = line.rstrip().split(':')[1].split(' ')
-                split_line = [i for i in samp if i]
-                for freq in split_line:
-                    frequencies.append(freq)
-
-        self.frequencies = [float(i) for i in frequencies]
+# Maps a multi-line block to the property on each line after its
+# header, and the label which must be on that line.
+_xtb_block_lines = {
+    'dipole_moment': {
+        2: ('qonly_dipole_moment', 'q only:'),
+        3: ('full_dipole_moment', 'full:'),
+    },
+    'quadrupole_moment': {
+        2: ('qonly_quadrupole_moment', 'q only:'),
+        3: ('qdip_quadrupole_moment', 'q+dip:'),
+        4: ('full_quadrupole_moment', 'full:'),
+    },
+}
@@ -1,5 +1,7 @@
+import sys
 import stk
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 
 
 class _Thing:
@@ -60,6 +62,33 @@ def test_cache_use(tmp_amine2):
     assert calls == 3
 
 
+def test_cache_threads(amine2, aldehyde2, aldehyde3):
+    # Molecules are evicted from the cache by other threads while
+    # their results are being looked up.
+    mols = [amine2, aldehyde2, aldehyde3]
+    calc = stk.FitnessFunction(lambda mol: len(mol.atoms), use_cache=True)
+    calc.set_cache_policy(max_size=1)
+
+    def get_fitness_values(i):
+        return [
+            calc.get_fitness(mols[(i+j) % len(mols)])
+            for j in range(10000)
+        ]
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(get_fitness_values, range(6)))
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    for i, fitness_values in enumerate(results):
+        assert fitness_values == [
+            len(mols[(i+j) % len(mols)].atoms) for j in range(10000)
+        ]
+
+
 def test_raising_fitness_calculator(tmp_amine2):
     fitness_calculator = stk.PropertyVector(lambda m: 1)
     never_raiser = stk.RaisingCalculator(fitness_calculator, 0)
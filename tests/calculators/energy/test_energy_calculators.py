@@ -1,4 +1,11 @@
+import os
 import stk
+from os.path import abspath, join
+
+
+odir = 'energy_calculators_tests_output'
+if not os.path.exists(odir):
+    os.mkdir(odir)
 
 
 def test_mmff(amine2, amine2_conf1):
@@ -35,6 +42,23 @@ def test_cache_use(amine2):
     assert cached_mmff.get_energy(amine2) is obj
 
 
+def test_geometry_caching(tmp_amine2):
+    mmff = stk.MMFFEnergy(use_cache=True).set_geometry_caching()
+    energy = mmff.get_energy(tmp_amine2)
+
+    # A clone has the same geometry, so it uses the cached value.
+    obj = object()
+    mmff.add_to_cache(tmp_amine2, obj)
+    assert mmff.get_energy(tmp_amine2.clone()) is obj
+
+    # Changing the coordinates means the energy is calculated again.
+    tmp_amine2.set_position_matrix(
+        tmp_amine2.get_position_matrix() + [1, 0, 0]
+    )
+    assert mmff.get_energy(tmp_amine2) is not obj
+    assert abs(mmff.get_energy(tmp_amine2) - energy) < 1e-6
+
+
 def test_formation(polymer, amine2, water):
     mmff = stk.MMFFEnergy(use_cache=True)
     building_blocks = list(polymer.building_block_vertices.keys())
@@ -52,3 +76,69 @@ def test_formation(polymer, amine2, water):
     )
     formation_energy = product_energy - reactant_energy
     assert formation.get_energy(polymer) - formation_energy < 1e-4
+
+
+def test_cache_policy(amine2, aldehyde2):
+    mmff = stk.MMFFEnergy(use_cache=True).set_cache_policy(max_size=1)
+    mmff.get_energy(amine2)
+    mmff.get_energy(amine2)
+    mmff.get_energy(aldehyde2)
+    cache = mmff.get_cache()
+    assert cache.get_num_hits() == 1
+    assert cache.get_num_misses() == 2
+    assert cache.get_num_evictions() == 1
+    assert not mmff.is_in_cache(amine2)
+    assert mmff.is_in_cache(aldehyde2)
+
+    mmff.set_cache_policy(weak=True)
+    bb = stk.BuildingBlock('NCCCN')
+    mmff.get_energy(bb)
+    assert len(mmff.get_cache()) == 2
+    del bb
+    assert len(mmff.get_cache()) == 1
+
+
+def test_xtb_properties(tmp_amine2):
+    # A stand-in for xTB, which writes a known output and records
+    # each time it is run.
+    runs = abspath(join(odir, 'xtb_properties_runs'))
+    if os.path.exists(runs):
+        os.remove(runs)
+    xtb_path = abspath(join(odir, 'fake_xtb'))
+    with open(xtb_path, 'w') as f:
+        f.write(
+            '#!/bin/sh\n'
+            '[ -f "$1" ] || exit 1\n'
+            f'echo run >> {runs}\n'
+            f'cat {abspath(join("..", "data", "xtb_energy.output"))}\n'
+        )
+    os.chmod(xtb_path, 0o755)
+
+    # The output directory has a space, which must not split the
+    # path of the input file.
+    xtb = stk.XTBProperties(
+        xtb_path=xtb_path,
+        output_dir=join(odir, 'xtb properties')
+    )
+    energy_calculator = stk.XTBEnergy.init_from_properties_calculator(
+        properties_calculator=xtb
+    )
+    properties = xtb.get_properties(tmp_amine2)
+    energy = energy_calculator.get_energy(tmp_amine2)
+    assert energy == properties.total_energy
+    assert (
+        energy_calculator.homo_lumo_gaps[tmp_amine2]
+        == properties.homo_lumo_gap
+    )
+    # A clone has the same geometry, so xTB is not run again.
+    assert xtb.get_properties(tmp_amine2.clone()) is properties
+    with open(runs, 'r') as f:
+        assert len(f.readlines()) == 1
+
+    # Changing the coordinates means xTB is run again.
+    tmp_amine2.set_position_matrix(
+        tmp_amine2.get_position_matrix() + [1, 0, 0]
+    )
+    xtb.get_properties(tmp_amine2)
+    with open(runs, 'r') as f:
+        assert len(f.readlines()) == 2
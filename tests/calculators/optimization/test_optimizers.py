@@ -2,6 +2,7 @@ import stk
 from os.path import join
 import os
 import pytest
+import numpy as np
 
 
 odir = 'optimizer_tests_output'
@@ -29,6 +30,27 @@ def test_add_to_cache(tmp_amine2):
     assert mmff_energy.get_energy(tmp_amine2) != init_energy
 
 
+class _Translator(stk.Optimizer):
+    # Only implements the methods without a default.
+    def is_caching(self):
+        return False
+
+    def _optimize(self, mol):
+        mol.set_position_matrix(mol.get_position_matrix() + [1, 0, 0])
+
+
+def test_optimizer_defaults(tmp_amine2):
+    optimizer = _Translator()
+    assert optimizer.get_result_store() is None
+    assert optimizer.get_num_cores() == 1
+    assert optimizer.set_cache_policy(max_size=1) is optimizer
+    assert optimizer.set_geometry_caching() is optimizer
+
+    expected = tmp_amine2.get_position_matrix() + [1, 0, 0]
+    optimizer.optimize(tmp_amine2)
+    assert np.allclose(tmp_amine2.get_position_matrix(), expected)
+
+
 def test_raising_optimizer(tmp_polymer):
     mmff = stk.MMFF()
     always_raiser = stk.RaisingCalculator(
@@ -157,3 +179,75 @@ def test_try_catch_optimizer(tmp_amine2):
     tmp_amine2.write(join(odir, 'try_catch_optimizer_before.mol'))
     try_catch.optimize(tmp_amine2)
     tmp_amine2.write(join(odir, 'try_catch_optimizer_after.mol'))
+
+
+def test_xtb_warm_start(tmp_amine2):
+    # A stand-in for xTB, which returns the input structure, and
+    # takes fewer cycles if it was given a restart file.
+    xtb_path = os.path.abspath(join(odir, 'fake_xtb'))
+    with open(xtb_path, 'w') as f:
+        f.write(
+            '#!/bin/sh\n'
+            'if [ -f xtbrestart ]; then cycles=2; else cycles=9; fi\n'
+            'echo restart > xtbrestart\n'
+            'cp "$1" xtbopt.xyz\n'
+            'touch .xtboptok\n'
+            'echo "*** GEOMETRY OPTIMIZATION CONVERGED AFTER '
+            '$cycles ITERATIONS ***"\n'
+        )
+    os.chmod(xtb_path, 0o755)
+
+    xtb = stk.XTB(
+        xtb_path=xtb_path,
+        # A space must not split the path of the input file.
+        output_dir=join(odir, 'xtb warm start'),
+        calculate_hessian=False,
+        max_runs=1,
+        warm_start=True
+    )
+    xtb.optimize(tmp_amine2)
+    assert xtb.get_num_cycles(tmp_amine2) == [9]
+
+    # A molecule with the same atoms and bonds starts from the
+    # optimized structure and restart file of tmp_amine2.
+    clone = tmp_amine2.clone()
+    clone.set_position_matrix(clone.get_position_matrix() + [1, 0, 0])
+    xtb.optimize(clone)
+    assert xtb.get_num_cycles(clone) == [2]
+    assert (
+        abs(
+            clone.get_position_matrix()
+            - tmp_amine2.get_position_matrix()
+        ).max() < 1e-4
+    )
+
+    # A molecule with different bonds is not warm started.
+    bb = stk.BuildingBlock('NCCN')
+    xtb.optimize(bb)
+    assert xtb.get_num_cycles(bb) == [9]
+
+
+def test_mopac(tmp_amine2):
+    # A stand-in for MOPAC, which writes the input structure,
+    # moved along x, to a .pdb file.
+    mopac_path = os.path.abspath(join(odir, 'fake_mopac'))
+    with open(mopac_path, 'w') as f:
+        f.write(
+            '#!/bin/sh\n'
+            'awk \'NR > 3 { printf "HETATM%5d %-4s UNL     1    '
+            '%8.3f%8.3f%8.3f\\n", NR-3, $1, $2+1, $4, $6 }\' '
+            '"$1" > "${1%.mop}.pdb"\n'
+        )
+    os.chmod(mopac_path, 0o755)
+
+    output_dir = join(odir, 'mopac')
+    mopac = stk.MOPAC(mopac_path, output_dir=output_dir)
+    expected = tmp_amine2.get_position_matrix() + [1, 0, 0]
+    mopac.optimize(tmp_amine2)
+    assert np.allclose(
+        a=tmp_amine2.get_position_matrix(),
+        b=expected,
+        atol=1e-3
+    )
+    with open(join(output_dir, 'optimization.mop'), 'r') as f:
+        assert f.readline().startswith('PM7 OPT GNORM=0.01 EPS=80.1')
@@ -0,0 +1,96 @@
+import stk
+import numpy as np
+import os
+from os.path import join
+
+
+odir = 'result_store_tests_output'
+if not os.path.exists(odir):
+    os.mkdir(odir)
+
+num_calls = 0
+
+
+def counted_fitness(mol):
+    global num_calls
+    num_calls += 1
+    return len(mol.atoms)
+
+
+def test_sqlite_result_store(tmp_amine2):
+    path = join(odir, 'results.db')
+    if os.path.exists(path):
+        os.remove(path)
+
+    store = stk.SqliteResultStore(path)
+    init = tmp_amine2.clone()
+    mmff = stk.MMFF().set_result_store(store)
+    mmff.optimize(tmp_amine2)
+    optimized = tmp_amine2.get_position_matrix()
+    assert len(store) == 1
+
+    # A different calculator, store and molecule take the optimized
+    # structure from the database.
+    clone = init.clone()
+    stk.MMFF().set_result_store(
+        stk.SqliteResultStore(path)
+    ).optimize(clone)
+    assert np.all(clone.get_position_matrix() == optimized)
+    assert len(store) == 1
+
+    # The cache option does not change the key, the class does.
+    stk.MMFF(use_cache=True).set_result_store(store).optimize(init)
+    stk.UFF().set_result_store(store).optimize(init.clone())
+    assert len(store) == 2
+
+    fitness_calculator = stk.FitnessFunction(counted_fitness)
+    fitness_calculator.set_result_store(store)
+    assert fitness_calculator.get_fitness(init) == len(init.atoms)
+    assert fitness_calculator.get_fitness(init) == len(init.atoms)
+    assert num_calls == 1
+    init.set_position_matrix(np.zeros((len(init.atoms), 3)))
+    fitness_calculator.get_fitness(init)
+    assert num_calls == 2
+
+
+def test_sqlite_result_store_threads(tmp_amine2, tmp_aldehyde2):
+    path = join(odir, 'threads.db')
+    if os.path.exists(path):
+        os.remove(path)
+
+    store = stk.SqliteResultStore(path)
+    mmff = stk.MMFF().set_result_store(store)
+    pop = stk.Population(tmp_amine2, tmp_aldehyde2)
+    pop.optimize(mmff, num_threads=2)
+    assert len(store) == 2
+
+
+def test_result_store_key(tmp_amine2, tmp_aldehyde2):
+    output = os.path.abspath(join('..', 'data', 'xtb_energy.output'))
+    xtb_path = os.path.abspath(join(odir, 'fake_xtb'))
+    with open(xtb_path, 'w') as f:
+        f.write(f'#!/bin/sh\ncat {output}\n')
+    os.chmod(xtb_path, 0o755)
+
+    # The energies saved by the calculator must not change its key.
+    xtb = stk.XTBEnergy(xtb_path, output_dir=join(odir, 'xtb_key'))
+    get_key = stk.calculators.base_calculators._get_result_store_key
+    key = get_key(xtb, tmp_amine2)
+    xtb.get_energy(tmp_amine2)
+    assert get_key(xtb, tmp_amine2) == key
+    xtb.get_energy(tmp_aldehyde2)
+    assert get_key(xtb, tmp_amine2) == key
+
+    # The warm start seeds of the optimizer are not parameters.
+    xtb1 = stk.XTB(
+        xtb_path=xtb_path,
+        output_dir=join(odir, 'xtb_key'),
+        warm_start=True
+    )
+    xtb2 = stk.XTB(
+        xtb_path=xtb_path,
+        output_dir=join(odir, 'xtb_key'),
+        warm_start=True,
+        max_seeds=10
+    )
+    assert get_key(xtb1, tmp_amine2) == get_key(xtb2, tmp_amine2)
@@ -0,0 +1,93 @@
+import stk
+import os
+import sys
+import time
+import pytest
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from os.path import join
+
+
+odir = 'subprocess_engine_tests_output'
+if not os.path.exists(odir):
+    os.mkdir(odir)
+
+
+def test_run():
+    engine = stk.SubprocessEngine()
+    output = engine.run([sys.executable, '-c', 'print("hi")'])
+    assert output.strip() == 'hi'
+
+    # The program is run in cwd and writes its output to output_path.
+    cwd = os.path.abspath(odir)
+    output_path = join(cwd, 'run.output')
+    output = engine.run(
+        args=f'{sys.executable} -c "import os; print(os.getcwd())"',
+        cwd=cwd,
+        output_path=output_path,
+        shell=True,
+    )
+    assert output == ''
+    with open(output_path, 'r') as f:
+        assert f.read().strip() == cwd
+    engine.close()
+
+
+def test_timeout():
+    engine = stk.SubprocessEngine(timeout=0.5)
+    sleep = [sys.executable, '-c', 'import time; time.sleep(30)']
+    start = time.time()
+    with pytest.raises(stk.SubprocessTimeoutError):
+        engine.run(sleep)
+    assert time.time() - start < 10
+    engine.close()
+
+
+def test_max_jobs():
+    sleep = [sys.executable, '-c', 'import time; time.sleep(0.5)']
+
+    async def run_all(engine):
+        return await asyncio.gather(*(
+            engine.run_async(sleep) for _ in range(4)
+        ))
+
+    engine = stk.SubprocessEngine(max_jobs=4)
+    start = time.time()
+    asyncio.run(run_all(engine))
+    parallel = time.time() - start
+    engine.close()
+
+    engine = stk.SubprocessEngine(max_jobs=1)
+    start = time.time()
+    asyncio.run(run_all(engine))
+    assert time.time() - start > 2
+    assert parallel < time.time() - start
+    engine.close()
+
+
+@pytest.mark.skipif(
+    not hasattr(os, 'sched_setaffinity'),
+    reason='Setting the CPU affinity is not supported.'
+)
+def test_cores():
+    engine = stk.SubprocessEngine()
+    affinity = [
+        sys.executable,
+        '-c',
+        'import os; print(sorted(os.sched_getaffinity(0)))',
+    ]
+    cores = sorted(os.sched_getaffinity(0))
+
+    # The program gets the cores of the thread which runs it, even if
+    # the event loop was started by a thread pinned to other cores.
+    def run_pinned():
+        os.sched_setaffinity(0, cores[-1:])
+        return engine.run(affinity).strip()
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert pool.submit(run_pinned).result() == str(cores[-1:])
+    assert engine.run(affinity).strip() == str(cores)
+
+    output = engine.run(affinity, cores=cores[:1])
+    assert output.strip() == str(cores[:1])
+    engine.close()
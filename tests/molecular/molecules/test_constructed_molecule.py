@@ -1,7 +1,9 @@
 import os
+import json
 import stk
 from collections import Counter
 import itertools as it
+import numpy as np
 
 
 if not os.path.exists('constructed_molecule_tests_output'):
@@ -68,6 +70,32 @@ def test_get_identity_key(
     assert cage1.get_identity_key() != cage2.get_identity_key()
 
 
+def test_get_identity_digest(polymer, tmp_polymer, amine2, aldehyde2):
+    assert polymer.get_identity_digest() == tmp_polymer.get_identity_digest()
+    assert len(polymer.get_identity_digest()) == 32
+    assert (
+        polymer.clone().get_identity_digest()
+        == polymer.get_identity_digest()
+    )
+
+    polymer1 = stk.ConstructedMolecule(
+        building_blocks=[amine2, aldehyde2],
+        topology_graph=stk.polymer.Linear('AB', 3),
+        use_cache=True
+    )
+    mol_dict = json.loads(json.dumps(polymer1.to_dict()))
+    assert mol_dict['identity_digest'] == polymer1.get_identity_digest()
+    assert stk.Molecule.init_from_dict(mol_dict, True) is polymer1
+
+    # Dumps without a digest are still read.
+    del mol_dict['identity_digest']
+    polymer2 = stk.Molecule.init_from_dict(mol_dict)
+    assert (
+        polymer2.get_identity_digest() == polymer1.get_identity_digest()
+    )
+    assert polymer2.get_identity_key() == polymer1.get_identity_key()
+
+
 def _test_atoms(atoms):
     for a1, a2 in atoms:
         assert a1 is not a2
@@ -147,3 +175,141 @@ def test_get_building_blocks(
     assert len(four_plus_six_bbs) == 2
     assert four_plus_six_bbs[amine2] == 1
     assert four_plus_six_bbs[aldehyde3] == 1
+
+
+def test_init_from_parent(amine2, amine2_alt1, aldehyde3):
+    tetrahedron = stk.cage.FourPlusSix()
+    parent = stk.ConstructedMolecule(
+        building_blocks=[amine2, aldehyde3],
+        topology_graph=tetrahedron
+    )
+    # Mimic an optimization of the parent.
+    generator = np.random.RandomState(4)
+    parent.set_position_matrix(
+        parent.get_position_matrix()
+        + generator.normal(0, 0.1, (len(parent.atoms), 3))
+    )
+
+    expected = stk.ConstructedMolecule(
+        building_blocks=[amine2_alt1, aldehyde3],
+        topology_graph=tetrahedron
+    )
+    cage = stk.ConstructedMolecule(
+        building_blocks=[amine2_alt1, aldehyde3],
+        topology_graph=tetrahedron,
+        parent=parent
+    )
+    assert cage.get_identity_key() == expected.get_identity_key()
+    assert len(cage.atoms) == len(expected.atoms)
+    for atom1, atom2 in zip(cage.atoms, expected.atoms):
+        assert atom1.__class__ is atom2.__class__
+        assert atom1.building_block is atom2.building_block
+    for bond1, bond2 in zip(cage.bonds, expected.bonds):
+        assert bond1.atom1.id == bond2.atom1.id
+        assert bond1.atom2.id == bond2.atom2.id
+
+    # The atoms of the unchanged building block keep their positions.
+    parent_ids = [
+        atom.id for atom in parent.atoms
+        if atom.building_block is aldehyde3
+    ]
+    cage_ids = [
+        atom.id for atom in cage.atoms
+        if atom.building_block is aldehyde3
+    ]
+    assert np.allclose(
+        a=parent.get_position_matrix()[parent_ids],
+        b=cage.get_position_matrix()[cage_ids],
+        atol=1e-12
+    )
+
+
+def test_init_from_small_parent(amine2, aldehyde3):
+    tetrahedron = stk.cage.FourPlusSix()
+    parent = stk.ConstructedMolecule(
+        building_blocks=[amine2, aldehyde3],
+        topology_graph=tetrahedron
+    )
+    # The new building block does not fit into the structure of the
+    # parent, so it must be ignored.
+    amine = stk.BuildingBlock('NCCCCCCCCCCN', ['amine'])
+    expected = stk.ConstructedMolecule(
+        building_blocks=[amine, aldehyde3],
+        topology_graph=tetrahedron
+    )
+    cage = stk.ConstructedMolecule(
+        building_blocks=[amine, aldehyde3],
+        topology_graph=tetrahedron,
+        parent=parent
+    )
+    assert np.allclose(
+        a=cage.get_position_matrix(),
+        b=expected.get_position_matrix(),
+        atol=1e-8
+    )
+
+
+def test_lazy(amine2, aldehyde2):
+    polymer1 = stk.ConstructedMolecule(
+        building_blocks=[amine2, aldehyde2],
+        topology_graph=stk.polymer.Linear('AB', 3)
+    )
+    polymer2 = stk.ConstructedMolecule(
+        building_blocks=[amine2, aldehyde2],
+        topology_graph=stk.polymer.Linear('AB', 3),
+        lazy=True
+    )
+    assert polymer1.get_identity_key() == polymer2.get_identity_key()
+    # Looking up a non-structural attribute does not construct the
+    # molecule.
+    assert not hasattr(polymer2, 'id')
+    assert 'atoms' not in vars(polymer2)
+
+    assert np.allclose(
+        a=polymer1.get_position_matrix(),
+        b=polymer2.get_position_matrix(),
+        atol=1e-12
+    )
+    assert len(polymer1.atoms) == len(polymer2.atoms)
+    for bond1, bond2 in zip(polymer1.bonds, polymer2.bonds):
+        assert bond1.atom1.id == bond2.atom1.id
+        assert bond1.atom2.id == bond2.atom2.id
+    assert (
+        polymer1.building_block_counter
+        == polymer2.building_block_counter
+    )
+    assert '_lazy_components' not in vars(polymer2)
+
+
+def test_get_clashes(amine2, aldehyde2):
+    polymer = stk.ConstructedMolecule(
+        building_blocks=[amine2, aldehyde2],
+        topology_graph=stk.polymer.Linear('AB', 2)
+    )
+    assert not polymer.has_clashes()
+    assert not list(polymer.get_clashes())
+
+    # Move the second building block on top of the first.
+    bb_atoms = [[] for i in range(4)]
+    for atom in polymer.atoms:
+        bb_atoms[atom.building_block_id].append(atom.id)
+    position_matrix = polymer.get_position_matrix()
+    position_matrix[bb_atoms[1]] += (
+        polymer.get_centroid(bb_atoms[0])
+        - polymer.get_centroid(bb_atoms[1])
+    )
+    polymer.set_position_matrix(position_matrix)
+
+    assert polymer.has_clashes()
+    clashes = list(polymer.get_clashes())
+    atom_bb_ids = {
+        atom.id: atom.building_block_id for atom in polymer.atoms
+    }
+    for atom1_id, atom2_id, distance in clashes:
+        assert atom1_id < atom2_id
+        assert {atom_bb_ids[atom1_id], atom_bb_ids[atom2_id]} == {0, 1}
+        assert distance < 1
+        assert np.isclose(
+            polymer.get_atom_distance(atom1_id, atom2_id),
+            distance
+        )
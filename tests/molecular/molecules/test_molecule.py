@@ -126,7 +126,7 @@ def test_get_atom_distance(tmp_amine2):
 
 def test_get_cached_mol(tmp_amine2, aldehyde2):
     try:
-        stk.BuildingBlock._cache = {}
+        stk.BuildingBlock._cache = stk.MoleculeCache()
         tmp_amine2.update_cache()
         cached = stk.BuildingBlock.get_cached_mol(
             identity_key=tmp_amine2.get_identity_key()
@@ -149,7 +149,7 @@ def test_get_cached_mol(tmp_amine2, aldehyde2):
         raise
 
     finally:
-        stk.BuildingBlock._cache = {}
+        stk.BuildingBlock._cache = stk.MoleculeCache()
 
 
 def test_get_center_of_mass(tmp_amine2):
@@ -261,6 +261,29 @@ def test_get_plane_normal(tmp_amine2):
     )
 
 
+def test_get_pore_diameter(tmp_opt_cc3):
+    diameter = tmp_opt_cc3.get_pore_diameter()
+    assert 5 < diameter < 6
+
+    # Shrinking the cage shrinks the pore.
+    centroid = tmp_opt_cc3.get_centroid()
+    tmp_opt_cc3.set_position_matrix(
+        0.5*(tmp_opt_cc3.get_position_matrix()-centroid) + centroid
+    )
+    assert tmp_opt_cc3.get_pore_diameter() < diameter
+    assert tmp_opt_cc3.get_pore_diameter(origin=[100, 0, 0]) > 100
+
+
+def test_get_windows(tmp_opt_cc3, tmp_cc3):
+    windows = tmp_opt_cc3.get_windows()
+    assert len(windows) == 4
+    assert all(3 < diameter < 4.5 for diameter in windows)
+    assert not tmp_opt_cc3.get_windows(probe_radius=2.5)
+
+    # The unoptimized cage is open.
+    assert len(tmp_cc3.get_windows()) != 4
+
+
 def test_get_set_position_matrix(tmp_amine2):
     zeros = np.zeros((len(tmp_amine2.atoms), 3))
     tmp_amine2.set_position_matrix(zeros)
@@ -273,7 +296,7 @@ def test_get_set_position_matrix(tmp_amine2):
 
 def test_has_cached_mol(tmp_amine2, aldehyde2):
     try:
-        stk.BuildingBlock._cache = {}
+        stk.BuildingBlock._cache = stk.MoleculeCache()
         tmp_amine2.update_cache()
         is_cached = stk.BuildingBlock.has_cached_mol(
             identity_key=tmp_amine2.get_identity_key()
@@ -289,7 +312,7 @@ def test_has_cached_mol(tmp_amine2, aldehyde2):
         raise
 
     finally:
-        stk.BuildingBlock._cache = {}
+        stk.BuildingBlock._cache = stk.MoleculeCache()
 
 
 def test_set_centroid(tmp_amine2):
@@ -401,7 +424,9 @@ def test_to_rdkit_mol(tmp_amine2):
 
 def test_update_cache(tmp_amine2):
     try:
-        cache = dict(stk.BuildingBlock._cache)
+        cache = stk.BuildingBlock.get_cache()
+        # Work on a copy of the cache.
+        stk.BuildingBlock.set_cache_policy()
         # Create a cached molecule.
         cached = stk.BuildingBlock.init_from_rdkit_mol(
             mol=tmp_amine2.to_rdkit_mol(),
@@ -423,3 +448,44 @@ def test_update_cache(tmp_amine2):
 
     finally:
         stk.BuildingBlock._cache = cache
+
+
+def test_set_cache_policy(amine2, aldehyde2, aldehyde3):
+    cache = stk.BuildingBlock.get_cache()
+    try:
+        stk.BuildingBlock._cache = stk.MoleculeCache()
+        amine2.update_cache()
+        aldehyde2.update_cache()
+        stk.BuildingBlock.set_cache_policy(max_size=1)
+        # Only the most recently used molecule is kept.
+        assert not stk.BuildingBlock.has_cached_mol(
+            identity_key=amine2.get_identity_key()
+        )
+        assert stk.BuildingBlock.get_cache().get_num_evictions() == 1
+        assert stk.BuildingBlock.get_cached_mol(
+            identity_key=aldehyde2.get_identity_key()
+        ) is aldehyde2
+
+        stk.BuildingBlock.set_cache_policy(max_size=0, weak=True)
+        bb = stk.BuildingBlock('NCCCCCN', ['amine'], use_cache=True)
+        # The molecule is alive, so it is still found.
+        assert bb is stk.BuildingBlock(
+            smiles='NCCCCCN',
+            functional_groups=['amine'],
+            use_cache=True
+        )
+        key = bb.get_identity_key()
+        del bb
+        assert not stk.BuildingBlock.has_cached_mol(key)
+
+        stk.BuildingBlock.set_cache_policy()
+        aldehyde3.update_cache()
+        assert stk.BuildingBlock.get_cache().get_memory_usage() > (
+            aldehyde3.get_position_matrix().nbytes
+        )
+
+    except Exception:
+        raise
+
+    finally:
+        stk.BuildingBlock._cache = cache
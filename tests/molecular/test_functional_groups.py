@@ -1,5 +1,6 @@
 import stk
 import itertools as it
+import rdkit.Chem.AllChem as rdkit
 
 
 def is_fg_match(fg1, fg2):
@@ -104,3 +105,50 @@ def test_get_deleter_ids(aldehyde3):
         deleters = it.zip_longest(fg.get_deleter_ids(), fg.deleters)
         for deleter_id, deleter in deleters:
             assert deleter.id == deleter_id
+
+
+def test_match_cache(monkeypatch, amine2):
+    num_calls = 0
+    get_substruct_matches = rdkit.Mol.GetSubstructMatches
+
+    def counted_get_substruct_matches(self, *args, **kwargs):
+        nonlocal num_calls
+        num_calls += 1
+        return get_substruct_matches(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        stk.molecular.functional_groups,
+        '_matches',
+        {}
+    )
+    monkeypatch.setattr(
+        rdkit.Mol,
+        'GetSubstructMatches',
+        counted_get_substruct_matches
+    )
+
+    amine = stk.fg_types['amine']
+    clone = amine2.clone()
+    fgs = list(amine.get_functional_groups(amine2))
+    assert num_calls > 0
+    num_matching_calls = num_calls
+    # The clone has the same graph, so RDKit is not used again.
+    clone_fgs = list(amine.get_functional_groups(clone))
+    assert num_calls == num_matching_calls
+
+    assert len(fgs) == len(clone_fgs) == 2
+    for fg, clone_fg in zip(fgs, clone_fgs):
+        assert (
+            list(fg.get_atom_ids())
+            == list(clone_fg.get_atom_ids())
+        )
+        assert (
+            list(fg.get_bonder_ids())
+            == list(clone_fg.get_bonder_ids())
+        )
+        assert (
+            list(fg.get_deleter_ids())
+            == list(clone_fg.get_deleter_ids())
+        )
+        assert all(atom in clone.atoms for atom in clone_fg.atoms)
+        assert not any(atom in fg.atoms for atom in clone_fg.atoms)
@@ -95,6 +95,38 @@ def test_vertex(
             _test_assignment(vertex, bb, vertices, edges)
 
 
+def test_aligner_edge_assignment(tmp_aldehyde3):
+    # Rounding errors used to give the first functional group and the
+    # aligner edge an angle of almost 2*pi with themselves, which
+    # sorted them last. For this vertex, the first functional group
+    # was then assigned to edge 2 instead of the aligner edge 0, with
+    # the assignments {0: 2, 1: 1, 2: 0}.
+    four_plus_four = stk.cage.FourPlusFour()
+    vertices = four_plus_four.vertices
+    edges = four_plus_four.edges
+    vertex = vertices[0]
+    vertex.place_building_block(tmp_aldehyde3, vertices, edges)
+    assignments = vertex.assign_func_groups_to_edges(
+        building_block=tmp_aldehyde3,
+        vertices=vertices,
+        edges=edges
+    )
+    assert assignments == {0: 0, 1: 2, 2: 1}
+
+    for aligner_edge in range(1, 3):
+        four_plus_four = stk.cage.FourPlusFour(
+            vertex_alignments={0: aligner_edge}
+        )
+        vertices = four_plus_four.vertices
+        edges = four_plus_four.edges
+        vertices[0].place_building_block(
+            building_block=tmp_aldehyde3,
+            vertices=vertices,
+            edges=edges
+        )
+        _test_assignment(vertices[0], tmp_aldehyde3, vertices, edges)
+
+
 def test_topologies(
     tmp_six_plus_eight,
     tmp_one_plus_one,
@@ -271,3 +303,109 @@ def test_multi_bb(
     _test_construction(c, num_expected_bbs)
     _test_dump_and_load(test_dir, c, 'multi')
     _compare_with_valid(valid_cage_dir, c, 'multi')
+
+
+def _test_symmetric_construction(mol1, mol2):
+    assert np.allclose(
+        a=mol1.get_position_matrix(),
+        b=mol2.get_position_matrix(),
+        atol=1e-8
+    )
+    for b1, b2 in zip(mol1.bonds, mol2.bonds):
+        assert b1.atom1.id == b2.atom1.id
+        assert b1.atom2.id == b2.atom2.id
+
+
+def test_symmetry(amine2, amine2_alt1, aldehyde3, aldehyde3_alt1):
+    for vertex_alignments in (None, {0: 1, 1: 1, 2: 2}):
+        c1 = stk.ConstructedMolecule(
+            building_blocks=[amine2, aldehyde3],
+            topology_graph=stk.cage.FourPlusSix(vertex_alignments)
+        )
+        four_plus_six = stk.cage.FourPlusSix(
+            vertex_alignments=vertex_alignments,
+            use_symmetry=True
+        )
+        c2 = stk.ConstructedMolecule(
+            building_blocks=[amine2, aldehyde3],
+            topology_graph=four_plus_six
+        )
+        _test_symmetric_construction(c1, c2)
+
+    # Vertices holding different building blocks are not equivalent.
+    building_blocks = [amine2, amine2_alt1, aldehyde3, aldehyde3_alt1]
+    cages = []
+    for use_symmetry in (False, True):
+        four_plus_six = stk.cage.FourPlusSix(use_symmetry=use_symmetry)
+        cages.append(stk.ConstructedMolecule(
+            building_blocks=building_blocks,
+            topology_graph=four_plus_six,
+            building_block_vertices={
+                aldehyde3: four_plus_six.vertices[0:3],
+                aldehyde3_alt1: four_plus_six.vertices[3:4],
+                amine2: four_plus_six.vertices[4:8],
+                amine2_alt1: four_plus_six.vertices[8:]
+            }
+        ))
+    _test_symmetric_construction(*cages)
+
+
+def test_lazy_symmetry():
+    class Tetrahedron(stk.cage.FourPlusSix):
+        ...
+
+    # The symmetry is only found once it is needed, and then once
+    # per class.
+    assert Tetrahedron._symmetry_permutations is None
+    Tetrahedron(use_symmetry=True)
+    permutations = Tetrahedron._symmetry_permutations
+    assert len(permutations) == 11
+    Tetrahedron().get_unique_vertex_alignments()
+    assert Tetrahedron._get_symmetry_permutations() is permutations
+
+
+def test_isomers(amine2, aldehyde3, aldehyde3_alt1):
+    four_plus_six = stk.cage.FourPlusSix()
+    vertex_alignments = list(
+        four_plus_six.get_unique_vertex_alignments()
+    )
+    # The 12 rotations of a tetrahedron leave no alignment in place.
+    assert len(vertex_alignments) == 3**4 * 2**6 // 12
+    assert len({
+        tuple(sorted(alignments.items()))
+        for alignments in vertex_alignments
+    }) == len(vertex_alignments)
+
+    # Only the 3 rotations about vertex 3 keep it in place.
+    vertex_alignments = four_plus_six.get_unique_vertex_alignments(
+        building_block_vertices={
+            aldehyde3: four_plus_six.vertices[0:3],
+            aldehyde3_alt1: four_plus_six.vertices[3:4],
+            amine2: four_plus_six.vertices[4:],
+        }
+    )
+    assert sum(1 for _ in vertex_alignments) == 3**4 * 2**6 // 3
+
+    # Using the template first caches its repr, which the isomers
+    # must not inherit.
+    template = stk.ConstructedMolecule(
+        building_blocks=[amine2, aldehyde3],
+        topology_graph=four_plus_six
+    )
+    isomers = list(four_plus_six.get_isomers(vertex_ids=[0, 1]))
+    assert len(isomers) == 9
+    assert len({isomer._get_repr() for isomer in isomers}) == 9
+    assert len({
+        stk.ConstructedMolecule([amine2, aldehyde3], isomer)
+        .get_identity_digest()
+        for isomer in isomers
+    } | {template.get_identity_digest()}) == 9
+    for isomer, alignments in zip(
+        isomers,
+        four_plus_six.get_unique_vertex_alignments([0, 1])
+    ):
+        expected = stk.cage.FourPlusSix(alignments)
+        assert repr(isomer) == repr(expected)
+        c1 = stk.ConstructedMolecule([amine2, aldehyde3], isomer)
+        c2 = stk.ConstructedMolecule([amine2, aldehyde3], expected)
+        _test_symmetric_construction(c1, c2)
@@ -353,3 +353,60 @@ def test_topologies(
         name = f'{cof.cof.topology_graph.__class__.__name__}{periodic}'
         _test_dump_and_load(test_dir, cof.cof, name)
         _compare_with_valid(valid_cof_dir, cof.cof, name)
+
+
+def test_symmetry(amine2, aldehyde3):
+    for periodic in (False, True):
+        cof1 = stk.ConstructedMolecule(
+            building_blocks=[amine2, aldehyde3],
+            topology_graph=stk.cof.Honeycomb((3, 3, 1), periodic)
+        )
+        cof2 = stk.ConstructedMolecule(
+            building_blocks=[amine2, aldehyde3],
+            topology_graph=stk.cof.Honeycomb(
+                lattice_size=(3, 3, 1),
+                periodic=periodic,
+                use_symmetry=True
+            )
+        )
+        assert np.allclose(
+            a=cof1.get_position_matrix(),
+            b=cof2.get_position_matrix(),
+            atol=1e-8
+        )
+        for b1, b2 in zip(cof1.bonds, cof2.bonds):
+            assert b1.atom1.id == b2.atom1.id
+            assert b1.atom2.id == b2.atom2.id
+            assert b1.periodicity == b2.periodicity
+
+
+def test_tile(amine2, aldehyde3):
+    num_cells = 6
+    for periodic in (False, True):
+        cof1 = stk.ConstructedMolecule(
+            building_blocks=[amine2, aldehyde3],
+            topology_graph=stk.cof.Honeycomb((3, 2, 1), periodic)
+        )
+        lattice = stk.cof.Honeycomb(
+            lattice_size=(3, 2, 1),
+            periodic=periodic,
+            tile=True
+        )
+        cof2 = stk.ConstructedMolecule(
+            building_blocks=[amine2, aldehyde3],
+            topology_graph=lattice
+        )
+        assert 'tile=True' in repr(lattice)
+        assert len(cof1.atoms) == len(cof2.atoms)
+        assert len(cof1.bonds) == len(cof2.bonds)
+        assert (
+            len(cof1.construction_bonds)
+            == len(cof2.construction_bonds)
+        )
+        assert cof1.building_block_counter == cof2.building_block_counter
+
+        if periodic:
+            # Every unit cell is a translation of the first one.
+            cells = cof2.get_position_matrix().reshape(num_cells, -1, 3)
+            shifts = cells - cells[:1]
+            assert np.allclose(shifts, shifts[:, :1])
@@ -2,6 +2,8 @@ import stk
 import os
 from os.path import join
 import numpy as np
+import gc
+import weakref
 
 
 from ..._test_utilities import _test_dump_and_load, _compare_with_valid
@@ -108,3 +110,122 @@ def test_complex(
         _test_construction(complex_, i, num_expected_bbs)
         _test_dump_and_load(test_dir, complex_, str(i))
         _compare_with_valid(valid_host_guest_dir, complex_, str(i))
+
+
+def test_position_matrices(
+    amine2,
+    amine2_alt3,
+    aldehyde3,
+    chained_c60,
+    tmp_bromine2
+):
+    host = _create_host(amine2, amine2_alt3, aldehyde3)
+    guests = [chained_c60, tmp_bromine2]
+    complexes = [
+        stk.host_guest.Complex(),
+        stk.host_guest.Complex(
+            guest_start=chained_c60.get_direction(),
+            guest_target=[1, 1, 0],
+            displacement=[2, 0, 1]
+        ),
+    ]
+    host_positions, guest_positions = (
+        stk.host_guest.Complex.get_position_matrices(
+            host=host,
+            guests=guests,
+            complexes=complexes
+        )
+    )
+    assert len(guest_positions) == len(guests)
+    for guest, positions in zip(guests, guest_positions):
+        assert positions.shape == (len(complexes), len(guest.atoms), 3)
+        for complex_, guest_pose in zip(complexes, positions):
+            mol = stk.ConstructedMolecule([host, guest], complex_)
+            expected = mol.get_position_matrix()
+            assert np.allclose(expected[:len(host.atoms)], host_positions)
+            assert np.allclose(expected[len(host.atoms):], guest_pose)
+
+    # Each complex has its own host atoms.
+    complex1, complex2 = (
+        stk.ConstructedMolecule([host, guest], complexes[0])
+        for guest in guests
+    )
+    num_host_atoms = len(host.atoms)
+    for atom1, atom2 in zip(
+        complex1.atoms[:num_host_atoms],
+        complex2.atoms[:num_host_atoms]
+    ):
+        assert atom1 is not atom2
+        assert atom1.id == atom2.id
+    for atom in complex1.atoms:
+        assert atom.building_block_id == (
+            0 if atom.id < num_host_atoms else 1
+        )
+
+
+def _get_overlap(complex_, num_host_atoms, clash_distance):
+    positions = complex_.get_position_matrix()
+    host_positions = positions[:num_host_atoms]
+    distances = np.min(
+        np.linalg.norm(
+            positions[num_host_atoms:, np.newaxis] - host_positions,
+            axis=2
+        ),
+        axis=1
+    )
+    return np.sum(np.square(np.clip(clash_distance-distances, 0, None)))
+
+
+def test_pose_search(amine2, amine2_alt3, aldehyde3, tmp_bromine2):
+    host = _create_host(amine2, amine2_alt3, aldehyde3)
+    guest = tmp_bromine2
+    clash_distance = stk.host_guest.Complex.clash_distance
+    # Place the guest in the wall of the host.
+    displacement = next(host.get_atom_positions([0]))
+    displacement -= host.get_centroid()
+    complexes = [
+        stk.host_guest.Complex(displacement=displacement),
+        stk.host_guest.Complex(
+            displacement=displacement,
+            num_trial_poses=500,
+            max_trial_displacement=3
+        )
+    ]
+    overlaps = [
+        _get_overlap(
+            complex_=stk.ConstructedMolecule([host, guest], complex_),
+            num_host_atoms=len(host.atoms),
+            clash_distance=clash_distance
+        )
+        for complex_ in complexes
+    ]
+    assert overlaps[1] < overlaps[0]
+    assert 'num_trial_poses=500' in repr(complexes[1])
+
+    mol = stk.ConstructedMolecule([host, guest], complexes[1])
+    _, (guest_positions, ) = (
+        stk.host_guest.Complex.get_position_matrices(
+            host=host,
+            guests=[guest],
+            complexes=complexes[1:]
+        )
+    )
+    assert np.allclose(
+        a=mol.get_position_matrix()[len(host.atoms):],
+        b=guest_positions[0]
+    )
+
+
+def test_host_template_cache(amine2, amine2_alt3, aldehyde3, tmp_bromine2):
+    host = _create_host(amine2, amine2_alt3, aldehyde3)
+    stk.ConstructedMolecule(
+        building_blocks=[host, tmp_bromine2],
+        topology_graph=stk.host_guest.Complex(num_trial_poses=10)
+    )
+    assert host in stk.host_guest.Complex._host_templates
+
+    # The cached host geometry does not keep the host alive.
+    host_ref = weakref.ref(host)
+    del host
+    gc.collect()
+    assert host_ref() is None
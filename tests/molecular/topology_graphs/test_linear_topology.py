@@ -231,3 +231,102 @@ def test_orientations(amine2_alt3, aldehyde2):
         p3.get_position_matrix(),
         p4.get_position_matrix()
     ))
+
+
+def test_unique_sequences(amine2, amine2_alt3, aldehyde2):
+    building_blocks = [amine2, amine2_alt3, aldehyde2]
+    sequences = list(stk.polymer.Linear.get_unique_sequences(
+        building_blocks=building_blocks,
+        num_vertices=3
+    ))
+    # There are 4 choices of building block and orientation on every
+    # vertex, because only amine2_alt3 can be flipped. Apart from the
+    # 8 chains which are their own reverse, each chain is the reverse
+    # of another.
+    assert len(sequences) == (4**3 + 8) // 2
+    assert len(set(sequences)) == len(sequences)
+
+    chains = stk.polymer.Linear.get_unique_chains(
+        building_blocks=building_blocks,
+        num_vertices=3
+    )
+    keys = {
+        stk.ConstructedMolecule(
+            building_blocks=building_blocks,
+            topology_graph=chain,
+            lazy=True
+        ).get_identity_key()
+        for chain in chains
+    }
+    assert len(keys) == len(sequences)
+
+
+def test_reversed_identity_key(amine2, amine2_alt3, aldehyde2):
+    polymer1 = stk.ConstructedMolecule(
+        building_blocks=[amine2_alt3, aldehyde2],
+        topology_graph=stk.polymer.Linear('AAB', 1, (0, 1, 0))
+    )
+    # aldehyde2 has two equivalent functional groups, so it is not
+    # flipped by the reversal.
+    polymer2 = stk.ConstructedMolecule(
+        building_blocks=[amine2_alt3, aldehyde2],
+        topology_graph=stk.polymer.Linear('BAA', 1, (0, 0, 1))
+    )
+    polymer3 = stk.ConstructedMolecule(
+        building_blocks=[amine2_alt3, aldehyde2],
+        topology_graph=stk.polymer.Linear('BAA', 1, (1, 0, 0))
+    )
+    assert polymer1.get_identity_key() == polymer2.get_identity_key()
+    assert polymer1.get_identity_key() != polymer3.get_identity_key()
+
+    # The reversal matches get_unique_sequences(), which only yields
+    # one of these chains.
+    polymer4 = stk.ConstructedMolecule(
+        building_blocks=[amine2, aldehyde2],
+        topology_graph=stk.polymer.Linear('ABB', 1)
+    )
+    polymer5 = stk.ConstructedMolecule(
+        building_blocks=[amine2, aldehyde2],
+        topology_graph=stk.polymer.Linear('BBA', 1)
+    )
+    assert polymer4.get_identity_key() == polymer5.get_identity_key()
+
+
+def test_placement_cache(amine2_alt3, aldehyde2):
+    def get_polymer(num_processes):
+        return stk.ConstructedMolecule(
+            building_blocks=[amine2_alt3, aldehyde2],
+            topology_graph=stk.polymer.Linear(
+                repeating_unit='AB',
+                num_repeating_units=4,
+                orientations=(0.5, 0.5),
+                random_seed=2,
+                num_processes=num_processes
+            )
+        )
+
+    # The parallel construction does not use cached placements.
+    polymer1 = get_polymer(2)
+    polymer2 = get_polymer(1)
+    assert np.allclose(
+        a=polymer1.get_position_matrix(),
+        b=polymer2.get_position_matrix(),
+        atol=1e-8
+    )
+    for bond1, bond2 in zip(polymer1.bonds, polymer2.bonds):
+        assert bond1.atom1.id == bond2.atom1.id
+        assert bond1.atom2.id == bond2.atom2.id
+
+    # Moving a building block invalidates its cached placements.
+    amine2_alt3.apply_rotation_about_axis(
+        angle=1,
+        axis=np.array([0, 0, 1]),
+        origin=np.array([0, 0, 0])
+    )
+    polymer3 = get_polymer(1)
+    polymer4 = get_polymer(2)
+    assert np.allclose(
+        a=polymer3.get_position_matrix(),
+        b=polymer4.get_position_matrix(),
+        atol=1e-8
+    )
@@ -167,3 +167,32 @@ def test_orientations(amine2_alt3, aldehyde2):
         m3.get_position_matrix(),
         m4.get_position_matrix()
     ))
+
+
+def test_symmetry(amine2, aldehyde2):
+    for orientations in (None, (0, 1), (0, 0, 1, 0, 1, 1)):
+        m1 = stk.ConstructedMolecule(
+            building_blocks=[amine2, aldehyde2],
+            topology_graph=stk.macrocycle.Macrocycle(
+                repeating_unit='AB',
+                num_repeating_units=3,
+                orientations=orientations
+            )
+        )
+        m2 = stk.ConstructedMolecule(
+            building_blocks=[amine2, aldehyde2],
+            topology_graph=stk.macrocycle.Macrocycle(
+                repeating_unit='AB',
+                num_repeating_units=3,
+                orientations=orientations,
+                use_symmetry=True
+            )
+        )
+        assert np.allclose(
+            a=m1.get_position_matrix(),
+            b=m2.get_position_matrix(),
+            atol=1e-8
+        )
+        for b1, b2 in zip(m1.bonds, m2.bonds):
+            assert b1.atom1.id == b2.atom1.id
+            assert b1.atom2.id == b2.atom2.id
@@ -51,6 +51,22 @@ def test_vertex(tmp_polymer, tmp_macrocycle):
         _test_cycle_placement(vertex, tmp_macrocycle, vertices, edges)
 
 
+def test_macrocycle_frame(tmp_macrocycle):
+    rotaxane = stk.rotaxane.NRotaxane('A', 2)
+    vertex = rotaxane.vertices[1]
+    frame1 = vertex._get_macrocycle_frame(tmp_macrocycle)
+    assert sorted(frame1.atom_ids) == sorted(_cycle_atoms(tmp_macrocycle))
+    frame2 = vertex._get_macrocycle_frame(tmp_macrocycle)
+    assert frame2 is frame1
+
+    # Moving the macrocycle updates the frame, but the ring is not
+    # perceived again.
+    tmp_macrocycle.apply_displacement([1, 2, 3])
+    frame3 = vertex._get_macrocycle_frame(tmp_macrocycle)
+    assert frame3.atom_ids is frame1.atom_ids
+    assert np.allclose(frame3.centroid, frame1.centroid+[1, 2, 3])
+
+
 def _test_construction(test_dir, filename, rotaxane_data):
     rotaxane = rotaxane_data.rotaxane
     num_expected_bbs = rotaxane_data.num_expected_bbs
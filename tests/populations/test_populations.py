@@ -4,6 +4,7 @@ import os
 from os.path import join
 import stk
 import itertools as it
+import numpy as np
 
 odir = 'population_tests_output'
 if not os.path.exists(odir):
@@ -285,6 +286,56 @@ def test_optimize(tmp_population):
         tmp_population.optimize(raiser)
 
 
+def test_optimize_threaded(tmp_population):
+    optimizer = stk.NullOptimizer(use_cache=True)
+    tmp_population.optimize(optimizer, num_threads=4)
+    assert len(optimizer._cache) == len(set(tmp_population))
+
+    raiser = stk.RaisingCalculator(optimizer, 1)
+    with pytest.raises(stk.RaisingCalculatorError):
+        tmp_population.optimize(raiser, num_threads=4)
+
+
+def test_optimize_batched(tmp_population):
+    optimizer = stk.NullOptimizer(use_cache=True)
+    tmp_population.optimize(optimizer, batch_size=2)
+    assert len(optimizer._cache) == len(set(tmp_population))
+
+    optimizer = stk.NullOptimizer(use_cache=True)
+    tmp_population.optimize(optimizer, batch_size=2, num_threads=2)
+    assert len(optimizer._cache) == len(set(tmp_population))
+
+    with pytest.raises(ValueError):
+        tmp_population.optimize(optimizer, batch_size=0)
+
+
+@pytest.mark.skipif(
+    not hasattr(os, 'sched_setaffinity')
+    or len(os.sched_getaffinity(0)) < 4,
+    reason='Requires setting the affinity of at least 4 cores.',
+)
+def test_set_fitness_values_threaded(tmp_population):
+    pop = stk.EAPopulation(*tmp_population)
+    fitness_calculator = stk.PropertyVector(
+        lambda m: frozenset(os.sched_getaffinity(0)),
+        num_cores=2,
+    )
+    pop.set_fitness_values_from_calculators(
+        fitness_calculator=fitness_calculator,
+        num_threads=8,
+        num_cores=4,
+        pin_cores=True,
+    )
+
+    # Each molecule used 2 cores and only 2 sets of cores were made.
+    core_sets = {
+        cores for cores, in pop.get_fitness_values().values()
+    }
+    assert all(len(cores) == 2 for cores in core_sets)
+    assert 0 < len(core_sets) <= 2
+    assert len(frozenset.union(*core_sets)) == 2*len(core_sets)
+
+
 def test_remove_duplicates_across_subpopulations(tmp_population):
     tmp_population.remove_duplicates(across_subpopulations=True)
     main = tmp_population.clone() + tmp_population.clone()
@@ -396,9 +447,48 @@ def test_set_fitness_values_from_calculators(tmp_population):
     for mol, fitness in pop.get_fitness_values().items():
         assert fitness == [12]
 
+    pop.set_fitness_values_from_calculators(
+        fitness_calculator=stk.PropertyVector(lambda m: 13),
+        num_threads=4,
+    )
+    fitness_values = pop.get_fitness_values()
+    assert set(fitness_values) == set(pop)
+    assert all(fitness == [13] for fitness in fitness_values.values())
+
     with pytest.raises(stk.RaisingCalculatorError):
         calc = stk.RaisingCalculator(
             calculator=fitness_calculator,
             fail_chance=1,
         )
         pop.set_fitness_values_from_calculators(calc)
+
+
+def test_remove_clashing_members(amine2, aldehyde2):
+    polymer1 = stk.ConstructedMolecule(
+        building_blocks=[amine2, aldehyde2],
+        topology_graph=stk.polymer.Linear('AB', 2)
+    )
+    polymer2 = polymer1.clone()
+    # Collapse the molecule onto a single point.
+    polymer2.set_position_matrix(
+        np.zeros((len(polymer2.atoms), 3))
+    )
+    pop = stk.Population(amine2, polymer1, stk.Population(polymer2))
+    pop.remove_clashing_members()
+    assert list(pop) == [amine2, polymer1]
+
+
+def test_iter_all(amine2, amine2_alt3, aldehyde2):
+    chains = stk.polymer.Linear.get_unique_chains(
+        building_blocks=[amine2, aldehyde2],
+        num_vertices=3
+    )
+    polymers = stk.Population.iter_all(
+        building_blocks=[[amine2, amine2_alt3], [aldehyde2]],
+        topology_graphs=chains,
+        num_processes=2,
+        chunk_size=3
+    )
+    keys = [polymer.get_identity_key() for polymer in polymers]
+    # 6 chains, each made with 2 different amines.
+    assert len(keys) == len(set(keys)) == 12
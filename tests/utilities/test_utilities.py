@@ -1,8 +1,16 @@
 import stk
+import os
+import gzip
+import pytest
 from os.path import join
 import numpy as np
 
 
+odir = 'utilities_tests_output'
+if not os.path.exists(odir):
+    os.mkdir(odir)
+
+
 def test_xtb_extractor():
     known_output_file = join('../data', 'xtb_energy.output')
 
@@ -85,3 +93,90 @@ def test_xtb_extractor():
     assert np.allclose(
         frequencies, known_, rtol=0, atol=1.e-8
     )
+
+
+def test_xtb_extractor_properties():
+    known_output_file = join('../data', 'xtb_energy.output')
+    xtbext = stk.XTBExtractor(output_file=known_output_file)
+
+    energy_ext = stk.XTBExtractor(
+        output_file=known_output_file,
+        properties=['total_energy'],
+    )
+    assert energy_ext.total_energy == xtbext.total_energy
+    assert not hasattr(energy_ext, 'frequencies')
+
+    properties = ['homo_lumo_occ', 'full_dipole_moment', 'frequencies']
+    partial_ext = stk.XTBExtractor(
+        output_file=known_output_file,
+        properties=properties,
+    )
+    for name in properties:
+        assert getattr(partial_ext, name) == getattr(xtbext, name)
+    assert not hasattr(partial_ext, 'total_energy')
+
+    with pytest.raises(ValueError):
+        stk.XTBExtractor(
+            output_file=known_output_file,
+            properties=['energy'],
+        )
+
+
+def test_xtb_extractor_last_values():
+    # Like the output of --ohess, where the energy of the starting
+    # geometry is printed before that of the optimized one.
+    output_file = join(odir, 'xtb_ohess.output')
+    with open(join('../data', 'xtb_energy.output'), 'r') as f:
+        known_output = f.read()
+    with open(output_file, 'w') as f:
+        f.write(
+            '          | TOTAL ENERGY              -70.000000000000 Eh'
+            '   |\n'
+        )
+        f.write(known_output)
+
+    energy_ext = stk.XTBExtractor(
+        output_file=output_file,
+        properties=['total_energy'],
+    )
+    assert np.isclose(
+        energy_ext.total_energy, -76.323188311664, rtol=0, atol=1.e-8
+    )
+
+
+def test_kabsch():
+    generator = np.random.RandomState(2)
+    coords1 = generator.normal(0, 1, (10, 3))
+    coords1 -= coords1.mean(axis=0)
+    rotation = stk.rotation_matrix_arbitrary_axis(1.2, [1, 2, 3])
+    coords2 = coords1 @ rotation.T
+
+    result = stk.kabsch(coords1, coords2)
+    assert np.allclose(result, rotation)
+    assert np.allclose(coords1 @ result.T, coords2)
+
+
+def test_mae_extractor_structures(tmp_amine2):
+    with open(join('..', 'data', 'molecule.mae'), 'r') as f:
+        header, block = f.read().split('f_m_ct')
+
+    # Make a multi-structure output, as written by a batched run.
+    block = block.replace(
+        ' s_m_title\n',
+        ' s_m_title\n r_mmod_Potential_Energy-MMFF94s\n',
+    )
+    content = header + ''.join(
+        'f_m_ct' + block.replace(' ***** \n', f' "{i}"\n {i+10.5}\n')
+        for i in (1, 0)
+    )
+    run_name = join(odir, 'mae_extractor')
+    with gzip.open(f'{run_name}-out.maegz', 'wt') as f:
+        f.write(content)
+
+    extractor = stk.MAEExtractor(run_name, n=0)
+    structures = extractor.extract_structures()
+    assert [title for title, _, _ in structures] == ['1', '0']
+    assert [energy for _, energy, _ in structures] == [11.5, 10.5]
+    for _, _, path in structures:
+        tmp_amine2.update_from_file(path)
+        assert len(tmp_amine2.atoms) == 15